@@ -1,6 +1,5 @@
 # backend/app/algorithm/chromosome_setup.py
 
-import random
 import numpy as np
 
 # 1. Definisi Fitur dan Urutannya dalam Kromosom
@@ -55,29 +54,77 @@ assert all(feature in FEATURE_DETAILS for feature in FEATURE_ORDER), \
 
 NUM_FEATURES = len(FEATURE_ORDER)
 
-def initialize_chromosome():
+# 3. Encoding Kromosom ke Matriks Numerik
+# Untuk evaluasi populasi secara tervektorisasi, setiap gen kategorikal dikodekan
+# sebagai indeks (int kecil) ke FEATURE_DETAILS[...]['categories'], sedangkan gen
+# numerik disimpan apa adanya. Nilai yang tidak dikenal dikodekan sebagai UNKNOWN_CODE.
+UNKNOWN_CODE = -1
+
+CATEGORY_CODES = {
+    feature_name: {category: code for code, category in enumerate(details['categories'])}
+    for feature_name, details in FEATURE_DETAILS.items()
+    if details['type'] == 'categorical'
+}
+
+assert all(len(codes) <= np.iinfo(np.int8).max for codes in CATEGORY_CODES.values()), \
+    "Jumlah kategori per fitur harus muat dalam int8."
+
+# Jika semua fitur di FEATURE_ORDER kategorikal, cukup int8 per gen.
+# Begitu ada fitur numerik, seluruh matriks memakai float64 (kode kategori tetap bilangan bulat).
+CHROMOSOME_DTYPE = np.int8 if all(
+    FEATURE_DETAILS[f]['type'] == 'categorical' for f in FEATURE_ORDER
+) else np.float64
+
+# Semua fungsi acak di modul ini menerima rng (numpy.random.Generator) milik pemanggil
+# (misal GA yang sedang berjalan). Tanpa rng, dibuat Generator baru untuk panggilan itu,
+# sehingga tidak ada state acak global yang dibagi antar run/thread.
+
+def initialize_chromosome(rng=None):
     """
     Menginisialisasi satu kromosom dengan nilai acak yang valid untuk setiap fitur.
-    Kromosom adalah list di mana setiap elemen sesuai dengan fitur di FEATURE_ORDER.
+    Kromosom adalah array NumPy (dtype CHROMOSOME_DTYPE) di mana setiap elemen sesuai
+    dengan fitur di FEATURE_ORDER: kode kategori untuk fitur kategorikal,
+    nilai asli untuk fitur numerik. Gunakan decode_chromosome untuk mendapatkan nama kategori.
     """
-    chromosome = []
-    for feature_name in FEATURE_ORDER:
+    rng = rng if rng is not None else np.random.default_rng()
+    chromosome = np.empty(NUM_FEATURES, dtype=CHROMOSOME_DTYPE)
+    for i, feature_name in enumerate(FEATURE_ORDER):
         details = FEATURE_DETAILS[feature_name]
         if details['type'] == 'numerical':
-            value = random.uniform(details['range'][0], details['range'][1])
-            chromosome.append(value)
+            chromosome[i] = rng.uniform(details['range'][0], details['range'][1])
         elif details['type'] == 'categorical':
-            value = random.choice(details['categories'])
-            chromosome.append(value)
+            chromosome[i] = rng.integers(len(details['categories']))
     return chromosome
 
-def user_input_to_chromosome(user_input_dict):
+def initialize_population(population_size, rng=None):
+    """
+    Menginisialisasi populasi acak berupa matriks (population_size, NUM_FEATURES).
+    Seluruh populasi dibangkitkan sekaligus dari rng (numpy.random.Generator).
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    draws = rng.random((population_size, NUM_FEATURES))
+    categorical_codes = np.floor(draws * GENE_NUM_CATEGORIES)
+    numerical_values = GENE_RANGE_MIN + draws * (GENE_RANGE_MAX - GENE_RANGE_MIN)
+    return np.where(GENE_IS_NUMERICAL, numerical_values, categorical_codes).astype(CHROMOSOME_DTYPE)
+
+def _random_feature_value(details, rng):
+    """Nilai acak yang valid (bentuk yang bisa dibaca) untuk satu fitur dari rng."""
+    if details['type'] == 'numerical':
+        return float(rng.uniform(details['range'][0], details['range'][1]))
+    return details['categories'][rng.integers(len(details['categories']))]
+
+def user_input_to_chromosome(user_input_dict, rng=None):
     """
     Mengonversi dictionary input dari pengguna menjadi format kromosom (list).
+    Nilainya tetap dalam bentuk yang bisa dibaca (nama kategori); gunakan
+    encode_chromosome jika perlu bentuk terkode untuk GA.
     Input pengguna diharapkan berupa dictionary {'NamaFitur': nilai, ...}.
     Nilai numerik akan diambil apa adanya (setelah divalidasi).
     Nilai kategorikal akan divalidasi terhadap kategori yang ada.
+    Fitur yang hilang/tidak valid diisi acak dari rng (numpy.random.Generator) jika
+    diberikan, sehingga hasilnya bisa direproduksi dengan seed yang sama.
     """
+    rng = rng if rng is not None else np.random.default_rng()
     chromosome = []
     missing_features = []
     invalid_values = {}
@@ -91,10 +138,7 @@ def user_input_to_chromosome(user_input_dict):
             # Opsi: isi dengan nilai acak jika pengguna tidak menyediakan? Atau error?
             # Untuk saat ini, kita tandai sebagai hilang dan bisa di-handle nanti.
             # Atau, kita bisa langsung generate acak jika memang GA akan "mengisi" kekosongan
-            if details['type'] == 'numerical':
-                chromosome.append(random.uniform(details['range'][0], details['range'][1]))
-            else: # categorical
-                chromosome.append(random.choice(details['categories']))
+            chromosome.append(_random_feature_value(details, rng))
             continue
 
         if details['type'] == 'numerical':
@@ -107,12 +151,12 @@ def user_input_to_chromosome(user_input_dict):
                 chromosome.append(val)
             except ValueError:
                 invalid_values[feature_name] = f"Nilai '{user_value}' bukan angka yang valid."
-                chromosome.append(random.uniform(details['range'][0], details['range'][1])) # Fallback
+                chromosome.append(_random_feature_value(details, rng)) # Fallback
         
         elif details['type'] == 'categorical':
             if user_value not in details['categories']:
                 invalid_values[feature_name] = f"Kategori '{user_value}' tidak valid. Pilihan: {details['categories']}"
-                chromosome.append(random.choice(details['categories'])) # Fallback
+                chromosome.append(_random_feature_value(details, rng)) # Fallback
             else:
                 chromosome.append(user_value)
     
@@ -124,14 +168,69 @@ def user_input_to_chromosome(user_input_dict):
             
     return chromosome
 
+# Metadata per gen (urutan FEATURE_ORDER) untuk operator tervektorisasi.
+# Untuk fitur kategorikal rentang diisi 0; untuk fitur numerik jumlah kategori diisi 0.
+GENE_IS_NUMERICAL = np.array([FEATURE_DETAILS[f]['type'] == 'numerical' for f in FEATURE_ORDER])
+GENE_NUM_CATEGORIES = np.array([len(FEATURE_DETAILS[f].get('categories', ())) for f in FEATURE_ORDER])
+GENE_RANGE_MIN = np.array([FEATURE_DETAILS[f].get('range', (0, 0))[0] for f in FEATURE_ORDER], dtype=np.float64)
+GENE_RANGE_MAX = np.array([FEATURE_DETAILS[f].get('range', (0, 0))[1] for f in FEATURE_ORDER], dtype=np.float64)
+
+def encode_gene(feature_name, value):
+    """
+    Mengodekan satu nilai gen: indeks kategori untuk fitur kategorikal,
+    float untuk fitur numerik. Nilai yang tidak valid menjadi UNKNOWN_CODE / NaN.
+    """
+    details = FEATURE_DETAILS[feature_name]
+    if details['type'] == 'categorical':
+        return CATEGORY_CODES[feature_name].get(value, UNKNOWN_CODE)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+def decode_gene(feature_name, code):
+    """Kebalikan encode_gene: kode kategori -> nama kategori, nilai numerik -> float."""
+    details = FEATURE_DETAILS[feature_name]
+    if details['type'] == 'categorical':
+        code = int(code)
+        if 0 <= code < len(details['categories']):
+            return details['categories'][code]
+        return None
+    return float(code)
+
+def encode_chromosome(chromosome_values):
+    """Mengonversi kromosom berupa list nilai (nama kategori / angka) menjadi array terkode."""
+    encoded = np.empty(NUM_FEATURES, dtype=CHROMOSOME_DTYPE)
+    for i, feature_name in enumerate(FEATURE_ORDER):
+        encoded[i] = encode_gene(feature_name, chromosome_values[i])
+    return encoded
+
+def decode_chromosome(chromosome):
+    """
+    Mengonversi kromosom terkode kembali menjadi list nilai yang bisa dibaca
+    (nama kategori untuk fitur kategorikal). Dipakai di batas API.
+    """
+    return [decode_gene(feature_name, chromosome[i]) for i, feature_name in enumerate(FEATURE_ORDER)]
+
+def encode_population(population):
+    """
+    Mengonversi populasi (list of kromosom berupa list nilai) menjadi matriks
+    NumPy berukuran (jumlah_individu, NUM_FEATURES) dengan dtype CHROMOSOME_DTYPE.
+    """
+    encoded = np.empty((len(population), NUM_FEATURES), dtype=CHROMOSOME_DTYPE)
+    for row, chromosome in enumerate(population):
+        encoded[row] = encode_chromosome(chromosome)
+    return encoded
+
 # --- Contoh Penggunaan (bisa dihapus atau dikomentari di file produksi) ---
 if __name__ == '__main__':
     print(f"Total fitur dalam kromosom: {NUM_FEATURES}")
     
     print("\n--- Contoh Kromosom Acak ---")
     random_chromo = initialize_chromosome()
-    for i, feature_name in enumerate(FEATURE_ORDER):
-        print(f"{feature_name}: {random_chromo[i]}")
+    print(f"Kromosom terkode: {random_chromo} ({random_chromo.nbytes} byte)")
+    for feature_name, value in zip(FEATURE_ORDER, decode_chromosome(random_chromo)):
+        print(f"{feature_name}: {value}")
 
     print("\n--- Contoh Konversi Input Pengguna ---")
     # Pengguna hanya mengisi beberapa, sisanya akan diisi acak dengan peringatan
@@ -0,0 +1,170 @@
+# backend/app/algorithm/classifier.py
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from .chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS
+
+# Komponen fitness berbasis classifier: peluang sebuah kromosom diklasifikasikan sebagai
+# target_genus_specie oleh model yang dilatih pada dataset (fitur-fitur FEATURE_ORDER).
+# Model (SubsetTransformer dari SubsetEncoder + LogisticRegression) di-fit sekali per
+# fingerprint dataset, disimpan dengan joblib, dan dipakai ulang setelah restart.
+# Satu populasi selalu dinilai dengan satu panggilan predict_proba.
+# scikit-learn/joblib baru diimpor saat model pertama kali di-fit atau dimuat, sehingga
+# mengimpor modul ini (dan app.api) tidak menanggung biaya impor scikit-learn.
+
+MODEL_FORMAT_VERSION = 3 # 2: preprocessor berupa SubsetTransformer; 3: feature_columns berupa nama fitur
+
+
+def _available_features(dataset_df, feature_names=FEATURE_ORDER):
+    """
+    Fitur feature_names yang ada di dataset. Nama kolom sudah dinormalisasi ke kunci
+    FEATURE_DETAILS saat dataset dimuat (normalize_feature_columns).
+    """
+    return [feature_name for feature_name in feature_names if feature_name in dataset_df.columns]
+
+
+class SpeciesClassifier:
+    """
+    Pipeline (SubsetTransformer + LogisticRegression) yang sudah di-fit untuk satu dataset.
+
+    Args:
+        pipeline (Pipeline): Pipeline sklearn yang sudah di-fit.
+        feature_columns (list): Nama fitur FEATURE_ORDER yang dipakai model.
+        fingerprint (str): dataset_fingerprint dataset latih.
+    """
+
+    def __init__(self, pipeline, feature_columns, fingerprint):
+        self.pipeline = pipeline
+        self.feature_columns = feature_columns
+        self.fingerprint = fingerprint
+        self.class_index = {label: i for i, label in enumerate(pipeline.classes_)}
+        self._category_arrays = {
+            feature_name: np.array(FEATURE_DETAILS[feature_name]['categories'] + [None], dtype=object)
+            for feature_name in feature_columns
+            if FEATURE_DETAILS[feature_name]['type'] == 'categorical'
+        }
+
+    @classmethod
+    def fit(cls, dataset_df, label_col, fingerprint):
+        """
+        Melatih LogisticRegression pada fitur FEATURE_ORDER. Encoding diambil dari SubsetEncoder
+        dataset ini (semua fitur FEATURE_DETAILS di-encode sekali per fingerprint), dan data baru
+        di-encode dengan SubsetTransformer untuk subset yang sama.
+        """
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import Pipeline
+        from ..preprocessing_data.encoders import get_subset_encoder
+
+        feature_columns = _available_features(dataset_df)
+        if not feature_columns:
+            raise ValueError("Tidak ada fitur FEATURE_ORDER di dataset untuk melatih classifier.")
+        encoded_columns = _available_features(dataset_df, FEATURE_DETAILS)
+        numerical_cols = [f for f in encoded_columns if FEATURE_DETAILS[f]['type'] == 'numerical']
+        categorical_cols = [f for f in encoded_columns if FEATURE_DETAILS[f]['type'] == 'categorical']
+
+        training_df = dataset_df.loc[dataset_df[label_col].notna(), encoded_columns + [label_col]]
+        encoder = get_subset_encoder(training_df, numerical_cols, categorical_cols, label_col, fingerprint)
+        X_processed, _ = encoder.transform_subset(feature_columns)
+        model = LogisticRegression(max_iter=1000)
+        model.fit(X_processed, np.asarray(encoder.y).astype(str))
+        return cls(Pipeline([('preprocess', encoder.subset_transformer(feature_columns)), ('model', model)]),
+                   feature_columns, fingerprint)
+
+    def _population_frame(self, population_codes):
+        """Matriks populasi terkode -> DataFrame dengan nama kolom dan nilai seperti dataset latih."""
+        columns = {}
+        for feature_name in self.feature_columns:
+            genes = population_codes[:, FEATURE_ORDER.index(feature_name)]
+            if feature_name in self._category_arrays:
+                categories = self._category_arrays[feature_name]
+                codes = genes.astype(np.int64)
+                codes[(codes < 0) | (codes >= len(categories) - 1)] = len(categories) - 1 # Tidak dikenal -> None
+                columns[feature_name] = categories[codes]
+            else:
+                columns[feature_name] = genes.astype(np.float64)
+        return pd.DataFrame(columns)
+
+    def predict_target_proba(self, population_codes, target_genus_specie):
+        """Peluang setiap individu diklasifikasikan sebagai target (satu panggilan predict_proba)."""
+        population_codes = np.asarray(population_codes)
+        class_position = self.class_index.get(target_genus_specie)
+        if class_position is None or len(population_codes) == 0:
+            return np.zeros(len(population_codes))
+        probabilities = self.pipeline.predict_proba(self._population_frame(population_codes))
+        return probabilities[:, class_position]
+
+
+def _model_path(cache_dir, fingerprint):
+    return os.path.join(cache_dir, f'species_classifier_{fingerprint}.joblib')
+
+
+def _load_persisted(path, fingerprint):
+    """Memuat model dari disk; None jika tidak ada atau dibuat dengan versi berbeda."""
+    if not os.path.exists(path):
+        return None
+    import joblib
+    import sklearn
+    try:
+        payload = joblib.load(path)
+    except Exception:
+        return None # File rusak/tidak kompatibel, model di-fit ulang
+    if payload.get('format_version') != MODEL_FORMAT_VERSION or payload.get('sklearn_version') != sklearn.__version__:
+        return None
+    return SpeciesClassifier(payload['pipeline'], payload['feature_columns'], fingerprint)
+
+
+def _persist(classifier, path):
+    """Menyimpan model secara atomik (tulis ke file sementara lalu rename)."""
+    import joblib
+    import sklearn
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', suffix='.joblib', dir=os.path.dirname(path))
+    os.close(fd)
+    try:
+        joblib.dump({
+            'format_version': MODEL_FORMAT_VERSION,
+            'sklearn_version': sklearn.__version__,
+            'pipeline': classifier.pipeline,
+            'feature_columns': classifier.feature_columns,
+        }, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# Model per fingerprint di memori; lock mencegah fit ganda saat banyak request bersamaan.
+_CLASSIFIER_CACHE = OrderedDict()
+_CLASSIFIER_CACHE_MAXSIZE = 4
+_CLASSIFIER_LOCK = threading.Lock()
+
+def get_species_classifier(dataset_df, label_col, fingerprint, cache_dir=None):
+    """
+    Mengambil SpeciesClassifier untuk dataset dengan fingerprint ini: dari memori, dari
+    file joblib di cache_dir, atau dengan fit baru (lalu disimpan ke cache_dir jika diberikan).
+    """
+    with _CLASSIFIER_LOCK:
+        if fingerprint in _CLASSIFIER_CACHE:
+            _CLASSIFIER_CACHE.move_to_end(fingerprint)
+            return _CLASSIFIER_CACHE[fingerprint]
+
+        classifier = None
+        if cache_dir is not None:
+            classifier = _load_persisted(_model_path(cache_dir, fingerprint), fingerprint)
+        if classifier is None:
+            classifier = SpeciesClassifier.fit(dataset_df, label_col, fingerprint)
+            if cache_dir is not None:
+                try:
+                    _persist(classifier, _model_path(cache_dir, fingerprint))
+                except OSError as e: # Misal folder read-only; model tetap dipakai dari memori
+                    print(f"Peringatan: classifier tidak dapat disimpan ke {cache_dir} ({e}).")
+
+        _CLASSIFIER_CACHE[fingerprint] = classifier
+        while len(_CLASSIFIER_CACHE) > _CLASSIFIER_CACHE_MAXSIZE:
+            _CLASSIFIER_CACHE.popitem(last=False)
+        return classifier
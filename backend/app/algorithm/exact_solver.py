@@ -0,0 +1,121 @@
+# backend/app/algorithm/exact_solver.py
+
+import numpy as np
+from .chromosome_setup import (
+    FEATURE_ORDER, FEATURE_DETAILS, NUM_FEATURES, CHROMOSOME_DTYPE, GENE_IS_NUMERICAL, GENE_NUM_CATEGORIES
+)
+from .fitness import _gene_similarity, calculate_population_fitness
+
+# Solver eksak sebagai pengganti GA untuk ruang pencarian kecil atau fitness yang separable.
+# Fitness (calculate_population_fitness) adalah jumlah berbobot suku per fitur:
+#   bobot_target/jumlah_fitur_target * sim(gen, target) + bobot_user/jumlah_fitur_user * sim(gen, user)
+# sehingga optimum global bisa dicari per fitur secara terpisah:
+# - fitur kategorikal: semua kode kategori dicoba
+# - fitur numerik: sim = 1 - |x - ref| linear sepotong-sepotong, maksimum ada di salah satu
+#   nilai referensi atau ujung rentang
+# Jika fitness tidak separable, ruang kategorikal kecil masih bisa dienumerasi penuh.
+
+SOLVER_GA = 'ga'
+SOLVER_EXACT = 'exact'
+SOLVER_AUTO = 'auto'
+
+STOP_EXACT_SOLUTION = 'exact_solution' # stop_reason untuk hasil solver eksak
+
+METHOD_SEPARABLE = 'separable'
+METHOD_ENUMERATION = 'enumeration'
+
+MAX_ENUMERATION_SIZE = 200_000 # Batas jumlah kombinasi untuk enumerasi penuh
+ENUMERATION_CHUNK_SIZE = 65_536
+
+
+def search_space_size():
+    """Jumlah kombinasi kromosom, atau None jika ada fitur numerik (ruang kontinu)."""
+    if GENE_IS_NUMERICAL.any():
+        return None
+    return int(np.prod(GENE_NUM_CATEGORIES, dtype=np.int64))
+
+
+def exact_method_for(fitness_context, max_enumeration_size=MAX_ENUMERATION_SIZE):
+    """
+    Metode eksak yang bisa dipakai untuk konteks ini ('separable' / 'enumeration'),
+    atau None jika hanya GA yang bisa dipakai.
+    """
+    if fitness_context.separable:
+        return METHOD_SEPARABLE
+    space_size = search_space_size()
+    if space_size is not None and space_size <= max_enumeration_size:
+        return METHOD_ENUMERATION
+    return None
+
+
+def _feature_candidates(feature_index, fitness_context):
+    """Kandidat nilai gen (terkode) yang pasti memuat optimum untuk satu fitur."""
+    feature_name = FEATURE_ORDER[feature_index]
+    if not GENE_IS_NUMERICAL[feature_index]:
+        return np.arange(GENE_NUM_CATEGORIES[feature_index])
+
+    min_val, max_val = FEATURE_DETAILS[feature_name]['range']
+    candidates = [min_val, max_val]
+    for reference in (fitness_context.target_refs[feature_index], fitness_context.user_refs[feature_index]):
+        if reference is not None and max_val != min_val:
+            candidates.append(min_val + reference * (max_val - min_val)) # Referensi ternormalisasi -> nilai asli
+    return np.clip(np.array(candidates, dtype=np.float64), min_val, max_val)
+
+
+def _solve_separable(fitness_context):
+    """Memilih gen terbaik per fitur; seri dipecahkan dengan kandidat pertama (kode terkecil)."""
+    chromosome = np.zeros(NUM_FEATURES, dtype=CHROMOSOME_DTYPE)
+    if not fitness_context.target_profile:
+        return chromosome # Fitness selalu 0, semua kromosom sama baiknya
+
+    target_coef = fitness_context.weight_target / max(fitness_context.common_features_target, 1)
+    user_coef = fitness_context.weight_user / max(fitness_context.common_features_user, 1)
+    for i, feature_name in enumerate(FEATURE_ORDER):
+        candidates = _feature_candidates(i, fitness_context)
+        scores = np.zeros(len(candidates))
+        if fitness_context.target_refs[i] is not None:
+            scores += target_coef * _gene_similarity(candidates, feature_name, fitness_context.target_refs[i], fitness_context)
+        if fitness_context.user_refs[i] is not None:
+            scores += user_coef * _gene_similarity(candidates, feature_name, fitness_context.user_refs[i], fitness_context)
+        chromosome[i] = candidates[np.argmax(scores)]
+    return chromosome
+
+
+def _solve_enumeration(fitness_context):
+    """Mengevaluasi seluruh ruang kategorikal per chunk dan mengambil kromosom terbaik."""
+    space_size = search_space_size()
+    best_chromosome, best_fitness = None, -np.inf
+    for start in range(0, space_size, ENUMERATION_CHUNK_SIZE):
+        flat_indices = np.arange(start, min(start + ENUMERATION_CHUNK_SIZE, space_size))
+        population = np.stack(np.unravel_index(flat_indices, GENE_NUM_CATEGORIES), axis=1).astype(CHROMOSOME_DTYPE)
+        scores = calculate_population_fitness(population, fitness_context)
+        best_in_chunk = int(np.argmax(scores))
+        if scores[best_in_chunk] > best_fitness:
+            best_fitness = scores[best_in_chunk]
+            best_chromosome = population[best_in_chunk].copy()
+    return best_chromosome
+
+
+def solve_exact(fitness_context, method=None):
+    """
+    Mencari kromosom dengan fitness maksimum secara eksak.
+
+    Args:
+        fitness_context (FitnessContext): Konteks fitness run ini.
+        method (str, optional): 'separable' atau 'enumeration'; default dipilih
+                                dengan exact_method_for.
+
+    Returns:
+        tuple: (kromosom_terkode, fitness, method). Fitness dihitung ulang dengan
+               calculate_population_fitness sehingga sebanding dengan hasil GA.
+    """
+    method = method or exact_method_for(fitness_context)
+    if method == METHOD_SEPARABLE:
+        best_chromosome = _solve_separable(fitness_context)
+    elif method == METHOD_ENUMERATION:
+        best_chromosome = _solve_enumeration(fitness_context)
+    else:
+        raise ValueError("Solver eksak tidak tersedia: fitness tidak separable dan ruang pencarian terlalu besar.")
+
+    best_fitness = float(calculate_population_fitness(best_chromosome[None, :], fitness_context)[0])
+    return best_chromosome, best_fitness, method
@@ -2,11 +2,8 @@
 
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler, LabelEncoder
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.metrics import jaccard_score # Atau metrik jarak lain
-from .chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS 
-import random
+from .chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS, encode_gene, encode_population
+from .profiles import get_profile_index
 
 # --- Helper Functions ---
 
@@ -76,20 +73,9 @@ def calculate_feature_similarity(chromosome_dict, target_profile_dict, user_inpu
     # Normalisasi/Scaling diperlukan sebelum menghitung jarak untuk fitur numerik
     # Kita akan melakukan perbandingan fitur per fitur
     
-    num_matching_features = 0
+    # Untuk evaluasi di GA, gunakan calculate_population_fitness dengan FitnessContext:
+    # rentang dan nilai referensi yang sudah dinormalisasi dihitung sekali per run.
     total_similarity_score_target = 0.0
-    
-    # --- Skala untuk normalisasi fitur numerik (berdasarkan rentang di FEATURE_DETAILS) ---
-    # Ini bisa di-precompute
-    scalers = {}
-    for feature_name, details in FEATURE_DETAILS.items():
-        if details['type'] == 'numerical':
-            scalers[feature_name] = MinMaxScaler(feature_range=(0, 1))
-            # Fit scaler pada rentang yang mungkin (min, max dari FEATURE_DETAILS)
-            # Ini hanya contoh sederhana, idealnya scaling disesuaikan dengan distribusi data
-            # Untuk MinMax, cukup gunakan rentang yang diketahui.
-            # scalers[feature_name].fit(np.array(details['range']).reshape(-1, 1))
-
 
     # 1. Kemiripan dengan Profil Target
     common_features_target = 0
@@ -178,48 +164,205 @@ def calculate_feature_similarity(chromosome_dict, target_profile_dict, user_inpu
 # --- Fungsi Fitness Utama untuk GA ---
 # Fungsi ini akan dipanggil oleh ga_core.py
 
-# Global cache untuk profil target agar tidak dihitung ulang setiap evaluasi fitness
-TARGET_PROFILES_CACHE = {}
+def get_cached_target_profile(target_genus_specie, dataset_df,
+                              numerical_cols_original, categorical_cols_original,
+                              label_col_in_dataset='Genus_&_Specie'):
+    """
+    Mengambil profil target dari SpeciesProfileIndex dataset ini. Index di-cache per objek
+    DataFrame (lihat profiles.get_profile_index), jadi dataset tidak di-hash ulang per panggilan.
+    Mengembalikan None jika target tidak ditemukan.
+    """
+    profile_index = get_profile_index(
+        dataset_df, numerical_cols_original, categorical_cols_original, label_col_in_dataset
+    )
+    return profile_index.get(target_genus_specie)
+
+
+def _normalize_numerical(values, min_val, max_val):
+    """Normalisasi min-max, mengikuti logika di calculate_feature_similarity."""
+    if max_val == min_val:
+        return np.where(values == min_val, 0.5, 0.0)
+    return (values - min_val) / (max_val - min_val)
+
+
+class FitnessContext:
+    """
+    Semua yang dibutuhkan fungsi fitness, dihitung sekali per run GA:
+    profil target dan input pengguna yang sudah dinormalisasi/dikodekan,
+    rentang setiap fitur numerik, serta bobot komponen fitness.
+    Jika bobot 'classifier' > 0 dan classifier (SpeciesClassifier) diberikan, skor
+    kemiripan dicampur dengan peluang kelas target dari classifier:
+        (1 - bobot_classifier) * kemiripan + bobot_classifier * peluang_target
+
+    Untuk setiap gen di FEATURE_ORDER disimpan referensi target dan pengguna:
+    - fitur numerik: nilai yang sudah dinormalisasi ke [0, 1]
+    - fitur kategorikal: kode kategori (UNKNOWN_CODE jika tidak dikenal)
+    - None jika nilai referensi tidak tersedia (fitur dilewati, sama seperti
+      di calculate_feature_similarity).
+    """
+
+    DEFAULT_WEIGHTS = {'target': 0.7, 'user': 0.3, 'classifier': 0.0}
+
+    # True jika fitness adalah jumlah suku per fitur (tanpa interaksi antar fitur),
+    # sehingga exact_solver bisa mengoptimalkan setiap fitur secara terpisah.
+    separable = True
+
+    def __init__(self, target_profile, user_input_dict=None, fitness_weights=None,
+                 classifier=None, target_genus_specie=None):
+        self.target_profile = target_profile or {}
+        self.user_input_dict = user_input_dict or {}
+
+        weights = dict(self.DEFAULT_WEIGHTS)
+        weights.update(fitness_weights or {})
+        self.weight_target = weights['target']
+        self.weight_user = weights['user']
+        self.weight_classifier = weights['classifier']
+        if not 0.0 <= self.weight_classifier <= 1.0:
+            raise ValueError(f"Bobot classifier harus di antara 0 dan 1, bukan {self.weight_classifier}.")
+
+        self.classifier = classifier if self.weight_classifier > 0 else None
+        self.target_genus_specie = target_genus_specie
+        if self.weight_classifier > 0 and classifier is None:
+            raise ValueError("Bobot classifier > 0 membutuhkan classifier (SpeciesClassifier).")
+        if self.classifier is not None:
+            self.separable = False # Model klasifikasi memperhitungkan interaksi antar fitur
+
+        self.feature_ranges = {
+            feature_name: FEATURE_DETAILS[feature_name]['range']
+            for feature_name in FEATURE_ORDER
+            if FEATURE_DETAILS[feature_name]['type'] == 'numerical'
+        }
+
+        self.target_refs = []
+        self.user_refs = []
+        for feature_name in FEATURE_ORDER:
+            target_val = self.target_profile.get(feature_name)
+            user_val = self.user_input_dict.get(feature_name)
+            self.target_refs.append(self._reference(feature_name, target_val))
+            self.user_refs.append(self._reference(feature_name, user_val, clamp=True))
+
+        self.common_features_target = sum(ref is not None for ref in self.target_refs)
+        self.common_features_user = sum(ref is not None for ref in self.user_refs)
+
+    def _reference(self, feature_name, value, clamp=False):
+        if value is None:
+            return None
+        if feature_name not in self.feature_ranges:
+            return encode_gene(feature_name, value)
+
+        min_val, max_val = self.feature_ranges[feature_name]
+        if clamp and max_val != min_val:
+            # Nilai pengguna mungkin di luar rentang FEATURE_DETAILS
+            value = max(min_val, min(float(value), max_val))
+        return _normalize_numerical(np.float64(value), min_val, max_val)
+
+    @classmethod
+    def build(cls, target_genus_specie, dataset_df, user_input_dict,
+              numerical_cols_original, categorical_cols_original,
+              label_col_in_dataset='Genus_&_Specie', fitness_weights=None,
+              profile_index=None, classifier=None):
+        """
+        Membangun konteks fitness untuk satu run GA. Profil target diambil dari
+        profile_index (SpeciesProfileIndex) jika diberikan, atau dari cache index per dataset.
+        classifier (SpeciesClassifier) hanya dipakai jika bobot 'classifier' > 0.
+        """
+        if profile_index is not None:
+            target_profile = profile_index.get(target_genus_specie)
+        else:
+            target_profile = get_cached_target_profile(
+                target_genus_specie, dataset_df,
+                numerical_cols_original, categorical_cols_original, label_col_in_dataset
+            )
+        return cls(target_profile, user_input_dict, fitness_weights,
+                   classifier=classifier, target_genus_specie=target_genus_specie)
+
+
+def _gene_similarity(genes, feature_name, reference, fitness_context):
+    """Kemiripan satu kolom gen (seluruh populasi) terhadap satu nilai referensi di konteks."""
+    if feature_name in fitness_context.feature_ranges:
+        min_val, max_val = fitness_context.feature_ranges[feature_name]
+        norm_genes = _normalize_numerical(genes.astype(np.float64), min_val, max_val)
+        return 1 - np.abs(norm_genes - reference)
+
+    if reference < 0: # Kategori referensi tidak dikenal, tidak akan pernah sama
+        return np.zeros(len(genes))
+    return (genes == reference).astype(np.float64)
+
+
+def calculate_population_fitness(population_codes, fitness_context):
+    """
+    Versi tervektorisasi dari calculate_feature_similarity untuk seluruh populasi.
+
+    Args:
+        population_codes (np.ndarray): Matriks (jumlah_individu, NUM_FEATURES) hasil
+                                       chromosome_setup.encode_population.
+        fitness_context (FitnessContext): Konteks fitness run ini.
+
+    Returns:
+        np.ndarray: Skor fitness setiap individu, identik dengan hasil
+                    calculate_feature_similarity untuk individu yang sama
+                    (ditambah komponen classifier jika aktif).
+    """
+    population_codes = np.asarray(population_codes)
+    num_individuals = population_codes.shape[0]
+    if not fitness_context.target_profile:
+        return np.zeros(num_individuals)
+
+    # Penjumlahan dilakukan fitur demi fitur dengan urutan FEATURE_ORDER
+    # agar hasil floating point sama persis dengan versi per-kromosom.
+    total_similarity_target = np.zeros(num_individuals)
+    total_similarity_user = np.zeros(num_individuals)
+
+    for i, feature_name in enumerate(FEATURE_ORDER):
+        genes = population_codes[:, i]
+        target_ref = fitness_context.target_refs[i]
+        user_ref = fitness_context.user_refs[i]
+
+        if target_ref is not None:
+            total_similarity_target += _gene_similarity(genes, feature_name, target_ref, fitness_context)
+        if user_ref is not None:
+            total_similarity_user += _gene_similarity(genes, feature_name, user_ref, fitness_context)
+
+    if fitness_context.common_features_target > 0:
+        avg_similarity_target = total_similarity_target / fitness_context.common_features_target
+    else:
+        avg_similarity_target = np.zeros(num_individuals)
+
+    if fitness_context.common_features_user > 0:
+        avg_similarity_user = total_similarity_user / fitness_context.common_features_user
+        similarity = (fitness_context.weight_target * avg_similarity_target) + \
+                     (fitness_context.weight_user * avg_similarity_user)
+    else:
+        similarity = avg_similarity_target
+
+    if fitness_context.classifier is None:
+        return similarity
+    # Satu panggilan predict_proba untuk seluruh populasi
+    target_proba = fitness_context.classifier.predict_target_proba(
+        population_codes, fitness_context.target_genus_specie
+    )
+    weight = fitness_context.weight_classifier
+    return (1 - weight) * similarity + weight * target_proba
+
 
 def calculate_combined_fitness(chromosome_list, # Ini adalah list nilai dari GA
-                               target_genus_specie, # String, misal "Homo sapiens"
-                               dataset_df, # DataFrame Evolution_DataSets.csv
-                               user_input_dict, # Dict input dari pengguna (sudah diproses oleh chromosome_setup.user_input_to_chromosome)
-                               numerical_cols_original, # Daftar nama kolom numerik asli
-                               categorical_cols_original, # Daftar nama kolom kategorikal asli
-                               label_col_in_dataset='Genus_&_Specie',
-                               fitness_weights=None): # Bobot untuk berbagai komponen fitness
+                               fitness_context): # FitnessContext yang dibangun sekali per run
     """
     Fungsi fitness utama yang dipanggil oleh GA.
     Menggabungkan berbagai aspek untuk menilai seberapa "baik" sebuah kromosom.
+    chromosome_list berisi nilai yang bisa dibaca (nama kategori, lihat decode_chromosome),
+    bukan kode gen; untuk populasi terkode pakai calculate_population_fitness langsung.
     """
-    
-    # 1. Konversi chromosome_list (dari GA) ke dictionary agar mudah diakses
-    chromosome_dict = {feature: chromosome_list[i] for i, feature in enumerate(FEATURE_ORDER)}
-
-    # 2. Dapatkan Profil Fitur Target dari dataset (atau dari cache)
-    if target_genus_specie not in TARGET_PROFILES_CACHE:
-        profile = get_target_profile(
-            target_genus_specie, dataset_df,
-            numerical_cols_original, categorical_cols_original, label_col_in_dataset
-        )
-        if profile is None: # Target tidak ditemukan atau profil tidak bisa dibuat
-            return 0.0 # Fitness sangat rendah
-        TARGET_PROFILES_CACHE[target_genus_specie] = profile
-    
-    target_profile = TARGET_PROFILES_CACHE[target_genus_specie]
+    # Semua persiapan (profil target, normalisasi input pengguna, bobot) sudah ada di konteks.
+    fitness_score = calculate_population_fitness(encode_population([chromosome_list]), fitness_context)[0]
 
-    # 3. Hitung Skor Kemiripan
-    # user_input_dict di sini adalah parameter yang diberikan pengguna di awal,
-    # yang mungkin sudah dikonversi ke format yang sama dengan kromosom oleh chromosome_setup.
-    fitness_score = calculate_feature_similarity(chromosome_dict, target_profile, user_input_dict)
-    
+    # Komponen model klasifikasi (peluang individu diklasifikasikan sebagai target_genus_specie)
+    # sudah termasuk di calculate_population_fitness jika bobot 'classifier' > 0.
     # Di sini Anda bisa menambahkan komponen fitness lain jika diperlukan:
-    # - Model klasifikasi (probabilitas individu GA diklasifikasikan sebagai target_genus_specie)
     # - Penalti untuk nilai fitur yang tidak realistis (jika mutasi menghasilkan sesuatu di luar domain)
     # - Reward untuk "jalur evolusi" yang masuk akal (lebih lanjut)
 
-    return fitness_score
+    return float(fitness_score)
 
 # --- Contoh Penggunaan (untuk testing) ---
 if __name__ == '__main__':
@@ -243,13 +386,14 @@ if __name__ == '__main__':
         # ... tambahkan fitur lain dari FEATURE_ORDER ...
     }
     # Untuk testing, pastikan semua fitur di FEATURE_ORDER ada di data_dict_dummy
+    dummy_rng = np.random.default_rng()
     for f_name in FEATURE_ORDER:
         if f_name not in data_dict_dummy:
             details = FEATURE_DETAILS[f_name]
             if details['type'] == 'numerical':
-                data_dict_dummy[f_name] = [random.uniform(details['range'][0], details['range'][1]) for _ in range(6)]
+                data_dict_dummy[f_name] = list(dummy_rng.uniform(details['range'][0], details['range'][1], size=6))
             else:
-                data_dict_dummy[f_name] = [random.choice(details['categories']) for _ in range(6)]
+                data_dict_dummy[f_name] = list(dummy_rng.choice(details['categories'], size=6))
 
     dummy_evolution_df = pd.DataFrame(data_dict_dummy)
     print("--- Dummy Evolution Dataset ---")
@@ -261,9 +405,12 @@ if __name__ == '__main__':
 
     # C. Buat dummy chromosome_list (output dari GA) dan user_input_dict
     # Ini harusnya berasal dari chromosome_setup.initialize_chromosome() atau user_input_to_chromosome()
-    from chromosome_setup import initialize_chromosome, user_input_to_chromosome 
-    
-    test_chromosome_list = initialize_chromosome() # Individu GA yang akan dievaluasi
+    # Jalankan sebagai modul agar import relatif berfungsi: python -m app.algorithm.fitness
+    from .chromosome_setup import initialize_chromosome, user_input_to_chromosome, decode_chromosome
+
+    # initialize_chromosome mengembalikan kode gen; calculate_combined_fitness menerima nilai
+    # yang bisa dibaca (nama kategori) dan mengodekannya sendiri, jadi decode dulu.
+    test_chromosome_list = decode_chromosome(initialize_chromosome()) # Individu GA yang akan dievaluasi
     
     sample_user_input_params = { # Input dari pengguna
         'Time': 0.5, 'Location': 'Europe', 'Cranial_Capacity': 1300, 'Height': 170,
@@ -279,8 +426,7 @@ if __name__ == '__main__':
     print("\n--- Testing calculate_combined_fitness ---")
     target_species_to_test = 'Homo sapiens'
     
-    fitness = calculate_combined_fitness(
-        chromosome_list=test_chromosome_list,
+    test_context = FitnessContext.build(
         target_genus_specie=target_species_to_test,
         dataset_df=dummy_evolution_df,
         user_input_dict=processed_user_input_dict, # Ini adalah parameter awal dari pengguna
@@ -288,19 +434,17 @@ if __name__ == '__main__':
         categorical_cols_original=test_categorical_cols,
         label_col_in_dataset='Genus_&_Specie'
     )
+    fitness = calculate_combined_fitness(test_chromosome_list, test_context)
     print(f"\nFitness untuk kromosom random vs target '{target_species_to_test}' (dengan input pengguna): {fitness:.4f}")
 
     # Tes jika target tidak ada
     target_species_to_test_nonexist = 'Alienus Minimus'
-    fitness_nonexist = calculate_combined_fitness(
-        chromosome_list=test_chromosome_list,
+    nonexist_context = FitnessContext.build(
         target_genus_specie=target_species_to_test_nonexist,
         dataset_df=dummy_evolution_df,
         user_input_dict=processed_user_input_dict,
         numerical_cols_original=test_numerical_cols,
         categorical_cols_original=test_categorical_cols
     )
+    fitness_nonexist = calculate_combined_fitness(test_chromosome_list, nonexist_context)
     print(f"Fitness untuk target tidak ada '{target_species_to_test_nonexist}': {fitness_nonexist:.4f}")
-    
-    # Kosongkan cache untuk pengujian berikutnya jika perlu
-    TARGET_PROFILES_CACHE.clear()
\ No newline at end of file
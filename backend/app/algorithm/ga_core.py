@@ -1,12 +1,29 @@
 # backend/app/genetic_algorithm/ga_core.py
 
-import random
+import logging
+import time
 import numpy as np
-from .fitness import calculate_combined_fitness
-from .operators import tournament_selection, uniform_crossover, combined_mutation
-from .chromosome_setup import FEATURE_ORDER
+from .fitness import FitnessContext, calculate_population_fitness
+from .parallel import ParallelFitnessEvaluator
+from .operators import tournament_selection_batch, uniform_crossover_batch, combined_mutation_batch
+from .chromosome_setup import FEATURE_ORDER, initialize_population, decode_chromosome
 # from .operators import tournament_selection, combined_crossover, combined_mutation
 
+logger = logging.getLogger(__name__)
+
+# Alasan GA berhenti (GeneticAlgorithmFeatureSelection.stop_reason)
+STOP_MAX_GENERATIONS = 'max_generations'
+STOP_TARGET_FITNESS = 'target_fitness'
+STOP_STAGNATION = 'stagnation'
+STOP_MAX_EVALUATIONS = 'max_evaluations'
+STOP_MAX_TIME = 'max_time'
+STOP_CANCELLED = 'cancelled'
+STOP_ABORTED = 'aborted' # Generator ditutup pemanggil sebelum GA selesai (misal klien stream terputus)
+
+# Fase per generasi yang diukur waktunya
+GA_PHASES = ('evaluate', 'select', 'crossover', 'mutate')
+
+
 class GeneticAlgorithmFeatureSelection:
     def __init__(self, original_df, label_col,
                  numerical_cols_original, categorical_cols_original,
@@ -16,7 +33,20 @@ class GeneticAlgorithmFeatureSelection:
                  crossover_prob=0.8, mutation_prob=0.01,
                  num_features=5,
                  all_original_feature_names=list(FEATURE_ORDER),
-                 fitness_params: dict = None): # (27 atribut)
+                 fitness_params: dict = None, # (27 atribut)
+                 seed=None, # Seed untuk numpy.random.Generator run ini
+                 profile_index=None, # SpeciesProfileIndex yang sudah dibangun (opsional)
+                 classifier=None, # SpeciesClassifier untuk bobot fitness 'classifier' (opsional)
+                 n_jobs=1, # >1 untuk evaluasi fitness paralel di beberapa proses
+                 cancel_event=None, # threading.Event; jika di-set, run() berhenti di generasi berikutnya
+                 elitism=0, # Jumlah individu terbaik yang disalin utuh ke generasi berikutnya
+                 patience=None, # Berhenti jika fitness terbaik tidak naik selama sekian generasi
+                 min_improvement=0.0, # Kenaikan minimum yang dihitung sebagai perbaikan (untuk patience)
+                 target_fitness=None, # Berhenti begitu fitness terbaik >= nilai ini
+                 max_evaluations=None, # Batas keras jumlah evaluasi fitness
+                 max_time_seconds=None, # Batas waktu; generasi yang sedang berjalan tetap diselesaikan
+                 metrics=None): # Objek dengan record_generation(phase_seconds, num_evaluations) dan
+                                # record_run(stop_reason), misal pencatat metrik /metrics di API (opsional)
 
         self.original_df = original_df
         self.label_col = label_col
@@ -38,84 +68,226 @@ class GeneticAlgorithmFeatureSelection:
         self.user_input_dict_for_fitness = initial_user_params_for_ga # Ini dict input awal pengguna
 
         self.fitness_params = fitness_params if fitness_params else {}
+        # Semua operator genetik mengambil bilangan acak dari satu Generator ini
+        self.rng = np.random.default_rng(seed)
+        self.fitness_context = None
+        self.n_jobs = n_jobs
+        self.profile_index = profile_index
+        self.classifier = classifier
+        self.cancel_event = cancel_event
+        self.metrics = metrics
+        self.parallel_evaluator = None # Dibuat di run() jika n_jobs > 1
+
+        if not 0 <= elitism < population_size:
+            raise ValueError(f"elitism harus di antara 0 dan population_size - 1, bukan {elitism}.")
+        self.elitism = elitism
+        self.patience = patience
+        self.min_improvement = min_improvement
+        self.target_fitness = target_fitness
+        self.max_evaluations = max_evaluations
+        self.max_time_seconds = max_time_seconds
+        self.num_evaluations = 0
+        self.generations_without_improvement = 0
+        self.stop_reason = None
+        self.phase_seconds = dict.fromkeys(GA_PHASES, 0.0) # Total waktu per fase selama run
 
-        self.population = []
+        self.population = None # Matriks terkode, lihat _initialize_population
+        self.evaluated_population = None # Populasi generasi terakhir yang sudah dievaluasi (sebelum breeding)
         self.fitness_scores = []
         self.best_chromosome_overall = None
         self.best_fitness_overall = -float('inf') # Inisialisasi dengan nilai sangat kecil
         self.evolution_log_tuples = [] # Untuk (generation, fitness, best_chromosome_list)
 
     def _initialize_population(self):
-        """Inisialisasi populasi awal dengan kromosom biner."""
-        self.population = []
-        for _ in range(self.population_size):
-            # Kromosom adalah vektor biner panjang num_features
-            chromosome = [random.randint(0, 1) for _ in range(self.num_features)]
-            # Pastikan minimal ada satu fitur terpilih untuk menghindari masalah di awal
-            if sum(chromosome) == 0 and self.num_features > 0:
-                chromosome[random.randint(0, self.num_features - 1)] = 1
-            self.population.append(chromosome)
+        """
+        Inisialisasi populasi awal berupa matriks terkode (population_size, NUM_FEATURES):
+        setiap baris adalah satu kromosom dengan kode kategori / nilai numerik per fitur.
+        """
+        self.population = initialize_population(self.population_size, self.rng)
 
     def _evaluate_population(self):
-        """Mengevaluasi fitness setiap individu dalam populasi."""
-        self.fitness_scores = []
-        for chromo_list in self.population:
-            fitness = calculate_combined_fitness( # Pastikan nama fungsi ini benar
-                chromosome_list=chromo_list,
-                target_genus_specie=self.target_genus_specie,
-                dataset_df=self.original_df,
-                user_input_dict=self.user_input_dict_for_fitness,
-                numerical_cols_original=self.numerical_cols_original,
-                categorical_cols_original=self.categorical_cols_original,
-                label_col_in_dataset=self.label_col
-                # Anda bisa meneruskan self.fitness_params jika calculate_combined_fitness menerimanya
+        """
+        Mengevaluasi fitness seluruh populasi sekaligus (tervektorisasi).
+        Skornya identik dengan memanggil calculate_combined_fitness per individu.
+        """
+        if self.parallel_evaluator is not None:
+            self.fitness_scores = self.parallel_evaluator.evaluate(self.population)
+        else:
+            self.fitness_scores = calculate_population_fitness(self.population, self.fitness_context)
+
+    def _fitness_context_kwargs(self):
+        """Argumen FitnessContext.build untuk run ini (selain dataset_df)."""
+        return dict(
+            target_genus_specie=self.target_genus_specie,
+            user_input_dict=self.user_input_dict_for_fitness,
+            numerical_cols_original=self.numerical_cols_original,
+            categorical_cols_original=self.categorical_cols_original,
+            label_col_in_dataset=self.label_col,
+            fitness_weights=self.fitness_params.get('weights'),
+            profile_index=self.profile_index,
+            classifier=self.classifier
+        )
+
+    def _build_fitness_context(self):
+        """Menyiapkan FitnessContext sekali per run (profil target, input pengguna, bobot)."""
+        return FitnessContext.build(dataset_df=self.original_df, **self._fitness_context_kwargs())
+
+    def _evaluations_per_generation(self):
+        return self.population_size
+
+    def _check_evaluation_budget(self):
+        if self.max_evaluations is not None and self.max_evaluations < self._evaluations_per_generation():
+            raise ValueError(
+                f"max_evaluations ({self.max_evaluations}) lebih kecil dari jumlah evaluasi satu generasi "
+                f"({self._evaluations_per_generation()})."
             )
-            self.fitness_scores.append(fitness)
 
-    def run(self):
-        """Menjalankan algoritma genetik."""
-        print("Memulai Algoritma Genetik untuk Seleksi Fitur...")
-        self._initialize_population()
+    def _record_generation_best(self, generation_best_fitness, generation_best_chromosome):
+        """Memperbarui kromosom terbaik sejauh ini dan penghitung stagnasi."""
+        if generation_best_fitness > self.best_fitness_overall + self.min_improvement:
+            self.generations_without_improvement = 0
+        else:
+            self.generations_without_improvement += 1
+        if generation_best_fitness > self.best_fitness_overall:
+            self.best_fitness_overall = generation_best_fitness
+            self.best_chromosome_overall = generation_best_chromosome
 
-        for gen in range(self.num_generations):
-            self._evaluate_population()
+    def _stop_reason_after_generation(self, generation, run_start):
+        """Alasan berhenti setelah generasi ini selesai dievaluasi, atau None jika GA lanjut."""
+        if self.target_fitness is not None and self.best_fitness_overall >= self.target_fitness:
+            return STOP_TARGET_FITNESS
+        if self.patience is not None and self.generations_without_improvement >= self.patience:
+            return STOP_STAGNATION
+        if generation >= self.num_generations:
+            return STOP_MAX_GENERATIONS
+        if self.max_evaluations is not None and \
+                self.num_evaluations + self._evaluations_per_generation() > self.max_evaluations:
+            return STOP_MAX_EVALUATIONS
+        if self.max_time_seconds is not None and time.perf_counter() - run_start >= self.max_time_seconds:
+            return STOP_MAX_TIME
+        return None
 
-            current_best_fitness_in_gen = np.max(self.fitness_scores)
-            current_best_chromo_in_gen = self.population[np.argmax(self.fitness_scores)]
+    def _record_generation_metrics(self, phase_seconds, num_evaluations):
+        """Menambahkan waktu fase satu generasi ke total run dan ke pencatat metrics (jika ada)."""
+        for phase, seconds in phase_seconds.items():
+            self.phase_seconds[phase] += seconds
+        if self.metrics is not None:
+            self.metrics.record_generation(phase_seconds, num_evaluations)
 
-            self.convergence_log.append((gen + 1, current_best_fitness_in_gen, list(current_best_chromo_in_gen)))
+    def _record_run_metrics(self):
+        """Mencatat run yang berakhir (alasan berhenti) ke pencatat metrics (jika ada)."""
+        if self.metrics is not None:
+            self.metrics.record_run(self.stop_reason or STOP_ABORTED)
 
-            if current_best_fitness_in_gen > self.best_fitness_overall:
-                self.best_fitness_overall = current_best_fitness_in_gen
-                self.best_chromosome_overall = list(current_best_chromo_in_gen) # Simpan sebagai list
+    def _apply_elitism(self):
+        """Menyalin individu terbaik populasi yang baru dievaluasi ke awal populasi berikutnya."""
+        if self.elitism:
+            elite_indices = np.argsort(self.fitness_scores, kind='stable')[::-1][:self.elitism]
+            self.population[:self.elitism] = self.evaluated_population[elite_indices]
 
-            print(f"Generasi {gen + 1}/{self.num_generations} - Fitness Terbaik: {self.best_fitness_overall:.4f} (Akurasi di gen ini: {current_best_fitness_in_gen:.4f})")
+    def iter_generations(self, keep_log=True):
+        """
+        Menjalankan algoritma genetik sebagai generator: setiap generasi yang selesai
+        dievaluasi langsung di-yield sebagai satu update. Setelah selesai, stop_reason
+        berisi alasan berhenti (STOP_*).
 
-            # Seleksi
-            selected_parents = tournament_selection(self.population, self.fitness_scores)
+        Args:
+            keep_log (bool): Jika False, convergence_log tidak diisi sehingga memori
+                tetap konstan untuk run yang panjang (pemanggil memproses update satu per satu).
 
-            # Crossover dan Mutasi untuk membuat populasi baru
-            next_population = []
-            for i in range(0, self.population_size, 2):
-                parent1 = selected_parents[i]
-                # Pastikan ada parent kedua jika ukuran populasi ganjil
-                parent2 = selected_parents[i+1] if (i+1) < self.population_size else selected_parents[0] 
+        Yields:
+            dict: generation, best_fitness (terbaik sejauh ini), best_chromosome (terkode),
+                generation_best_fitness, generation_best_chromosome, generation_seconds,
+                elapsed_seconds, phase_seconds (waktu per fase di generasi ini).
+        """
+        logger.info("Memulai Algoritma Genetik untuk Seleksi Fitur...")
+        self._check_evaluation_budget()
+        run_start = time.perf_counter()
+        self.fitness_context = self._build_fitness_context()
+        if self.n_jobs and self.n_jobs > 1:
+            # Opt-in: evaluasi fitness dibagi ke beberapa proses yang menerima FitnessContext run ini
+            self.parallel_evaluator = ParallelFitnessEvaluator(self.fitness_context, n_jobs=self.n_jobs)
+        try:
+            self._initialize_population()
 
-                child1, child2 = uniform_crossover(parent1, parent2, self.crossover_prob) # Menggunakan uniform_crossover
+            for gen in range(self.num_generations):
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    logger.info("Algoritma Genetik dibatalkan pada generasi %d.", gen + 1)
+                    self.stop_reason = STOP_CANCELLED
+                    break
 
-                # Menggunakan combined_mutation
-                next_population.append(combined_mutation(child1, self.mutation_prob, numerical_creep_prob=0.5, creep_magnitude_ratio=0.1)) 
-                if len(next_population) < self.population_size:
-                    next_population.append(combined_mutation(child2, self.mutation_prob, numerical_creep_prob=0.5, creep_magnitude_ratio=0.1))
+                gen_start = time.perf_counter()
+                self._evaluate_population()
+                self.num_evaluations += len(self.population)
+                phase_seconds = dict.fromkeys(GA_PHASES, 0.0)
+                phase_seconds['evaluate'] = time.perf_counter() - gen_start
 
-            self.population = next_population
+                current_best_fitness_in_gen = np.max(self.fitness_scores)
+                current_best_chromo_in_gen = self.population[np.argmax(self.fitness_scores)].copy()
 
-        # Evaluasi terakhir untuk populasi final jika diperlukan, atau langsung ambil yang terbaik selama ini
-        print("\nAlgoritma Genetik Selesai.")
-        print(f"Kromosom terbaik ditemukan: {self.best_chromosome_overall}")
-        print(f"Fitness terbaik: {self.best_fitness_overall:.4f}")
+                if keep_log:
+                    self.convergence_log.append((gen + 1, current_best_fitness_in_gen, current_best_chromo_in_gen))
+
+                self._record_generation_best(current_best_fitness_in_gen, current_best_chromo_in_gen)
+
+                logger.debug("Generasi %d/%d - Fitness Terbaik: %.4f (Akurasi di gen ini: %.4f)",
+                             gen + 1, self.num_generations, self.best_fitness_overall, current_best_fitness_in_gen)
+
+                self.evaluated_population = self.population # Populasi yang dinilai fitness_scores
+                self.stop_reason = self._stop_reason_after_generation(gen + 1, run_start)
+
+                if self.stop_reason is None:
+                    # Seleksi, crossover dan mutasi untuk seluruh populasi sekaligus (operator batch)
+                    phase_start = time.perf_counter()
+                    selected_parents = tournament_selection_batch(self.population, self.fitness_scores, self.rng)
+                    phase_end = time.perf_counter()
+                    phase_seconds['select'] = phase_end - phase_start
+
+                    phase_start = phase_end
+                    offspring = uniform_crossover_batch(selected_parents, self.crossover_prob, self.rng)
+                    phase_end = time.perf_counter()
+                    phase_seconds['crossover'] = phase_end - phase_start
 
-        selected_feature_names_final = [self.all_original_feature_names[i] for i, bit in enumerate(self.best_chromosome_overall) if bit == 1]
-        print(f"Fitur terpilih: {selected_feature_names_final}")
+                    phase_start = phase_end
+                    self.population = combined_mutation_batch(
+                        offspring, self.mutation_prob, self.rng, numerical_creep_prob=0.5, creep_magnitude_ratio=0.1
+                    )
+                    self._apply_elitism()
+                    phase_seconds['mutate'] = time.perf_counter() - phase_start
+
+                self._record_generation_metrics(phase_seconds, len(self.evaluated_population))
+                now = time.perf_counter()
+                yield {
+                    'generation': gen + 1,
+                    'best_fitness': float(self.best_fitness_overall),
+                    'best_chromosome': self.best_chromosome_overall,
+                    'generation_best_fitness': float(current_best_fitness_in_gen),
+                    'generation_best_chromosome': current_best_chromo_in_gen,
+                    'generation_seconds': now - gen_start,
+                    'elapsed_seconds': now - run_start,
+                    'phase_seconds': phase_seconds,
+                }
+                if self.stop_reason is not None:
+                    break
+        finally:
+            # Juga dijalankan jika pemanggil berhenti di tengah jalan (generator ditutup)
+            self._record_run_metrics()
+            if self.parallel_evaluator is not None:
+                self.parallel_evaluator.close()
+                self.parallel_evaluator = None
+
+    def run(self):
+        """Menjalankan algoritma genetik sampai selesai."""
+        for _ in self.iter_generations(keep_log=True):
+            pass
+
+        # Evaluasi terakhir untuk populasi final jika diperlukan, atau langsung ambil yang terbaik selama ini
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Algoritma Genetik Selesai (alasan berhenti: %s, %d evaluasi).", self.stop_reason, self.num_evaluations)
+            if self.best_chromosome_overall is not None: # None jika dibatalkan sebelum generasi pertama
+                logger.info("Kromosom terbaik ditemukan: %s", decode_chromosome(self.best_chromosome_overall))
+                logger.info("Fitness terbaik: %.4f", self.best_fitness_overall)
+            logger.info("Waktu per fase (detik): %s", {phase: round(s, 6) for phase, s in self.phase_seconds.items()})
 
+        # Kromosom dikembalikan dalam bentuk terkode; decode dilakukan di batas API.
         return self.best_chromosome_overall, self.best_fitness_overall, None, self.convergence_log
\ No newline at end of file
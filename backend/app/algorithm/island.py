@@ -0,0 +1,215 @@
+# backend/app/algorithm/island.py
+
+import logging
+import time
+import numpy as np
+from .ga_core import GeneticAlgorithmFeatureSelection, STOP_CANCELLED, GA_PHASES
+from .parallel import SharedDataset, attach_shared_dataset, worker_mp_context
+
+logger = logging.getLogger(__name__)
+
+# GA model pulau (island model): beberapa sub-populasi berjalan di proses terpisah,
+# masing-masing menjalankan loop seleksi/crossover/mutasi GeneticAlgorithmFeatureSelection
+# yang sama. Setiap pulau terhubung ke proses utama lewat Pipe; proses utama menggabungkan
+# hasil per generasi dan, setiap migration_interval generasi, meneruskan individu terbaik
+# (emigran) ke pulau tujuan sesuai topologi. Proses pulau dibuat dengan worker_mp_context()
+# (forkserver/spawn), sehingga semua argumennya dikirim lewat pickle.
+
+TOPOLOGY_RING = 'ring'
+TOPOLOGY_FULLY_CONNECTED = 'fully_connected'
+
+_CMD_CONTINUE = 'continue'
+_CMD_STOP = 'stop'
+
+
+def _island_worker(conn, dataset_spec, ga_kwargs, migration_size):
+    """Loop satu pulau di proses worker; berkomunikasi dengan proses utama lewat conn."""
+    dataset_df, blocks = attach_shared_dataset(dataset_spec)
+    try:
+        ga = GeneticAlgorithmFeatureSelection(original_df=dataset_df, **ga_kwargs)
+        for update in ga.iter_generations(keep_log=False):
+            # Emigran: individu terbaik dari populasi yang baru saja dievaluasi
+            top = np.argsort(ga.fitness_scores, kind='stable')[::-1][:migration_size]
+            conn.send(('update', dict(
+                update,
+                emigrants=ga.evaluated_population[top].copy(),
+                emigrant_fitness=np.asarray(ga.fitness_scores)[top].copy(),
+            )))
+            command, immigrants = conn.recv()
+            if command == _CMD_STOP:
+                break
+            if immigrants is not None and len(immigrants):
+                # Imigran menggantikan individu acak di populasi generasi berikutnya,
+                # kecuali elit yang sudah ditempatkan _apply_elitism di awal populasi
+                num_elites = min(ga.elitism, len(ga.population))
+                num_slots = min(len(immigrants), len(ga.population) - num_elites)
+                slots = num_elites + ga.rng.choice(len(ga.population) - num_elites, size=num_slots, replace=False)
+                ga.population[slots] = immigrants[:num_slots]
+    except Exception as e:
+        conn.send(('error', f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+        del dataset_df
+        for block in blocks:
+            block.close()
+
+
+class IslandModelGA(GeneticAlgorithmFeatureSelection):
+    """
+    Varian GeneticAlgorithmFeatureSelection dengan num_islands sub-populasi di proses terpisah.
+    run() dan iter_generations() mengembalikan format yang sama dengan GA biasa;
+    convergence_log berisi kromosom terbaik dari semua pulau di setiap generasi.
+    Elitisme berlaku per pulau; kriteria berhenti (patience, target_fitness, batas evaluasi
+    dan waktu) diterapkan proses utama pada hasil gabungan semua pulau.
+
+    Args (selain argumen GeneticAlgorithmFeatureSelection):
+        num_islands (int): Jumlah pulau/proses. population_size berlaku per pulau.
+        migration_interval (int): Migrasi dilakukan setiap sekian generasi.
+        migration_size (int): Jumlah emigran yang dikirim (dan diterima) tiap pulau.
+        topology (str): 'ring' (pulau i -> i+1) atau 'fully_connected' (setiap pulau
+                        menerima migration_size emigran terbaik dari semua pulau lain).
+    """
+
+    def __init__(self, *args, num_islands=4, migration_interval=5, migration_size=2,
+                 topology=TOPOLOGY_RING, **kwargs):
+        super().__init__(*args, **kwargs)
+        if topology not in (TOPOLOGY_RING, TOPOLOGY_FULLY_CONNECTED):
+            raise ValueError(f"Topologi migrasi tidak dikenal: '{topology}'. Pilihan: ring, fully_connected")
+        if num_islands < 1 or migration_interval < 1 or migration_size < 0:
+            raise ValueError("num_islands dan migration_interval harus >= 1, migration_size >= 0.")
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        seed = kwargs.get('seed')
+        # Satu SeedSequence dipecah menjadi seed independen untuk setiap pulau
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+    def _island_ga_kwargs(self, island_seed):
+        """Argumen GeneticAlgorithmFeatureSelection untuk satu pulau (selain original_df)."""
+        return dict(
+            label_col=self.label_col,
+            numerical_cols_original=self.numerical_cols_original,
+            categorical_cols_original=self.categorical_cols_original,
+            target_genus_specie_for_ga=self.target_genus_specie,
+            initial_user_params_for_ga=self.user_input_dict_for_fitness,
+            population_size=self.population_size,
+            num_generations=self.num_generations,
+            crossover_prob=self.crossover_prob,
+            mutation_prob=self.mutation_prob,
+            num_features=self.num_features,
+            all_original_feature_names=self.all_original_feature_names,
+            fitness_params=self.fitness_params,
+            seed=island_seed,
+            profile_index=self.profile_index,
+            classifier=self.classifier,
+            elitism=self.elitism,
+        )
+
+    def _evaluations_per_generation(self):
+        return self.num_islands * self.population_size
+
+    def _route_migrants(self, updates):
+        """Daftar imigran untuk setiap pulau berdasarkan emigran semua pulau dan topologi."""
+        if self.num_islands < 2 or self.migration_size == 0:
+            return [None] * self.num_islands
+        if self.topology == TOPOLOGY_RING:
+            return [updates[(i - 1) % self.num_islands]['emigrants'] for i in range(self.num_islands)]
+
+        immigrants = []
+        for i in range(self.num_islands):
+            others = [u for j, u in enumerate(updates) if j != i]
+            candidates = np.concatenate([u['emigrants'] for u in others])
+            candidate_fitness = np.concatenate([u['emigrant_fitness'] for u in others])
+            best = np.argsort(candidate_fitness, kind='stable')[::-1][:self.migration_size]
+            immigrants.append(candidates[best])
+        return immigrants
+
+    @staticmethod
+    def _receive(conn, island_id):
+        kind, payload = conn.recv()
+        if kind == 'error':
+            raise RuntimeError(f"Pulau {island_id} gagal: {payload}")
+        return payload
+
+    def iter_generations(self, keep_log=True):
+        """Seperti GeneticAlgorithmFeatureSelection.iter_generations, digabung dari semua pulau."""
+        logger.info("Memulai Algoritma Genetik model pulau (%d pulau, topologi %s)...", self.num_islands, self.topology)
+        self._check_evaluation_budget()
+        run_start = time.perf_counter()
+        mp_context = worker_mp_context() # Bukan fork: run ini bisa berjalan di thread worker
+        shared_dataset = SharedDataset(self.original_df)
+        processes, connections = [], []
+        try:
+            for island_seed in self.seed_sequence.spawn(self.num_islands):
+                parent_conn, child_conn = mp_context.Pipe()
+                process = mp_context.Process(
+                    target=_island_worker, daemon=True,
+                    args=(child_conn, shared_dataset.spec, self._island_ga_kwargs(island_seed), self.migration_size),
+                )
+                process.start()
+                child_conn.close()
+                processes.append(process)
+                connections.append(parent_conn)
+
+            for gen in range(1, self.num_generations + 1):
+                gen_start = time.perf_counter()
+                updates = [self._receive(conn, i) for i, conn in enumerate(connections)]
+                self.num_evaluations += self._evaluations_per_generation()
+                # Waktu fase diukur di setiap pulau; dicatat di proses utama (pencatat metrics hanya ada di sini)
+                phase_seconds = dict.fromkeys(GA_PHASES, 0.0)
+                for update in updates:
+                    self._record_generation_metrics(update['phase_seconds'], self.population_size)
+                    for phase, seconds in update['phase_seconds'].items():
+                        phase_seconds[phase] += seconds
+
+                gen_island = int(np.argmax([u['generation_best_fitness'] for u in updates]))
+                gen_best_fitness = updates[gen_island]['generation_best_fitness']
+                gen_best_chromosome = updates[gen_island]['generation_best_chromosome']
+                if keep_log:
+                    self.convergence_log.append((gen, gen_best_fitness, gen_best_chromosome))
+                self._record_generation_best(gen_best_fitness, gen_best_chromosome)
+                logger.debug("Generasi %d/%d - Fitness Terbaik: %.4f (pulau %d, fitness di gen ini: %.4f)",
+                             gen, self.num_generations, self.best_fitness_overall, gen_island, gen_best_fitness)
+
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    logger.info("Algoritma Genetik model pulau dibatalkan pada generasi %d.", gen)
+                    self.stop_reason = STOP_CANCELLED
+                    break
+                self.stop_reason = self._stop_reason_after_generation(gen, run_start)
+                if self.stop_reason is None:
+                    migrate = gen % self.migration_interval == 0
+                    immigrants = self._route_migrants(updates) if migrate else [None] * self.num_islands
+                    for conn, island_immigrants in zip(connections, immigrants):
+                        conn.send((_CMD_CONTINUE, island_immigrants))
+
+                now = time.perf_counter()
+                yield {
+                    'generation': gen,
+                    'best_fitness': float(self.best_fitness_overall),
+                    'best_chromosome': self.best_chromosome_overall,
+                    'generation_best_fitness': float(gen_best_fitness),
+                    'generation_best_chromosome': gen_best_chromosome,
+                    'generation_seconds': now - gen_start,
+                    'elapsed_seconds': now - run_start,
+                    'island': gen_island,
+                    'phase_seconds': phase_seconds, # Dijumlahkan dari semua pulau
+                    'island_best_fitness': [float(u['best_fitness']) for u in updates],
+                }
+                if self.stop_reason is not None:
+                    break
+        finally:
+            self._record_run_metrics()
+            for conn in connections:
+                try:
+                    conn.send((_CMD_STOP, None))
+                except (BrokenPipeError, OSError):
+                    pass # Pulau sudah berhenti
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            for conn in connections:
+                conn.close()
+            shared_dataset.close()
@@ -1,51 +1,55 @@
 # backend/app/algorithm/operators.py
 
-import random
 import numpy as np
 # Asumsi chromosome_setup.py ada di modul yang sama (algorithm)
-from .chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS, NUM_FEATURES, initialize_chromosome
+from .chromosome_setup import (
+    FEATURE_ORDER, FEATURE_DETAILS, NUM_FEATURES, initialize_chromosome, decode_chromosome,
+    GENE_IS_NUMERICAL, GENE_NUM_CATEGORIES, GENE_RANGE_MIN, GENE_RANGE_MAX
+)
+
+# Semua operator mengambil bilangan acak dari rng (numpy.random.Generator) milik run
+# yang memanggil; tanpa rng dibuat Generator baru, jadi tidak ada state acak global
+# yang dibagi antar run GA yang berjalan bersamaan.
+
+def _generator(rng):
+    return rng if rng is not None else np.random.default_rng()
 
 # --- 1. Seleksi ---
-def tournament_selection(population, fitness_scores, k=3):
+def tournament_selection(population, fitness_scores, k=3, rng=None):
     """
     Melakukan seleksi turnamen.
     Memilih individu terbaik dari k individu yang dipilih secara acak.
     """
-    selected_parents = []
+    rng = _generator(rng)
+    winner_indices = []
     population_size = len(population)
     
     for _ in range(population_size): # Kita butuh sejumlah parent yang sama dengan ukuran populasi
-        tournament_indices = random.sample(range(population_size), k)
+        tournament_indices = rng.choice(population_size, size=k, replace=False)
         tournament_fitness = [fitness_scores[i] for i in tournament_indices]
         
         winner_index_in_tournament = np.argmax(tournament_fitness)
-        winner_original_index = tournament_indices[winner_index_in_tournament]
-        selected_parents.append(population[winner_original_index]) # Menyimpan seluruh kromosom (list)
+        winner_indices.append(tournament_indices[winner_index_in_tournament])
             
-    return selected_parents
+    return population[winner_indices] # Matriks parent terpilih (satu baris per parent)
 
 # --- 2. Crossover ---
-def uniform_crossover(parent1, parent2, crossover_probability):
+def uniform_crossover(parent1, parent2, crossover_probability, rng=None):
     """
     Melakukan uniform crossover.
     Untuk setiap gen (fitur), pilih secara acak dari parent1 atau parent2.
     Ini cocok untuk kromosom di mana urutan gen tidak sepenting kombinasi nilai.
     """
-    child1 = [None] * NUM_FEATURES
-    child2 = [None] * NUM_FEATURES
-
-    if random.random() < crossover_probability:
-        for i in range(NUM_FEATURES):
-            if random.random() < 0.5:
-                child1[i] = parent1[i]
-                child2[i] = parent2[i]
-            else:
-                child1[i] = parent2[i]
-                child2[i] = parent1[i]
-        return child1, child2
-    else:
-        # Jika tidak ada crossover, anak adalah salinan parent
-        return list(parent1), list(parent2)
+    rng = _generator(rng)
+    child1 = parent1.copy()
+    child2 = parent2.copy()
+
+    if rng.random() < crossover_probability:
+        swap = rng.random(NUM_FEATURES) >= 0.5
+        child1[swap] = parent2[swap]
+        child2[swap] = parent1[swap]
+    # Jika tidak ada crossover, anak adalah salinan parent
+    return child1, child2
 
 def arithmetic_crossover_numerical_only(parent1, parent2, feature_index, alpha=0.5):
     """
@@ -68,7 +72,7 @@ def arithmetic_crossover_numerical_only(parent1, parent2, feature_index, alpha=0
     
     return child_val1, child_val2
 
-def combined_crossover(parent1, parent2, crossover_probability, numerical_crossover_alpha=0.5):
+def combined_crossover(parent1, parent2, crossover_probability, numerical_crossover_alpha=0.5, rng=None):
     """
     Kombinasi crossover: uniform untuk semua fitur,
     dan untuk fitur numerik, bisa juga dipertimbangkan arithmetic crossover (opsional).
@@ -76,7 +80,7 @@ def combined_crossover(parent1, parent2, crossover_probability, numerical_crosso
     """
     # Untuk saat ini, kita gunakan uniform crossover untuk semua tipe fitur.
     # Ini lebih sederhana untuk diimplementasikan dan seringkali bekerja dengan baik.
-    return uniform_crossover(parent1, parent2, crossover_probability)
+    return uniform_crossover(parent1, parent2, crossover_probability, rng)
 
     # --- Alternatif Crossover yang Lebih Kompleks (Contoh, tidak diimplementasikan penuh di sini) ---
     # child1 = list(parent1) # Salin
@@ -111,23 +115,24 @@ def combined_crossover(parent1, parent2, crossover_probability, numerical_crosso
 
 
 # --- 3. Mutasi ---
-def random_reset_mutation(chromosome, mutation_probability):
+def random_reset_mutation(chromosome, mutation_probability, rng=None):
     """
     Melakukan mutasi dengan mereset nilai gen ke nilai acak baru yang valid.
     """
-    mutated_chromosome = list(chromosome) # Salin kromosom
+    rng = _generator(rng)
+    mutated_chromosome = chromosome.copy() # Salin kromosom
     for i in range(NUM_FEATURES):
-        if random.random() < mutation_probability:
+        if rng.random() < mutation_probability:
             feature_name = FEATURE_ORDER[i]
             details = FEATURE_DETAILS[feature_name]
             
             if details['type'] == 'numerical':
-                mutated_chromosome[i] = random.uniform(details['range'][0], details['range'][1])
+                mutated_chromosome[i] = rng.uniform(details['range'][0], details['range'][1])
             elif details['type'] == 'categorical':
-                mutated_chromosome[i] = random.choice(details['categories'])
+                mutated_chromosome[i] = rng.integers(len(details['categories']))
     return mutated_chromosome
 
-def creep_mutation_numerical_only(value, feature_details, creep_magnitude_ratio=0.1):
+def creep_mutation_numerical_only(value, feature_details, creep_magnitude_ratio=0.1, rng=None):
     """
     Melakukan creep mutation pada satu fitur numerik.
     Menambahkan nilai acak kecil (positif atau negatif) ke nilai saat ini.
@@ -139,7 +144,7 @@ def creep_mutation_numerical_only(value, feature_details, creep_magnitude_ratio=
         return value
 
     # Besarnya creep adalah persentase dari rentang total fitur
-    creep_value = (random.random() - 0.5) * 2 * creep_magnitude_ratio * current_range # antara -max_creep dan +max_creep
+    creep_value = (_generator(rng).random() - 0.5) * 2 * creep_magnitude_ratio * current_range # antara -max_creep dan +max_creep
     
     mutated_value = value + creep_value
     
@@ -147,37 +152,113 @@ def creep_mutation_numerical_only(value, feature_details, creep_magnitude_ratio=
     mutated_value = max(min_val, min(mutated_value, max_val))
     return mutated_value
 
-def combined_mutation(chromosome, mutation_probability, numerical_creep_prob=0.5, creep_magnitude_ratio=0.1):
+def combined_mutation(chromosome, mutation_probability, numerical_creep_prob=0.5, creep_magnitude_ratio=0.1, rng=None):
     """
     Kombinasi mutasi: 
     - Untuk fitur numerik: bisa random reset atau creep mutation.
     - Untuk fitur kategorikal: random reset (pilih kategori acak baru).
     """
-    mutated_chromosome = list(chromosome)
+    rng = _generator(rng)
+    mutated_chromosome = chromosome.copy()
     for i in range(NUM_FEATURES):
-        if random.random() < mutation_probability: # Apakah gen ini akan dimutasi?
+        if rng.random() < mutation_probability: # Apakah gen ini akan dimutasi?
             feature_name = FEATURE_ORDER[i]
             details = FEATURE_DETAILS[feature_name]
             
             if details['type'] == 'numerical':
-                if random.random() < numerical_creep_prob: # Peluang untuk creep mutation
-                    mutated_chromosome[i] = creep_mutation_numerical_only(mutated_chromosome[i], details, creep_magnitude_ratio)
+                if rng.random() < numerical_creep_prob: # Peluang untuk creep mutation
+                    mutated_chromosome[i] = creep_mutation_numerical_only(mutated_chromosome[i], details, creep_magnitude_ratio, rng)
                 else: # Random reset untuk numerik
-                    mutated_chromosome[i] = random.uniform(details['range'][0], details['range'][1])
+                    mutated_chromosome[i] = rng.uniform(details['range'][0], details['range'][1])
             
             elif details['type'] == 'categorical':
-                # Random reset untuk kategorikal (pilih kategori acak lain)
+                # Random reset untuk kategorikal (pilih kode kategori acak lain)
                 # Untuk memastikan nilai *berubah* jika memungkinkan:
-                current_value = mutated_chromosome[i]
-                possible_new_values = [cat for cat in details['categories'] if cat != current_value]
-                if possible_new_values:
-                    mutated_chromosome[i] = random.choice(possible_new_values)
-                else: # Jika hanya ada satu kategori, tidak bisa berubah
-                    mutated_chromosome[i] = current_value 
+                # ambil kode dari n-1 kategori lain, lalu lompati kode saat ini.
+                current_code = int(mutated_chromosome[i])
+                num_categories = len(details['categories'])
+                if current_code < 0: # Kode tidak dikenal, pilih kategori mana saja
+                    mutated_chromosome[i] = rng.integers(num_categories)
+                elif num_categories > 1:
+                    new_code = rng.integers(num_categories - 1)
+                    mutated_chromosome[i] = new_code + 1 if new_code >= current_code else new_code
+                # Jika hanya ada satu kategori, tidak bisa berubah
                     
     return mutated_chromosome
 
 
+# --- 4. Operator Batch (satu generasi sekaligus) ---
+# Versi tervektorisasi dari operator di atas. Masing-masing bekerja pada seluruh
+# populasi (matriks terkode) dengan satu numpy.random.Generator, tanpa loop Python per individu.
+
+def tournament_selection_batch(population, fitness_scores, rng, k=3):
+    """
+    Seleksi turnamen untuk seluruh populasi sekaligus.
+    Peserta setiap turnamen diambil dengan pengembalian (with replacement),
+    sehingga satu individu bisa muncul lebih dari sekali dalam satu turnamen.
+    """
+    fitness_scores = np.asarray(fitness_scores)
+    population_size = len(population)
+    tournament_indices = rng.integers(0, population_size, size=(population_size, k))
+    winner_in_tournament = np.argmax(fitness_scores[tournament_indices], axis=1)
+    winner_indices = tournament_indices[np.arange(population_size), winner_in_tournament]
+    return population[winner_indices]
+
+def uniform_crossover_batch(parents, crossover_probability, rng):
+    """
+    Uniform crossover untuk seluruh parent sekaligus.
+    Parent dipasangkan berurutan (0-1, 2-3, ...); jika jumlahnya ganjil, parent terakhir
+    dipasangkan dengan parent pertama dan hanya anak pertamanya yang dipakai.
+    """
+    population_size = len(parents)
+    if population_size % 2:
+        parents = np.concatenate([parents, parents[:1]])
+    parent1 = parents[0::2]
+    parent2 = parents[1::2]
+
+    do_crossover = rng.random(len(parent1)) < crossover_probability
+    swap = (rng.random(parent1.shape) >= 0.5) & do_crossover[:, None]
+
+    children = np.empty_like(parents)
+    children[0::2] = np.where(swap, parent2, parent1)
+    children[1::2] = np.where(swap, parent1, parent2)
+    return children[:population_size]
+
+def combined_mutation_batch(population, mutation_probability, rng, numerical_creep_prob=0.5, creep_magnitude_ratio=0.1):
+    """
+    Versi batch dari combined_mutation:
+    - gen numerik: creep mutation (peluang numerical_creep_prob) atau random reset
+    - gen kategorikal: pindah ke kode kategori lain secara acak
+    Semua gen yang dimutasi diproses sekaligus dengan mask dan fancy indexing.
+    """
+    mutated_population = population.copy()
+    rows, cols = np.nonzero(rng.random(population.shape) < mutation_probability)
+    if len(rows) == 0:
+        return mutated_population
+
+    current = mutated_population[rows, cols].astype(np.float64)
+    draws = rng.random((4, len(rows)))
+
+    # Kategorikal: ambil kode dari n-1 kategori lain, lalu lompati kode saat ini
+    num_categories = GENE_NUM_CATEGORIES[cols]
+    other_code = np.floor(draws[0] * (num_categories - 1))
+    other_code += other_code >= current
+    new_categorical = np.where(num_categories > 1, other_code, current)
+    new_categorical = np.where(current < 0, np.floor(draws[0] * num_categories), new_categorical)
+
+    # Numerik: creep (dengan clamping) atau random reset di dalam rentang
+    min_vals = GENE_RANGE_MIN[cols]
+    max_vals = GENE_RANGE_MAX[cols]
+    current_range = max_vals - min_vals
+    creep = np.clip(current + (draws[1] - 0.5) * 2 * creep_magnitude_ratio * current_range, min_vals, max_vals)
+    creep = np.where(current_range == 0, current, creep) # Jika rentang adalah 0, tidak ada creep
+    reset = min_vals + draws[2] * current_range
+    new_numerical = np.where(draws[3] < numerical_creep_prob, creep, reset)
+
+    mutated_population[rows, cols] = np.where(GENE_IS_NUMERICAL[cols], new_numerical, new_categorical)
+    return mutated_population
+
+
 # --- Contoh Penggunaan (untuk testing) ---
 if __name__ == '__main__':
     # Inisialisasi beberapa kromosom dummy (menggunakan struktur dari chromosome_setup)
@@ -188,7 +269,7 @@ if __name__ == '__main__':
     parent_c = initialize_chromosome()
     parent_d = initialize_chromosome()
 
-    dummy_population = [parent_a, parent_b, parent_c, parent_d]
+    dummy_population = np.stack([parent_a, parent_b, parent_c, parent_d])
     dummy_fitness_scores = [0.7, 0.9, 0.6, 0.85] # Contoh fitness
 
     print("--- Testing Seleksi Turnamen ---")
@@ -201,17 +282,17 @@ if __name__ == '__main__':
     print("\n--- Testing Crossover (Uniform) ---")
     child_x1, child_x2 = uniform_crossover(parent_a, parent_b, crossover_probability=0.9)
     # Print beberapa gen untuk melihat perbedaannya
-    print("Parent A (awal):", [f"{val:.2f}" if isinstance(val, float) else val for val in parent_a[:5]])
-    print("Parent B (awal):", [f"{val:.2f}" if isinstance(val, float) else val for val in parent_b[:5]])
-    print("Child X1 (awal):", [f"{val:.2f}" if isinstance(val, float) else val for val in child_x1[:5]])
-    print("Child X2 (awal):", [f"{val:.2f}" if isinstance(val, float) else val for val in child_x2[:5]])
+    print("Parent A (awal):", decode_chromosome(parent_a)[:5])
+    print("Parent B (awal):", decode_chromosome(parent_b)[:5])
+    print("Child X1 (awal):", decode_chromosome(child_x1)[:5])
+    print("Child X2 (awal):", decode_chromosome(child_x2)[:5])
 
     print("\n--- Testing Mutasi (Combined) ---")
     original_chromo = initialize_chromosome()
-    print("Kromosom Asli (awal):", [f"{val:.2f}" if isinstance(val, float) else val for val in original_chromo[:7]])
+    print("Kromosom Asli (awal):", decode_chromosome(original_chromo)[:7])
     
     mutated_chromo = combined_mutation(original_chromo, mutation_probability=0.1, numerical_creep_prob=0.7) # 10% per gen, 70% creep jika numerik
-    print("Kromosom Termutasi (awal):", [f"{val:.2f}" if isinstance(val, float) else val for val in mutated_chromo[:7]])
+    print("Kromosom Termutasi (awal):", decode_chromosome(mutated_chromo)[:7])
     
     changes = 0
     for i in range(NUM_FEATURES):
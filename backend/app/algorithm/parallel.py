@@ -0,0 +1,142 @@
+# backend/app/algorithm/parallel.py
+
+import multiprocessing
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from .fitness import calculate_population_fitness
+
+# Paralelisme berbasis proses untuk GA.
+# - ParallelFitnessEvaluator (GeneticAlgorithmFeatureSelection dengan n_jobs > 1): FitnessContext
+#   dibangun sekali di proses utama dan dikirim ke setiap worker saat inisialisasi. Konteks ini
+#   kecil (profil target, referensi input pengguna, bobot; classifier hanya jika aktif), jadi
+#   worker tidak butuh dataset. Per tugas, yang dikirim hanya potongan (chunk) matriks populasi.
+# - SharedDataset (model pulau): dataset diletakkan sekali di shared memory; setiap proses pulau
+#   hanya menerima "spec" kecil (nama blok + metadata kolom) lalu membangun DataFrame zero-copy.
+# Semua proses worker dibuat lewat worker_mp_context() (forkserver, atau spawn jika tidak ada),
+# bukan fork: GA bisa berjalan di thread JobManager di dalam uvicorn, dan fork dari proses
+# multi-thread bisa deadlock karena lock milik thread lain ikut tersalin dalam keadaan terkunci.
+WORKER_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def worker_mp_context():
+    """Context multiprocessing untuk worker GA (lihat WORKER_START_METHOD)."""
+    context = multiprocessing.get_context(WORKER_START_METHOD)
+    if WORKER_START_METHOD == 'forkserver':
+        # Server memuat numpy/pandas dan modul GA sekali; setiap worker di-fork dari server itu
+        context.set_forkserver_preload([__name__])
+    return context
+
+
+class SharedDataset:
+    """
+    Salinan kolom-kolom DataFrame di shared memory.
+    - Kolom numerik disimpan apa adanya.
+    - Kolom teks disimpan sebagai kode integer (pd.factorize) + daftar kategori.
+    Panggil close() (atau gunakan sebagai context manager) untuk membebaskan blok.
+    """
+
+    def __init__(self, df):
+        self._blocks = []
+        self.spec = [] # (nama_kolom, nama_blok, dtype, panjang, kategori atau None)
+        try:
+            for column in df.columns:
+                series = df[column]
+                if pd.api.types.is_numeric_dtype(series.dtype):
+                    values = series.to_numpy()
+                    categories = None
+                else:
+                    codes, uniques = pd.factorize(series)
+                    values = codes.astype(np.int32)
+                    categories = list(uniques)
+                block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+                self._blocks.append(block)
+                np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+                self.spec.append((column, block.name, values.dtype.str, len(values), categories))
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def attach_shared_dataset(spec):
+    """
+    Membangun DataFrame zero-copy dari spec SharedDataset (dipanggil di proses worker).
+    Mengembalikan (DataFrame, daftar_blok); daftar blok harus tetap direferensikan
+    selama DataFrame dipakai.
+    """
+    blocks = []
+    columns = {}
+    for column, block_name, dtype, length, categories in spec:
+        # Worker berbagi resource tracker dengan proses utama, yang memiliki blok
+        # dan meng-unlink-nya di SharedDataset.close(); worker cukup close().
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        values = np.ndarray((length,), dtype=np.dtype(dtype), buffer=block.buf)
+        values.flags.writeable = False
+        if categories is None:
+            columns[column] = values
+        else:
+            columns[column] = pd.Categorical.from_codes(values, categories)
+    return pd.DataFrame(columns, copy=False), blocks
+
+
+# State per proses worker (diisi oleh _init_worker)
+_WORKER_STATE = {}
+
+def _init_worker(fitness_context):
+    _WORKER_STATE['fitness_context'] = fitness_context
+
+def _evaluate_chunk(population_chunk):
+    return calculate_population_fitness(population_chunk, _WORKER_STATE['fitness_context'])
+
+
+class ParallelFitnessEvaluator:
+    """
+    Mengevaluasi populasi terkode dengan membaginya menjadi beberapa chunk
+    yang diproses oleh ProcessPoolExecutor.
+
+    Args:
+        fitness_context (FitnessContext): Konteks fitness run ini (dikirim sekali ke setiap worker).
+        n_jobs (int): Jumlah proses worker (None = jumlah CPU).
+        chunks_per_job (int): Jumlah chunk per worker per generasi.
+    """
+
+    def __init__(self, fitness_context, n_jobs=None, chunks_per_job=1):
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.chunks_per_job = chunks_per_job
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.n_jobs,
+            mp_context=worker_mp_context(),
+            initializer=_init_worker,
+            initargs=(fitness_context,),
+        )
+
+    def evaluate(self, population):
+        num_chunks = min(len(population), self.n_jobs * self.chunks_per_job)
+        if num_chunks == 0:
+            return np.zeros(0)
+        chunks = np.array_split(population, num_chunks)
+        return np.concatenate(list(self.executor.map(_evaluate_chunk, chunks)))
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
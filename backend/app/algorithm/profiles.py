@@ -0,0 +1,264 @@
+# backend/app/algorithm/profiles.py
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from .chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS
+
+# Batas memori ProfileAccumulator untuk fitur numerik: frekuensi per nilai disimpan persis
+# selama jumlah nilai berbeda per (spesies, fitur) <= NUMERIC_EXACT_MAX_VALUES; setelah itu
+# diganti histogram NUMERIC_HISTOGRAM_BINS bin di rentang FEATURE_DETAILS.
+NUMERIC_EXACT_MAX_VALUES = 1024
+NUMERIC_HISTOGRAM_BINS = 1024
+
+
+def dataset_fingerprint(dataset_df):
+    """
+    Sidik jari (hash) isi DataFrame: nama kolom, dtype, dan nilai setiap baris.
+    Dua DataFrame dengan isi yang sama menghasilkan fingerprint yang sama.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr([(str(col), str(dtype)) for col, dtype in dataset_df.dtypes.items()]).encode())
+    hasher.update(pd.util.hash_pandas_object(dataset_df, index=False).to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+class SpeciesProfileIndex:
+    """
+    Profil fitur (median untuk numerik, modus untuk kategorikal) untuk SEMUA
+    Genus_&_Specie di dataset, dihitung sekali dengan groupby.
+    Hasilnya sama dengan fitness.get_target_profile, tetapi lookup per spesies O(1).
+
+    Args:
+        profiles (dict): {genus_specie: {nama_fitur: nilai}}.
+        fingerprint (str): dataset_fingerprint dari dataset asal profil.
+    """
+
+    def __init__(self, profiles, fingerprint):
+        self.profiles = profiles
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_dataframe(cls, dataset_df, numerical_feature_names, categorical_feature_names,
+                       label_col='Genus_&_Specie', fingerprint=None):
+        """Membangun index dari dataset dengan satu groupby untuk numerik dan satu untuk kategorikal."""
+        if fingerprint is None:
+            fingerprint = dataset_fingerprint(dataset_df)
+
+        # Kolom yang tidak ada di dataset dilewati (sama seperti get_target_profile)
+        numerical_cols = [f for f in FEATURE_ORDER if f in numerical_feature_names and f in dataset_df.columns]
+        categorical_cols = [f for f in FEATURE_ORDER if f in categorical_feature_names and f in dataset_df.columns]
+        labelled_df = dataset_df[dataset_df[label_col].notna()]
+
+        profiles = {species: {} for species in labelled_df[label_col].unique()}
+
+        if numerical_cols:
+            medians = labelled_df.groupby(label_col, observed=True, sort=False)[numerical_cols].median()
+            for species, row in medians.iterrows():
+                profiles[species].update({feature: float(row[feature]) for feature in numerical_cols})
+
+        if categorical_cols:
+            # Format panjang (spesies, fitur, nilai) agar semua fitur kategorikal dihitung dalam satu groupby.
+            long_df = labelled_df[[label_col] + categorical_cols].astype(object).melt(
+                id_vars=label_col, var_name='feature', value_name='value'
+            ).dropna(subset=['value'])
+            counts = long_df.groupby([label_col, 'feature', 'value'], sort=False).size().reset_index(name='count')
+            # Modus: frekuensi terbanyak; jika seri, nilai terkecil (sama seperti Series.mode()[0])
+            modes = counts.sort_values(
+                [label_col, 'feature', 'count', 'value'], ascending=[True, True, False, True]
+            ).drop_duplicates([label_col, 'feature'])
+            for species, feature, value in modes[[label_col, 'feature', 'value']].itertuples(index=False):
+                profiles[species][feature] = value
+
+        # Urutkan setiap profil mengikuti FEATURE_ORDER
+        ordered_profiles = {
+            species: {f: profile[f] for f in FEATURE_ORDER if f in profile}
+            for species, profile in profiles.items()
+        }
+        return cls(ordered_profiles, fingerprint)
+
+    def get(self, target_genus_specie):
+        """Profil untuk satu spesies, atau None jika spesies tidak ada di dataset."""
+        return self.profiles.get(target_genus_specie)
+
+    def species(self):
+        return list(self.profiles)
+
+    def __contains__(self, target_genus_specie):
+        return target_genus_specie in self.profiles
+
+    def __len__(self):
+        return len(self.profiles)
+
+
+class _NumericHistogram:
+    """
+    Histogram bin tetap untuk satu (spesies, fitur numerik). Nilai di luar rentang masuk bin
+    terluar; median diinterpolasi linear di dalam bin (galat paling besar satu lebar bin).
+    """
+
+    def __init__(self, low, high, bins=NUMERIC_HISTOGRAM_BINS):
+        self.low = float(low)
+        self.high = float(high)
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def copy(self):
+        clone = _NumericHistogram(self.low, self.high, len(self.counts))
+        clone.counts = self.counts.copy()
+        return clone
+
+    def add(self, values, counts):
+        width = (self.high - self.low) / len(self.counts)
+        positions = (np.asarray(values, dtype=np.float64) - self.low) / width if width > 0 else np.zeros(len(values))
+        positions = np.clip(np.floor(positions), 0, len(self.counts) - 1).astype(np.int64)
+        np.add.at(self.counts, positions, np.asarray(counts, dtype=np.int64))
+
+    def median(self):
+        cumulative = np.cumsum(self.counts)
+        half = cumulative[-1] / 2
+        position = int(np.searchsorted(cumulative, half)) # Bin pertama dengan frekuensi kumulatif >= setengah
+        before = cumulative[position] - self.counts[position]
+        fraction = (half - before) / self.counts[position]
+        return float(self.low + (position + fraction) * (self.high - self.low) / len(self.counts))
+
+
+class ProfileAccumulator:
+    """
+    Agregat profil spesies yang bisa diperbarui per chunk data (misal saat upload CSV):
+    frekuensi setiap nilai per (spesies, fitur). Median dan modus dihitung dari frekuensi
+    tersebut, sehingga hasilnya sama dengan SpeciesProfileIndex.from_dataframe pada
+    gabungan semua chunk, tanpa menyimpan baris-barisnya.
+    Fitur kategorikal selalu dihitung persis (memori sebanding dengan jumlah kategori).
+    Fitur numerik dihitung persis sampai NUMERIC_EXACT_MAX_VALUES nilai berbeda per spesies,
+    lalu beralih ke _NumericHistogram (median perkiraan), sehingga memori tetap terbatas.
+
+    Args:
+        numerical_feature_names (list): Fitur numerik (profil: median).
+        categorical_feature_names (list): Fitur kategorikal (profil: modus).
+        label_col (str): Kolom label spesies.
+    """
+
+    def __init__(self, numerical_feature_names, categorical_feature_names, label_col='Genus_&_Specie'):
+        self.numerical_feature_names = list(numerical_feature_names)
+        self.categorical_feature_names = list(categorical_feature_names)
+        self.label_col = label_col
+        self.species = {} # Spesies berlabel (dict sebagai set berurutan)
+        self.value_counts = {} # {(spesies, fitur): {nilai: frekuensi}}
+        self.numeric_histograms = {} # {(spesies, fitur numerik): _NumericHistogram} setelah melewati batas
+        self.num_rows = 0
+
+    def copy(self):
+        clone = ProfileAccumulator(self.numerical_feature_names, self.categorical_feature_names, self.label_col)
+        clone.species = dict(self.species)
+        clone.value_counts = {key: dict(counts) for key, counts in self.value_counts.items()}
+        clone.numeric_histograms = {key: histogram.copy() for key, histogram in self.numeric_histograms.items()}
+        clone.num_rows = self.num_rows
+        return clone
+
+    def update(self, chunk_df):
+        """Menambahkan satu chunk baris ke agregat (kolom fitur yang tidak ada dilewati)."""
+        labelled_df = chunk_df[chunk_df[self.label_col].notna()]
+        self.num_rows += len(labelled_df)
+        self.species.update(dict.fromkeys(labelled_df[self.label_col].unique()))
+        for feature in FEATURE_ORDER:
+            if feature not in labelled_df.columns or (
+                    feature not in self.numerical_feature_names and feature not in self.categorical_feature_names):
+                continue
+            counts = labelled_df.groupby([self.label_col, feature], observed=True, sort=False).size()
+            if feature in self.numerical_feature_names:
+                self._update_numeric(feature, counts)
+                continue
+            for (species, value), count in counts.items():
+                feature_counts = self.value_counts.setdefault((species, feature), {})
+                feature_counts[value] = feature_counts.get(value, 0) + int(count)
+
+    def _update_numeric(self, feature, counts):
+        """Menambahkan frekuensi satu fitur numerik; beralih ke histogram jika nilai berbeda melewati batas."""
+        for species, species_counts in counts.groupby(level=0, sort=False):
+            key = (species, feature)
+            values = species_counts.index.get_level_values(1)
+            histogram = self.numeric_histograms.get(key)
+            if histogram is not None:
+                histogram.add(values, species_counts.to_numpy())
+                continue
+            feature_counts = self.value_counts.setdefault(key, {})
+            for value, count in zip(values, species_counts.to_numpy()):
+                feature_counts[value] = feature_counts.get(value, 0) + int(count)
+            if len(feature_counts) > NUMERIC_EXACT_MAX_VALUES:
+                histogram = self.numeric_histograms[key] = _NumericHistogram(*FEATURE_DETAILS[feature]['range'])
+                histogram.add(list(feature_counts), list(feature_counts.values()))
+                del self.value_counts[key]
+
+    @staticmethod
+    def _median(counts):
+        """Median dari frekuensi nilai (rata-rata dua nilai tengah jika jumlahnya genap)."""
+        values = sorted(counts)
+        total = sum(counts.values())
+        lower_pos, upper_pos = (total - 1) // 2, total // 2
+        cumulative, lower = 0, None
+        for value in values:
+            cumulative += counts[value]
+            if lower is None and cumulative > lower_pos:
+                lower = value
+            if cumulative > upper_pos:
+                return (float(lower) + float(value)) / 2
+        return float(lower)
+
+    @staticmethod
+    def _mode(counts):
+        """Modus; jika seri, nilai terkecil (sama seperti Series.mode()[0])."""
+        return min(counts.items(), key=lambda item: (-item[1], item[0]))[0]
+
+    def to_index(self, fingerprint):
+        """SpeciesProfileIndex dari agregat saat ini."""
+        profiles = {}
+        for species in self.species:
+            profile = {}
+            for feature in FEATURE_ORDER:
+                histogram = self.numeric_histograms.get((species, feature))
+                if histogram is not None:
+                    profile[feature] = histogram.median()
+                    continue
+                counts = self.value_counts.get((species, feature))
+                if not counts:
+                    continue
+                if feature in self.numerical_feature_names:
+                    profile[feature] = self._median(counts)
+                else:
+                    profile[feature] = self._mode(counts)
+            profiles[species] = profile
+        return SpeciesProfileIndex(profiles, fingerprint)
+
+
+# Cache kecil index per objek DataFrame. Kuncinya identitas DataFrame (id + weakref), bukan
+# fingerprint isinya, sehingga hash O(baris) hanya dihitung sekali saat index dibangun dan
+# tidak di setiap panggilan. Seperti snapshot di DatasetStore, DataFrame yang diberikan ke GA
+# dianggap tidak diubah in-place; DataFrame baru (misal setelah upload) otomatis mendapat
+# index baru. Jalur API tidak memakai cache ini: index snapshot diberikan langsung.
+# Lock menjaga cache tetap konsisten saat beberapa run GA berjalan di thread berbeda.
+_PROFILE_INDEX_CACHE = OrderedDict() # {(id(df), kolom..., label): (weakref df, index)}
+_PROFILE_INDEX_CACHE_MAXSIZE = 4
+_PROFILE_INDEX_LOCK = threading.Lock()
+
+def get_profile_index(dataset_df, numerical_feature_names, categorical_feature_names,
+                      label_col='Genus_&_Specie'):
+    """Mengambil SpeciesProfileIndex untuk DataFrame ini dari cache, atau membangunnya."""
+    key = (id(dataset_df), tuple(numerical_feature_names), tuple(categorical_feature_names), label_col)
+    with _PROFILE_INDEX_LOCK:
+        cached = _PROFILE_INDEX_CACHE.get(key)
+        # id bisa dipakai ulang oleh objek lain setelah DataFrame lama dibuang
+        if cached is not None and cached[0]() is dataset_df:
+            _PROFILE_INDEX_CACHE.move_to_end(key)
+            return cached[1]
+
+        index = SpeciesProfileIndex.from_dataframe(
+            dataset_df, numerical_feature_names, categorical_feature_names, label_col
+        )
+        _PROFILE_INDEX_CACHE[key] = (weakref.ref(dataset_df), index)
+        _PROFILE_INDEX_CACHE.move_to_end(key)
+        while len(_PROFILE_INDEX_CACHE) > _PROFILE_INDEX_CACHE_MAXSIZE:
+            _PROFILE_INDEX_CACHE.popitem(last=False)
+        return index
@@ -1,16 +1,38 @@
 # backend/app/api.py
 
 import pandas as pd
+import asyncio
+import functools
 import io
+import hashlib
+import logging
+import time
 import numpy as np
-from fastapi import FastAPI, HTTPException, Form, UploadFile, File
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Literal, Optional
 import os
 import sys
-from .algorithm.chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS, user_input_to_chromosome
+from contextlib import asynccontextmanager
+from .algorithm.chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS, user_input_to_chromosome, decode_chromosome
 from .algorithm.ga_core         import GeneticAlgorithmFeatureSelection
+from .algorithm.island          import IslandModelGA
+from .algorithm.profiles        import SpeciesProfileIndex, ProfileAccumulator, dataset_fingerprint
+from .algorithm.classifier      import get_species_classifier
+from .algorithm.exact_solver    import SOLVER_GA, SOLVER_EXACT, STOP_EXACT_SOLUTION, exact_method_for, solve_exact
+from .preprocessing_data.dataset_cache import load_dataset_cached
+from .preprocessing_data.columns import normalize_feature_columns
+from .preprocessing_data.upload import CSVValidationError, AsyncStreamReader, ingest_csv_stream
+from .jobs import JobManager
+from .dataset_store import DatasetStore, DatasetSnapshot
+from .evolution_path import PATH_MODE_FULL, PATH_MODE_COLUMNAR, StreamingPathCompactor, compact_evolution_log
+from .recommendations import ParameterRecommendations
+from .result_cache import ResultCache, request_cache_key
+from .metrics import REGISTRY, CONTENT_TYPE_LATEST, Counter, Gauge, Histogram
 
 # --- Menambahkan Path untuk Impor Modul Lokal ---
 # Asumsi api.py ada di backend/app/
@@ -33,6 +55,22 @@ class GAParameters(BaseModel):
     num_generations: int = Field(20, gt=0)
     crossover_prob: float = Field(0.8, ge=0.0, le=1.0)
     mutation_prob: float = Field(0.05, ge=0.0, le=1.0)
+    seed: Optional[int] = Field(None, ge=0) # Jika diisi, run dapat direproduksi dan hasilnya di-cache
+    # Model pulau: num_islands > 1 menjalankan beberapa sub-populasi (population_size per pulau)
+    # di proses terpisah dengan migrasi individu terbaik
+    num_islands: int = Field(1, ge=1, le=64)
+    migration_interval: int = Field(5, ge=1)
+    migration_size: int = Field(2, ge=0)
+    migration_topology: Literal['ring', 'fully_connected'] = 'ring'
+    # Elitisme dan kriteria berhenti lebih awal (default: perilaku lama, tepat num_generations generasi)
+    elitism: int = Field(0, ge=0)
+    patience: Optional[int] = Field(None, ge=1) # Generasi tanpa perbaikan sebelum berhenti
+    target_fitness: Optional[float] = None
+    max_evaluations: Optional[int] = Field(None, gt=0)
+    max_time_seconds: Optional[float] = Field(None, gt=0)
+    # Bobot komponen classifier (peluang kromosom diklasifikasikan sebagai target);
+    # 0 = fitness kemiripan profil saja. Model di-fit sekali per dataset lalu di-cache.
+    classifier_weight: float = Field(0.0, ge=0.0, le=1.0)
     # Tambahkan parameter fitness jika perlu diatur dari frontend
     # misal: svm_kernel: str = 'rbf', svm_c: float = 1.0, penalty_factor: float = 0.01
 
@@ -40,24 +78,122 @@ class SimulationRequest(BaseModel):
     user_feature_inputs: Dict[str, Any] # Dict fitur dari pengguna
     ga_params: GAParameters
     target_genus_specie: str
+    # 'ga' (default), 'exact' (optimum global tanpa GA, error jika tidak tersedia),
+    # atau 'auto' (exact jika struktur fitness/ruang pencarian memungkinkan dan klien tidak
+    # mengirim field ga_params apa pun, selain itu GA)
+    solver: Literal['ga', 'exact', 'auto'] = 'ga'
+    # Format jejak evolusi: 'full' (satu langkah per generasi), 'changes' (hanya generasi yang
+    # kromosom terbaiknya berubah, fitur berupa delta dari langkah sebelumnya), atau
+    # 'columnar' (satu array per kolom di evolution_path_columns)
+    path_mode: Literal['full', 'changes', 'columnar'] = PATH_MODE_FULL
+    path_max_points: Optional[int] = Field(None, ge=2) # Downsampling jejak ke paling banyak sekian titik
+    # Isi field ga_params yang tidak dikirim dengan rekomendasi hasil tuning untuk target ini (jika ada).
+    # Harus diminta eksplisit agar hasil klien lama tidak berubah saat file rekomendasi ada.
+    use_recommended_params: bool = False
     # Tambahkan 'all_original_feature_names' jika ingin frontend mengirimkannya
     # Namun, ini lebih baik dikelola di backend berdasarkan FEATURE_ORDER
 
 class FeatureEvolutionStep(BaseModel):
     generation: int
     fitness: float
-    features: Dict[str, Any] # Kromosom terbaik generasi ini dalam format {nama_fitur: nilai}
+    # Kromosom terbaik generasi ini dalam format {nama_fitur: nilai};
+    # pada path_mode 'changes' hanya fitur yang berubah dari langkah sebelumnya
+    features: Dict[str, Any]
+    elapsed_seconds: Optional[float] = None # Waktu sejak GA dimulai (hanya diisi pada stream)
+
+class EvolutionPathColumns(BaseModel):
+    generation: List[int]
+    fitness: List[float]
+    features: Dict[str, List[Any]] # {nama_fitur: [nilai per langkah]}
 
 class SimulationResponse(BaseModel):
     message: str
     target_genus_specie: str
     final_best_fitness: float
     final_best_features: Dict[str, Any]
-    evolution_path: List[FeatureEvolutionStep] # Jejak evolusi
+    evolution_path: List[FeatureEvolutionStep] # Jejak evolusi (kosong pada path_mode 'columnar')
+    path_mode: str = PATH_MODE_FULL
+    evolution_path_columns: Optional[EvolutionPathColumns] = None # Hanya pada path_mode 'columnar'
     input_features_processed: Dict[str, Any]
+    solver_used: str = SOLVER_GA # 'ga' atau 'exact'
+    # max_generations | target_fitness | stagnation | max_evaluations | max_time | exact_solution
+    stop_reason: Optional[str] = None
+    num_evaluations: Optional[int] = None # Jumlah evaluasi fitness yang dilakukan GA
+    recommended_params_applied: Dict[str, Any] = {} # Field ga_params yang diisi dari rekomendasi tuning
+
+class StreamErrorEvent(BaseModel):
+    status_code: int
+    detail: str
+
+# --- Logging ---
+# GA_LOG_LEVEL (misal DEBUG untuk log per generasi, INFO untuk ringkasan run).
+# Jika tidak diisi, konfigurasi logging dibiarkan (uvicorn); log GA level INFO/DEBUG tidak tampil.
+if os.environ.get("GA_LOG_LEVEL"):
+    logging.basicConfig(level=os.environ["GA_LOG_LEVEL"].upper(),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+# --- Metrik (diekspor di /metrics) ---
+HTTP_REQUEST_SECONDS = Histogram(
+    'http_request_duration_seconds',
+    'Latensi request HTTP sampai header respons dikirim (untuk stream: sampai stream dimulai).',
+    ['method', 'route', 'status'],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge('http_requests_in_progress', 'Request HTTP yang sedang diproses.')
+RESULT_CACHE_LOOKUPS = Counter('ga_result_cache_lookups', 'Lookup result cache untuk request dengan seed.', ['result'])
+RESULT_CACHE_ENTRIES = Gauge('ga_result_cache_entries', 'Jumlah entri di result cache.')
+GA_PHASE_SECONDS = Histogram(
+    'ga_phase_duration_seconds', 'Durasi satu fase GA dalam satu generasi.', ['phase'],
+    buckets=(1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+GA_FITNESS_EVALUATIONS = Counter('ga_fitness_evaluations', 'Jumlah evaluasi fitness individu.')
+GA_GENERATIONS = Counter('ga_generations', 'Jumlah generasi GA yang selesai.')
+GA_RUNS = Counter('ga_runs', 'Jumlah run GA yang berakhir, per alasan berhenti.', ['stop_reason'])
+
+
+class GAMetricsRecorder:
+    """Pencatat metrik GA yang diberikan ke GA lewat argumen metrics (paket algorithm tidak bergantung pada /metrics)."""
+
+    def record_generation(self, phase_seconds, num_evaluations):
+        for phase, seconds in phase_seconds.items():
+            GA_PHASE_SECONDS.observe(seconds, phase=phase)
+        GA_FITNESS_EVALUATIONS.inc(num_evaluations)
+        GA_GENERATIONS.inc()
+
+    def record_run(self, stop_reason):
+        GA_RUNS.inc(stop_reason=stop_reason)
+
+
+ga_metrics = GAMetricsRecorder()
 
 # --- Inisialisasi Aplikasi FastAPI ---
-app = FastAPI(title="Evolution Simulation API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup: dataset + worker pool (start_job_manager); shutdown: hentikan job yang berjalan."""
+    start_job_manager()
+    try:
+        yield
+    finally:
+        shutdown_job_manager()
+
+app = FastAPI(title="Evolution Simulation API", lifespan=lifespan)
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    HTTP_REQUESTS_IN_PROGRESS.inc()
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        HTTP_REQUESTS_IN_PROGRESS.dec()
+        # Template route (misal /jobs/{job_id}) agar jumlah label tetap kecil
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - start,
+            method=request.method, route=getattr(route, "path", "unmatched"), status=status,
+        )
 
 # CORS Middleware (sesuaikan origins jika perlu)
 app.add_middleware(
@@ -70,8 +206,21 @@ app.add_middleware(
 
 # --- Memuat Dataset (idealnya dimuat sekali saat startup) ---
 DATASET_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "Evolution_DataSets.csv") # Path dari backend/app/api.py ke TUBES_KDS/data/
-evolution_df = None
 data_load_error = None
+# Snapshot dataset aktif (DataFrame, fingerprint, SpeciesProfileIndex semua spesies).
+# Setiap request memakai snapshot yang aktif saat request dimulai, tanpa menyalin DataFrame;
+# dataset baru (misal upload) dipasang sebagai versi baru tanpa mengganggu request yang berjalan.
+dataset_store = DatasetStore()
+# Folder model classifier (joblib) per fingerprint dataset
+CLASSIFIER_CACHE_DIR = os.environ.get(
+    "GA_CLASSIFIER_CACHE_DIR", os.path.join(os.path.dirname(DATASET_PATH), ".cache", "classifier")
+)
+
+# Rekomendasi GAParameters per spesies (python -m app.tuning); file tidak ada = tanpa rekomendasi
+RECOMMENDED_PARAMS_PATH = os.environ.get(
+    "GA_RECOMMENDED_PARAMS_PATH", os.path.join(os.path.dirname(DATASET_PATH), "ga_recommended_params.json")
+)
+recommended_params = ParameterRecommendations()
 
 # Identifikasi kolom numerik dan kategorikal asli berdasarkan FEATURE_DETAILS
 # Ini akan digunakan oleh fungsi fitness
@@ -80,9 +229,9 @@ ORIGINAL_NUMERICAL_COLS = [f for f in FEATURE_ORDER if FEATURE_DETAILS[f]['type'
 ORIGINAL_CATEGORICAL_COLS = [f for f in FEATURE_ORDER if FEATURE_DETAILS[f]['type'] == 'categorical']
 LABEL_COL_IN_DATASET = 'Genus_&_Specie' # Sesuai dokumen
 
-@app.on_event("startup")
-async def load_dataset():
-    global evolution_df, data_load_error
+def load_dataset_sync():
+    """Memuat dataset dan membangun profil spesies (dipakai saat startup dan di worker proses job)."""
+    global data_load_error
     try:
         # Pastikan path ini benar relatif terhadap lokasi di mana uvicorn dijalankan,
         # atau gunakan path absolut.
@@ -101,103 +250,654 @@ async def load_dataset():
             print(data_load_error)
             return
 
-        evolution_df = pd.read_csv(DATASET_PATH)
+        try:
+            # Cache kolumnar biner (mmap) dibangun sekali; dibangun ulang jika hash CSV berubah
+            evolution_df = load_dataset_cached(DATASET_PATH)
+        except (OSError, ValueError) as cache_error: # Misal folder data read-only, jatuh kembali ke CSV
+            print(f"Peringatan: cache dataset tidak dapat digunakan ({cache_error}), membaca CSV langsung.")
+            evolution_df = pd.read_csv(DATASET_PATH)
         # Basic cleaning (sesuai dokumen, data seharusnya sudah bersih)
         evolution_df.dropna(subset=[LABEL_COL_IN_DATASET], inplace=True) # Hapus baris jika labelnya NaN
+        # Nama kolom fitur dinormalisasi sekali di sini (misal 'Canine Size' -> 'Canine_Size'),
+        # sama seperti CSV upload, sehingga profil, fitness dan classifier memakai nama FEATURE_DETAILS
+        evolution_df = normalize_feature_columns(evolution_df, LABEL_COL_IN_DATASET)
         # Anda mungkin perlu cleaning lebih lanjut atau imputasi jika data tidak sebersih yang diharapkan
         # evolution_df.fillna(method='ffill', inplace=True) # Contoh imputasi sederhana
         print("Dataset Evolution_DataSets.csv berhasil dimuat.")
+
+        # Profil semua spesies dihitung sekali (groupby), dikunci dengan fingerprint dataset
+        dataset_fp = dataset_fingerprint(evolution_df)
+        profile_index = SpeciesProfileIndex.from_dataframe(
+            evolution_df, ORIGINAL_NUMERICAL_COLS, ORIGINAL_CATEGORICAL_COLS,
+            LABEL_COL_IN_DATASET, fingerprint=dataset_fp
+        )
+        snapshot = dataset_store.publish(evolution_df, dataset_fp, profile_index)
+        print(f"Profil {len(profile_index)} spesies dibangun (fingerprint dataset: {dataset_fp}, versi {snapshot.version}).")
     except Exception as e:
         data_load_error = f"Gagal memuat dataset Evolution_DataSets.csv: {str(e)}"
         print(data_load_error)
-        evolution_df = None
+
+
+
+def load_recommended_params():
+    """Memuat rekomendasi parameter GA dari RECOMMENDED_PARAMS_PATH (dipakai saat startup dan di worker proses)."""
+    global recommended_params
+    try:
+        recommended_params = ParameterRecommendations.load(RECOMMENDED_PARAMS_PATH)
+    except (OSError, ValueError) as e:
+        print(f"Peringatan: rekomendasi parameter GA tidak dapat dimuat ({e}).")
+        return
+    if len(recommended_params):
+        print(f"Rekomendasi parameter GA untuk {len(recommended_params)} spesies dimuat dari {RECOMMENDED_PARAMS_PATH}.")
+
+
+# --- Worker Pool untuk Simulasi ---
+# Simulasi GA bersifat CPU-bound, jadi tidak dijalankan langsung di event loop.
+# GA_JOB_EXECUTOR: 'thread' (default) atau 'process'; GA_JOB_WORKERS: ukuran pool.
+JOB_EXECUTOR_KIND = os.environ.get("GA_JOB_EXECUTOR", "thread")
+JOB_MAX_WORKERS = int(os.environ.get("GA_JOB_WORKERS", "0")) or None
+job_manager: Optional[JobManager] = None
+
+def _init_job_worker():
+    """Initializer worker proses: muat dataset sendiri jika belum diwarisi dari proses utama."""
+    if dataset_store.current() is None:
+        load_dataset_sync()
+    if not len(recommended_params):
+        load_recommended_params()
+
+def start_job_manager():
+    """Memuat dataset dan rekomendasi parameter, lalu membuat worker pool (saat startup)."""
+    global job_manager
+    load_dataset_sync()
+    load_recommended_params()
+    job_manager = JobManager(
+        executor_kind=JOB_EXECUTOR_KIND,
+        max_workers=JOB_MAX_WORKERS,
+        initializer=_init_job_worker if JOB_EXECUTOR_KIND == "process" else None,
+    )
+
+def shutdown_job_manager():
+    if job_manager is not None:
+        job_manager.shutdown()
+
+
+class DatasetUnavailableError(RuntimeError):
+    """Dataset atau komponen GA tidak tersedia, simulasi tidak bisa dijalankan."""
+
+class SimulationCancelledError(RuntimeError):
+    """Simulasi dihentikan karena job-nya dibatalkan."""
+
+
+def _current_snapshot():
+    """Snapshot dataset aktif; DatasetUnavailableError jika dataset belum/gagal dimuat."""
+    snapshot = dataset_store.current()
+    if snapshot is None:
+        raise DatasetUnavailableError(f"Dataset tidak bisa dimuat. Detail: {data_load_error}")
+    return snapshot
+
+
+def _with_recommended_params(request_data: SimulationRequest):
+    """
+    Request dengan field ga_params yang tidak dikirim klien diisi rekomendasi untuk targetnya.
+    Mengembalikan (request, {field: nilai yang diisi}); field yang dikirim klien tidak ditimpa.
+    """
+    if not request_data.use_recommended_params:
+        return request_data, {}
+    explicit = request_data.ga_params.model_fields_set
+    applied = {
+        name: value for name, value in recommended_params.params_for(request_data.target_genus_specie).items()
+        if name not in explicit
+    }
+    if not applied:
+        return request_data, {}
+    ga_params = GAParameters.model_validate({**request_data.ga_params.model_dump(exclude_unset=True), **applied})
+    return request_data.model_copy(update={"ga_params": ga_params}), applied
+
+
+def _prepare_simulation(request_data: SimulationRequest, cancel_event=None, snapshot=None):
+    """
+    Memvalidasi ketersediaan dataset dan menyiapkan GA untuk satu request.
+    snapshot: DatasetSnapshot yang dipakai request ini (hanya dibaca, tanpa salinan);
+    default snapshot aktif saat ini.
+    Mengembalikan (ga_simulator, user_params_for_fitness).
+    """
+    if snapshot is None:
+        snapshot = _current_snapshot()
+
+    if not FEATURE_ORDER or not GeneticAlgorithmFeatureSelection: # Cek lagi jika modul GA tidak terimpor
+        raise DatasetUnavailableError("Komponen Algoritma Genetik tidak terinisialisasi.")
+
+    # 1. Proses input pengguna menjadi format kromosom (jika ada fitur yang hilang, akan diisi acak)
+    # user_input_to_chromosome mengembalikan list, kita simpan juga dict aslinya untuk fitness
+    # Dengan seed, satu SeedSequence dipecah menjadi aliran acak terpisah untuk
+    # pengisian input pengguna dan untuk GA, sehingga seluruh run deterministik.
+    seed = request_data.ga_params.seed
+    input_rng, ga_seed = None, None
+    if seed is not None:
+        input_seed, ga_seed = np.random.SeedSequence(seed).spawn(2)
+        input_rng = np.random.default_rng(input_seed)
+    processed_user_input_list = user_input_to_chromosome(request_data.user_feature_inputs, rng=input_rng)
+    # Buat dict dari list yang sudah diproses untuk digunakan di fitness jika perlu
+    # atau gunakan request_data.user_feature_inputs langsung jika itu yang diinginkan fitness.
+    # Sesuai fitness.py terakhir, user_input_dict adalah parameter awal dari pengguna
+    # dan harus berupa dict {nama_fitur: nilai}
+    
+    # Pastikan semua fitur dalam FEATURE_ORDER ada di user_feature_inputs yang diproses
+    # untuk digunakan sebagai 'user_input_dict' dalam fitness
+    user_params_for_fitness = {
+        feature: processed_user_input_list[i] for i, feature in enumerate(FEATURE_ORDER)
+    }
+
+    # 2. Inisialisasi GA (model pulau jika num_islands > 1)
+    ga_params = request_data.ga_params
+    fitness_params, classifier = {}, None
+    if ga_params.classifier_weight > 0:
+        # Di-fit sekali per DataFrame (atau dimuat dari CLASSIFIER_CACHE_DIR). Kuncinya fingerprint
+        # DataFrame latih itu sendiri: upload hanya mengubah profil, baris upload tidak disimpan
+        classifier = get_species_classifier(
+            snapshot.dataset_df, LABEL_COL_IN_DATASET, snapshot.data_fingerprint, CLASSIFIER_CACHE_DIR
+        )
+        fitness_params = {'weights': {'classifier': ga_params.classifier_weight}}
+    island_kwargs = {}
+    ga_class = GeneticAlgorithmFeatureSelection
+    if ga_params.num_islands > 1:
+        ga_class = IslandModelGA
+        island_kwargs = dict(
+            num_islands=ga_params.num_islands,
+            migration_interval=ga_params.migration_interval,
+            migration_size=ga_params.migration_size,
+            topology=ga_params.migration_topology,
+        )
+    ga_simulator = ga_class(
+        original_df=snapshot.dataframe(), # View tanpa salinan data; GA hanya membaca dataset
+        label_col=LABEL_COL_IN_DATASET,
+        all_original_feature_names=list(FEATURE_ORDER), # list() untuk memastikan
+        numerical_cols_original=ORIGINAL_NUMERICAL_COLS,
+        categorical_cols_original=ORIGINAL_CATEGORICAL_COLS,
+        population_size=request_data.ga_params.population_size,
+        num_generations=request_data.ga_params.num_generations,
+        crossover_prob=request_data.ga_params.crossover_prob,
+        mutation_prob=request_data.ga_params.mutation_prob,
+        target_genus_specie_for_ga=request_data.target_genus_specie,
+        initial_user_params_for_ga=user_params_for_fitness,
+        fitness_params=fitness_params,
+        seed=ga_seed,
+        profile_index=snapshot.profile_index,
+        classifier=classifier,
+        elitism=ga_params.elitism,
+        patience=ga_params.patience,
+        target_fitness=ga_params.target_fitness,
+        max_evaluations=ga_params.max_evaluations,
+        max_time_seconds=ga_params.max_time_seconds,
+        cancel_event=cancel_event,
+        metrics=ga_metrics,
+        **island_kwargs
+    )
+
+    return ga_simulator, user_params_for_fitness
+
+
+def _features_dict(chromosome_codes) -> Dict[str, Any]:
+    """Kromosom terkode dari GA -> {nama_fitur: nilai} dengan nama kategori."""
+    return dict(zip(FEATURE_ORDER, decode_chromosome(chromosome_codes)))
+
+
+def _evolution_path_fields(request_data: SimulationRequest, evolution_log) -> Dict[str, Any]:
+    """Field jejak evolusi SimulationResponse sesuai path_mode dan path_max_points request."""
+    path = compact_evolution_log(evolution_log, request_data.path_mode, request_data.path_max_points)
+    if request_data.path_mode == PATH_MODE_COLUMNAR:
+        return {'evolution_path': [], 'evolution_path_columns': path, 'path_mode': request_data.path_mode}
+    return {'evolution_path': path, 'path_mode': request_data.path_mode}
+
+
+def _json_bytes(model: BaseModel) -> bytes:
+    """Model -> JSON (bytes) dengan orjson; NaN/inf ditulis sebagai null seperti pydantic."""
+    return orjson.dumps(model.model_dump(), option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Respons JSON yang diserialisasi langsung dengan orjson. Mengembalikan Response
+    melewati validasi ulang response_model dan jsonable_encoder FastAPI, yang pada
+    evolution_path panjang jauh lebih lambat daripada serialisasinya sendiri.
+    """
+    return Response(content=_json_bytes(model), media_type="application/json")
+
+
+def _run_exact_solver(request_data: SimulationRequest, ga_simulator, user_params_for_fitness,
+                      recommended_params_applied=None) -> Optional[SimulationResponse]:
+    """
+    Menjawab request dengan solver eksak jika diminta (solver 'exact'/'auto') dan tersedia.
+    Pada 'auto', solver eksak hanya dipakai jika klien tidak mengirim field ga_params apa pun
+    (field yang diisi dari rekomendasi tidak dihitung), agar parameter GA klien tidak diabaikan.
+    Mengembalikan None jika GA yang harus dipakai; ValueError jika 'exact' diminta tetapi tidak tersedia.
+    """
+    if request_data.solver == SOLVER_GA:
+        return None
+    client_ga_params = request_data.ga_params.model_fields_set - set(recommended_params_applied or {})
+    if request_data.solver != SOLVER_EXACT and client_ga_params:
+        return None
+    fitness_context = ga_simulator._build_fitness_context()
+    method = exact_method_for(fitness_context)
+    if method is None:
+        if request_data.solver == SOLVER_EXACT:
+            raise ValueError("Solver 'exact' tidak tersedia untuk request ini; gunakan 'ga' atau 'auto'.")
+        return None
+
+    best_chromosome, best_fitness, _ = solve_exact(fitness_context, method)
+    best_features = _features_dict(best_chromosome)
+    return SimulationResponse(
+        message="Simulasi evolusi berhasil diselesaikan (solver eksak).",
+        target_genus_specie=request_data.target_genus_specie,
+        final_best_fitness=best_fitness,
+        final_best_features=best_features,
+        # Tidak ada generasi; jejak berisi satu langkah (generasi 0) yaitu optimum global
+        **_evolution_path_fields(request_data, [(0, best_fitness, best_chromosome)]),
+        input_features_processed=user_params_for_fitness,
+        solver_used=SOLVER_EXACT,
+        stop_reason=STOP_EXACT_SOLUTION
+    )
+
+
+def run_simulation(request_data: SimulationRequest, cancel_event=None, snapshot=None) -> SimulationResponse:
+    """
+    Menjalankan satu simulasi GA secara sinkron (dipanggil dari worker pool).
+    snapshot: DatasetSnapshot yang dipakai; default snapshot aktif di proses ini.
+    Melempar DatasetUnavailableError jika dataset tidak tersedia dan ValueError untuk input tidak valid.
+    """
+    request_data, applied_params = _with_recommended_params(request_data)
+    ga_simulator, user_params_for_fitness = _prepare_simulation(request_data, cancel_event, snapshot)
+
+    exact_response = _run_exact_solver(request_data, ga_simulator, user_params_for_fitness, applied_params)
+    if exact_response is not None:
+        return exact_response
+
+    # 3. Jalankan GA
+    # Modifikasi ga_core.run() agar menerima target_genus_specie dan user_input_dict jika belum
+    # Atau, jika GA secara internal sudah diset untuk ini.
+    # Untuk sekarang, kita asumsikan ga_core.run() tidak butuh argumen tambahan ini secara langsung
+    # karena sudah di-pass saat inisialisasi atau diambil dari self.
+    # Namun, fungsi calculate_combined_fitness di dalam GA akan butuh argumen ini.
+    # Cara paling bersih adalah memodifikasi ga_core agar bisa menyimpan/menerima ini.
+    
+    # Asumsi ga_core.run() sudah dimodifikasi untuk mengambil `target_genus_specie` dan `user_input_dict`
+    # dari `self` (yang di-set saat `__init__`) atau menerimanya sebagai argumen `run`.
+    # Kita akan mengasumsikan ini sudah di-set saat inisialisasi `ga_simulator`.
+
+    best_chromosome_list, best_fitness, _, evolution_log_tuples = ga_simulator.run()
+    if cancel_event is not None and cancel_event.is_set():
+        raise SimulationCancelledError("Simulasi dibatalkan sebelum selesai.")
+    # evolution_log_tuples adalah list of tuples (generation, fitness, best_chromosome_for_gen)
+    # Kromosom dari GA masih terkode (kode kategori), di-decode di sini menjadi nama kategori.
+
+    # 4. Format hasil
+    final_best_features_dict = _features_dict(best_chromosome_list)
+
+    return SimulationResponse(
+        message="Simulasi evolusi berhasil diselesaikan.",
+        target_genus_specie=request_data.target_genus_specie,
+        final_best_fitness=best_fitness,
+        final_best_features=final_best_features_dict,
+        **_evolution_path_fields(request_data, evolution_log_tuples),
+        input_features_processed=user_params_for_fitness,
+        stop_reason=ga_simulator.stop_reason,
+        num_evaluations=ga_simulator.num_evaluations,
+        recommended_params_applied=applied_params
+    )
+
+
+def _run_simulation_in_process(snapshot_version, fingerprint, profile_index, request_data):
+    """
+    Fungsi job di worker proses. Snapshot proses utama dikirim eksplisit (versi, fingerprint,
+    profil spesies) karena upload hanya dipasang di DatasetStore proses utama. DataFrame tidak
+    dikirim: diambil dari dataset yang dimuat worker sendiri, karena upload hanya mengubah profil.
+    """
+    snapshot = _current_snapshot()
+    if snapshot.fingerprint != fingerprint:
+        snapshot = DatasetSnapshot(
+            snapshot_version, snapshot.dataset_df, fingerprint, profile_index,
+            data_fingerprint=snapshot.data_fingerprint,
+        )
+    return run_simulation(request_data, snapshot=snapshot)
+
+
+def _simulation_task(snapshot):
+    """
+    Fungsi job run_simulation untuk snapshot ini. Pada worker thread snapshot dibagikan
+    langsung (zero-copy); ke worker proses hanya versi, fingerprint dan profilnya yang
+    dikirim, karena mengirim DataFrame ke proses lain berarti menyalinnya.
+    """
+    if job_manager.executor_kind == "thread":
+        return functools.partial(run_simulation, snapshot=snapshot)
+    return functools.partial(
+        _run_simulation_in_process, snapshot.version, snapshot.fingerprint, snapshot.profile_index
+    )
+
+
+def _simulation_http_error(e: Exception) -> HTTPException:
+    """Memetakan error dari run_simulation ke HTTPException."""
+    if isinstance(e, DatasetUnavailableError):
+        return HTTPException(status_code=500, detail=f"Kesalahan internal server: {str(e)}")
+    if isinstance(e, ImportError): # Menangkap error impor modul GA jika terjadi di sini
+        return HTTPException(status_code=500, detail=f"Kesalahan impor modul internal: {str(e)}")
+    if isinstance(e, ValueError): # Misal error dari Pydantic atau konversi data
+        return HTTPException(status_code=400, detail=f"Input tidak valid: {str(e)}")
+    # Tangkap error spesifik lainnya jika perlu
+    import traceback
+    traceback.print_exception(e) # Untuk debugging di server
+    return HTTPException(status_code=500, detail=f"Terjadi kesalahan internal server: {str(e)}")
+
+
+# --- Cache Hasil untuk Request dengan Seed ---
+# GA_RESULT_CACHE_SIZE: jumlah entri (0 = nonaktif); GA_RESULT_CACHE_TTL: umur entri dalam detik.
+result_cache = ResultCache(
+    maxsize=int(os.environ.get("GA_RESULT_CACHE_SIZE", "256")),
+    ttl_seconds=float(os.environ.get("GA_RESULT_CACHE_TTL", "3600")),
+)
+
+def _result_cache_key(request_data: SimulationRequest, snapshot) -> Optional[str]:
+    """Kunci cache untuk request ini, atau None jika request tidak boleh di-cache (tanpa seed)."""
+    if request_data.ga_params.seed is None:
+        return None
+    # Parameter efektif (setelah rekomendasi) yang menentukan hasil, bukan hanya yang dikirim klien
+    request_data, _ = _with_recommended_params(request_data)
+    return request_cache_key(request_data.model_dump(mode="json"), snapshot.fingerprint)
+
+
+async def _simulate_cached(request_data: SimulationRequest, snapshot=None) -> SimulationResponse:
+    """
+    Menjalankan simulasi di worker pool, memakai result_cache untuk request dengan seed.
+    snapshot: DatasetSnapshot yang dipakai (default snapshot aktif saat request masuk).
+    """
+    if snapshot is None:
+        snapshot = _current_snapshot()
+    cache_key = _result_cache_key(request_data, snapshot)
+    if cache_key is not None:
+        cached_response = result_cache.get(cache_key)
+        RESULT_CACHE_LOOKUPS.inc(result="hit" if cached_response is not None else "miss")
+        if cached_response is not None:
+            return cached_response
+
+    # Dijalankan di worker pool agar event loop tetap melayani request lain
+    response = await job_manager.run(_simulation_task(snapshot), request_data)
+
+    if cache_key is not None:
+        result_cache.put(cache_key, response)
+    return response
+
 
 # --- Endpoint API ---
 @app.post("/simulate_evolution", response_model=SimulationResponse)
 async def simulate_evolution_endpoint(request_data: SimulationRequest):
-    global evolution_df, data_load_error
+    try:
+        return _json_response(await _simulate_cached(request_data))
+    except Exception as e:
+        raise _simulation_http_error(e)
 
-    if data_load_error or evolution_df is None:
-        raise HTTPException(status_code=500, detail=f"Kesalahan internal server: Dataset tidak bisa dimuat. Detail: {data_load_error}")
 
-    if not FEATURE_ORDER or not GeneticAlgorithmFeatureSelection: # Cek lagi jika modul GA tidak terimpor
-        raise HTTPException(status_code=500, detail="Kesalahan internal server: Komponen Algoritma Genetik tidak terinisialisasi.")
+# --- Endpoint Batch ---
+MAX_BATCH_SIZE = int(os.environ.get("GA_MAX_BATCH_SIZE", "100"))
+
+class BatchSimulationRequest(BaseModel):
+    requests: List[SimulationRequest] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+    stream: bool = False # True: hasil dikirim sebagai NDJSON segera setelah masing-masing selesai
+
+class BatchItemResult(BaseModel):
+    index: int # Posisi request di BatchSimulationRequest.requests
+    status: str # completed | failed
+    result: Optional[SimulationResponse] = None
+    status_code: Optional[int] = None # Kode HTTP yang setara jika gagal
+    error: Optional[str] = None
+
+class BatchSimulationResponse(BaseModel):
+    results: List[BatchItemResult] # Urutan sama dengan request
 
+async def _run_batch_item(index: int, request_data: SimulationRequest, snapshot) -> BatchItemResult:
+    """Satu item batch; kegagalan satu item tidak menggagalkan item lain."""
     try:
-        # 1. Proses input pengguna menjadi format kromosom (jika ada fitur yang hilang, akan diisi acak)
-        # user_input_to_chromosome mengembalikan list, kita simpan juga dict aslinya untuk fitness
-        processed_user_input_list = user_input_to_chromosome(request_data.user_feature_inputs)
-        # Buat dict dari list yang sudah diproses untuk digunakan di fitness jika perlu
-        # atau gunakan request_data.user_feature_inputs langsung jika itu yang diinginkan fitness.
-        # Sesuai fitness.py terakhir, user_input_dict adalah parameter awal dari pengguna
-        # dan harus berupa dict {nama_fitur: nilai}
-        
-        # Pastikan semua fitur dalam FEATURE_ORDER ada di user_feature_inputs yang diproses
-        # untuk digunakan sebagai 'user_input_dict' dalam fitness
-        user_params_for_fitness = {
-            feature: processed_user_input_list[i] for i, feature in enumerate(FEATURE_ORDER)
-        }
-
-        # 2. Inisialisasi GA
-        ga_simulator = GeneticAlgorithmFeatureSelection(
-            original_df=evolution_df.copy(), # Berikan salinan bersih
-            label_col=LABEL_COL_IN_DATASET,
-            all_original_feature_names=list(FEATURE_ORDER), # list() untuk memastikan
-            numerical_cols_original=ORIGINAL_NUMERICAL_COLS,
-            categorical_cols_original=ORIGINAL_CATEGORICAL_COLS,
-            population_size=request_data.ga_params.population_size,
-            num_generations=request_data.ga_params.num_generations,
-            crossover_prob=request_data.ga_params.crossover_prob,
-            mutation_prob=request_data.ga_params.mutation_prob,
-            target_genus_specie_for_ga=request_data.target_genus_specie,
-            initial_user_params_for_ga=user_params_for_fitness,
-            fitness_params= {}
-        )
+        response = await _simulate_cached(request_data, snapshot)
+    except Exception as e:
+        http_error = _simulation_http_error(e)
+        return BatchItemResult(index=index, status="failed", status_code=http_error.status_code, error=http_error.detail)
+    return BatchItemResult(index=index, status="completed", result=response)
 
-        # 3. Jalankan GA
-        # Modifikasi ga_core.run() agar menerima target_genus_specie dan user_input_dict jika belum
-        # Atau, jika GA secara internal sudah diset untuk ini.
-        # Untuk sekarang, kita asumsikan ga_core.run() tidak butuh argumen tambahan ini secara langsung
-        # karena sudah di-pass saat inisialisasi atau diambil dari self.
-        # Namun, fungsi calculate_combined_fitness di dalam GA akan butuh argumen ini.
-        # Cara paling bersih adalah memodifikasi ga_core agar bisa menyimpan/menerima ini.
-        
-        # Asumsi ga_core.run() sudah dimodifikasi untuk mengambil `target_genus_specie` dan `user_input_dict`
-        # dari `self` (yang di-set saat `__init__`) atau menerimanya sebagai argumen `run`.
-        # Kita akan mengasumsikan ini sudah di-set saat inisialisasi `ga_simulator`.
+async def _stream_batch_results(tasks):
+    """NDJSON: satu baris BatchItemResult per item, dalam urutan selesai."""
+    try:
+        for finished in asyncio.as_completed(tasks):
+            item = await finished
+            yield _json_bytes(item) + b"\n"
+    finally:
+        for task in tasks: # Klien memutus koneksi: item yang belum mulai dibatalkan
+            task.cancel()
+
+@app.post("/simulate_evolution/batch", response_model=BatchSimulationResponse)
+async def simulate_evolution_batch_endpoint(batch_request: BatchSimulationRequest):
+    """
+    Menjalankan banyak SimulationRequest sekaligus di worker pool terhadap satu snapshot
+    dataset dan profile_index yang sama. Tanpa stream, hasil dikembalikan sesuai urutan request;
+    dengan stream=true, setiap hasil dikirim (NDJSON) begitu selesai, lengkap dengan index-nya.
+    """
+    try:
+        snapshot = _current_snapshot() # Satu snapshot untuk seluruh batch
+    except DatasetUnavailableError as e:
+        raise _simulation_http_error(e)
 
-        best_chromosome_list, best_fitness, _, evolution_log_tuples = ga_simulator.run()
-        # evolution_log_tuples adalah list of tuples (generation, fitness, best_chromosome_list_for_gen)
+    tasks = [
+        asyncio.ensure_future(_run_batch_item(index, request_data, snapshot))
+        for index, request_data in enumerate(batch_request.requests)
+    ]
+    if batch_request.stream:
+        return StreamingResponse(_stream_batch_results(tasks), media_type="application/x-ndjson")
+    return _json_response(BatchSimulationResponse(results=await asyncio.gather(*tasks)))
 
-        # 4. Format hasil
-        final_best_features_dict = {feature: best_chromosome_list[i] for i, feature in enumerate(FEATURE_ORDER)}
-        
-        evolution_path_formatted: List[FeatureEvolutionStep] = []
-        for gen_data in evolution_log_tuples:
-            gen_num, fit_val, chromo_list = gen_data
-            chromo_dict = {feature: chromo_list[i] for i, feature in enumerate(FEATURE_ORDER)}
-            evolution_path_formatted.append(
-                FeatureEvolutionStep(generation=gen_num, fitness=fit_val, features=chromo_dict)
-            )
-
-        return SimulationResponse(
+
+# --- Endpoint Streaming (Server-Sent Events) ---
+def _sse_event(event: str, payload: BaseModel) -> str:
+    return f"event: {event}\ndata: {_json_bytes(payload).decode()}\n\n"
+
+def _stream_simulation_events(ga_simulator, request_data: SimulationRequest, user_params_for_fitness,
+                              recommended_params_applied=None):
+    """
+    Generator sinkron event SSE: satu event 'generation' per generasi, lalu satu event 'result'
+    (atau 'error'). Log konvergensi tidak disimpan; setiap update langsung dikirim lalu dilepas.
+    Jika klien memutus koneksi, generator ditutup dan GA berhenti bersama sumber dayanya.
+    """
+    try:
+        exact_response = _run_exact_solver(
+            request_data, ga_simulator, user_params_for_fitness, recommended_params_applied
+        )
+    except Exception as e:
+        http_error = _simulation_http_error(e)
+        yield _sse_event("error", StreamErrorEvent(status_code=http_error.status_code, detail=http_error.detail))
+        return
+    if exact_response is not None:
+        # Solver eksak: satu event 'generation' (generasi 0) lalu hasil akhir
+        yield _sse_event("generation", FeatureEvolutionStep(
+            generation=0, fitness=exact_response.final_best_fitness, features=exact_response.final_best_features,
+        ))
+        yield _sse_event("result", exact_response.model_copy(
+            update={"evolution_path": [], "evolution_path_columns": None, "path_mode": PATH_MODE_FULL}
+        ))
+        return
+
+    # path_mode/path_max_points berlaku untuk event 'generation' seperti untuk evolution_path
+    compactor = StreamingPathCompactor(request_data.path_mode, request_data.path_max_points, ga_simulator.num_generations)
+    generations = ga_simulator.iter_generations(keep_log=False)
+    try:
+        for update in generations:
+            # Sama seperti evolution_path: kromosom terbaik di generasi ini
+            for step in compactor.push(update['generation'], update['generation_best_fitness'],
+                                       update['generation_best_chromosome'], elapsed_seconds=update['elapsed_seconds']):
+                yield _sse_event("generation", FeatureEvolutionStep(**step))
+        for step in compactor.finish():
+            yield _sse_event("generation", FeatureEvolutionStep(**step))
+        yield _sse_event("result", SimulationResponse(
             message="Simulasi evolusi berhasil diselesaikan.",
             target_genus_specie=request_data.target_genus_specie,
-            final_best_fitness=best_fitness,
-            final_best_features=final_best_features_dict,
-            evolution_path=evolution_path_formatted,
-            input_features_processed=user_params_for_fitness
-        )
+            final_best_fitness=ga_simulator.best_fitness_overall,
+            final_best_features=_features_dict(ga_simulator.best_chromosome_overall),
+            evolution_path=[], # Sudah dikirim per generasi lewat event 'generation'
+            path_mode=request_data.path_mode,
+            input_features_processed=user_params_for_fitness,
+            stop_reason=ga_simulator.stop_reason,
+            num_evaluations=ga_simulator.num_evaluations,
+            recommended_params_applied=recommended_params_applied or {}
+        ))
+    except Exception as e:
+        http_error = _simulation_http_error(e)
+        yield _sse_event("error", StreamErrorEvent(status_code=http_error.status_code, detail=http_error.detail))
+    finally:
+        generations.close()
 
-    except ImportError as e: # Menangkap error impor modul GA jika terjadi di sini
-        raise HTTPException(status_code=500, detail=f"Kesalahan impor modul internal: {str(e)}")
-    except ValueError as ve: # Misal error dari Pydantic atau konversi data
-        raise HTTPException(status_code=400, detail=f"Input tidak valid: {str(ve)}")
+@app.post("/simulate_evolution/stream")
+async def simulate_evolution_stream_endpoint(request_data: SimulationRequest):
+    """
+    Seperti /simulate_evolution, tetapi setiap generasi dikirim segera sebagai event SSE
+    (text/event-stream). Persiapan GA (bisa mencakup fit classifier) dan generator sinkron
+    sama-sama dijalankan di threadpool Starlette, jadi tidak memblokir event loop; stream ini
+    tidak melewati job_manager. path_mode 'changes' hanya mengirim generasi yang kromosom
+    terbaiknya berubah (fitur berupa delta), dan path_max_points membatasi jumlah event
+    'generation' (lihat StreamingPathCompactor).
+    """
+    try:
+        request_data, applied_params = _with_recommended_params(request_data)
+        ga_simulator, user_params_for_fitness = await run_in_threadpool(_prepare_simulation, request_data)
     except Exception as e:
-        # Tangkap error spesifik lainnya jika perlu
-        import traceback
-        traceback.print_exc() # Untuk debugging di server
-        raise HTTPException(status_code=500, detail=f"Terjadi kesalahan internal server: {str(e)}")
+        raise _simulation_http_error(e)
+    return StreamingResponse(
+        _stream_simulation_events(ga_simulator, request_data, user_params_for_fitness, applied_params),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# --- Endpoint Job Asinkron ---
+class JobSubmitResponse(BaseModel):
+    job_id: str
+    status: str
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: str # pending | running | completed | failed | cancelled
+    created_at: float
+    finished_at: Optional[float] = None
+    result: Optional[SimulationResponse] = None
+    error: Optional[str] = None
+
+def _job_status_response(job) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job.job_id, status=job.status,
+        created_at=job.created_at, finished_at=job.finished_at,
+        result=job.result, error=job.error,
+    )
+
+@app.post("/jobs", response_model=JobSubmitResponse, status_code=202)
+async def submit_job(request_data: SimulationRequest):
+    try:
+        snapshot = _current_snapshot()
+    except DatasetUnavailableError as e:
+        raise _simulation_http_error(e)
+    job_id = job_manager.submit(_simulation_task(snapshot), request_data)
+    return JobSubmitResponse(job_id=job_id, status=job_manager.get(job_id).status)
+
+@app.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' tidak ditemukan.")
+    return _json_response(_job_status_response(job))
+
+@app.delete("/jobs/{job_id}", response_model=JobStatusResponse)
+async def delete_job(job_id: str):
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' tidak ditemukan.")
+    return _job_status_response(job)
+
+
+# --- Endpoint Upload Dataset ---
+# Body request adalah isi CSV mentah (bukan multipart), dengan mode dan strict sebagai query:
+#   curl -X POST 'http://localhost:8000/datasets/upload?mode=append' \
+#        -H 'Content-Type: text/csv' --data-binary @data.csv
+# Body dibaca langsung dari request.stream() dan di-parse per chunk selama diterima; hanya
+# agregat profil (frekuensi nilai per spesies) yang disimpan, sehingga upload ratusan MB
+# berjalan dengan memori terbatas. Setelah seluruh file valid diproses, profilnya dipasang
+# sebagai snapshot dataset baru; request yang sedang berjalan tetap memakai snapshot lama.
+# Catatan: baris upload tidak ditambahkan ke DataFrame snapshot (classifier tetap dilatih dari
+# dataset awal).
+DATASET_UPLOAD_ROWS = Counter('dataset_upload_rows', 'Jumlah baris CSV upload yang diproses.', ['result'])
+
+class DatasetUploadResponse(BaseModel):
+    message: str
+    mode: str
+    rows_total: int
+    rows_valid: int
+    rows_invalid: int
+    warnings: int # Nilai di luar kategori/rentang FEATURE_DETAILS (baris tetap dipakai kecuali strict)
+    errors: List[str] # Contoh baris yang ditolak
+    num_species: int
+    dataset_fingerprint: str
+
+def _ingest_upload(fileobj, mode: str, strict: bool) -> DatasetUploadResponse:
+    """Memproses CSV upload per chunk lalu memasang snapshot dataset baru (dipanggil di thread)."""
+    with dataset_store.update_lock: # Upload diproses satu per satu agar tidak ada yang hilang
+        current = _current_snapshot()
+        if mode == "append":
+            if current.profile_accumulator is not None:
+                accumulator = current.profile_accumulator.copy()
+            else: # Upload pertama: agregat dibangun dari dataset snapshot aktif
+                accumulator = ProfileAccumulator(ORIGINAL_NUMERICAL_COLS, ORIGINAL_CATEGORICAL_COLS, LABEL_COL_IN_DATASET)
+                accumulator.update(current.dataset_df)
+        else:
+            accumulator = ProfileAccumulator(ORIGINAL_NUMERICAL_COLS, ORIGINAL_CATEGORICAL_COLS, LABEL_COL_IN_DATASET)
+
+        report = ingest_csv_stream(fileobj, accumulator, strict=strict)
+        DATASET_UPLOAD_ROWS.inc(report['rows_valid'], result="valid")
+        DATASET_UPLOAD_ROWS.inc(report['rows_invalid'], result="invalid")
+        if report['rows_valid'] == 0:
+            raise CSVValidationError("Tidak ada baris valid di CSV upload; profil tidak diubah.")
+
+        # Fingerprint baru agar cache hasil tidak memakai profil sebelum upload; DataFrame (dan
+        # classifier yang dilatih darinya) tidak berubah, jadi data_fingerprint tetap
+        base_fp = current.fingerprint if mode == "append" else ""
+        new_fp = hashlib.blake2b(f"{base_fp}:{report['sha256']}".encode(), digest_size=16).hexdigest()
+        new_index = accumulator.to_index(new_fp)
+        dataset_store.publish(current.dataset_df, new_fp, new_index, accumulator, current.data_fingerprint)
+
+    return DatasetUploadResponse(
+        message=f"Dataset upload diproses ({report['bytes']} byte).",
+        mode=mode,
+        rows_total=report['rows_total'],
+        rows_valid=report['rows_valid'],
+        rows_invalid=report['rows_invalid'],
+        warnings=report['warnings'],
+        errors=report['errors'],
+        num_species=len(new_index),
+        dataset_fingerprint=new_fp,
+    )
+
+@app.post("/datasets/upload", response_model=DatasetUploadResponse)
+async def upload_dataset(
+    request: Request,
+    mode: Literal['append', 'replace'] = 'append', # append: tambah ke profil aktif; replace: profil hanya dari file ini
+    strict: bool = False,
+):
+    # Thread ingest menarik potongan body dari event loop ini sesuai kebutuhan parser
+    body = AsyncStreamReader(request.stream(), asyncio.get_running_loop())
+    try:
+        return await asyncio.to_thread(_ingest_upload, body, mode, strict)
+    except CSVValidationError as e:
+        raise HTTPException(status_code=422, detail=f"CSV tidak valid: {str(e)}")
+    except Exception as e:
+        raise _simulation_http_error(e)
+
+
+# --- Metrik Prometheus ---
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    RESULT_CACHE_ENTRIES.set(len(result_cache))
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
 
 
 # --- Untuk menjalankan dengan Uvicorn (misal dari direktori 'backend'): ---
@@ -0,0 +1,351 @@
+# backend/app/batch_runner.py
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pydantic import ValidationError
+from .algorithm.chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS
+from . import api
+
+# Runner batch offline: menjalankan banyak skenario GA (target x input pengguna x GAParameters)
+# di process pool tanpa HTTP, dengan run_simulation yang sama seperti /simulate_evolution
+# (hasil run dengan seed identik dengan hasil API). Setiap hasil langsung ditulis begitu
+# selesai (JSONL, atau Parquet per row group), jadi run semalaman bisa dipantau dan
+# --resume melanjutkan file JSONL yang terputus.
+#
+# File skenario:
+# - .jsonl : satu SimulationRequest per baris
+# - .json  : grid, misal
+#     {"targets": ["Australopithecus Afarensis", "hominino Orrorin tugenencin"],
+#      "user_inputs": [{}, {"Diet": "omnivore"}],
+#      "ga_params": [{"population_size": 50}, {"population_size": 200, "elitism": 2}],
+#      "seeds": [0, 1, 2],
+#      "path_mode": "changes"}
+#   Semua kombinasi targets x user_inputs x ga_params x seeds dijalankan; kunci lain
+#   (solver, path_mode, path_max_points) berlaku untuk semua skenario.
+#
+# Contoh (dari folder backend):
+#   python -m app.batch_runner scenarios.json --output results.jsonl --workers 8
+#   python -m app.batch_runner scenarios.json --output results.parquet
+
+OUTPUT_JSONL = 'jsonl'
+OUTPUT_PARQUET = 'parquet'
+PARQUET_ROW_GROUP_SIZE = 500
+PROGRESS_EVERY = 50 # Cetak progres setiap sekian skenario selesai
+GRID_KEYS = ('targets', 'user_inputs', 'ga_params', 'seeds')
+
+
+# --- Skenario ---
+
+def expand_grid(spec):
+    """Spesifikasi grid (dict) -> list dict SimulationRequest."""
+    if 'targets' not in spec or not spec['targets']:
+        raise ValueError("Grid skenario harus memiliki 'targets' (daftar target_genus_specie).")
+    common = {key: value for key, value in spec.items() if key not in GRID_KEYS}
+    seeds = spec.get('seeds') or [None]
+    scenarios = []
+    for target, user_inputs, ga_params, seed in itertools.product(
+            spec['targets'], spec.get('user_inputs') or [{}], spec.get('ga_params') or [{}], seeds):
+        if seed is not None:
+            ga_params = dict(ga_params, seed=seed)
+        scenarios.append(dict(common, target_genus_specie=target,
+                              user_feature_inputs=user_inputs, ga_params=ga_params))
+    return scenarios
+
+
+def load_scenarios(path):
+    """
+    Membaca dan memvalidasi file skenario (.json grid/list atau .jsonl).
+    ValueError menyebutkan skenario pertama yang tidak valid.
+    """
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            raw = [json.loads(line) for line in f if line.strip()]
+        else:
+            spec = json.load(f)
+            raw = spec if isinstance(spec, list) else expand_grid(spec)
+    scenarios = []
+    for index, scenario in enumerate(raw):
+        try:
+            scenarios.append(api.SimulationRequest.model_validate(scenario))
+        except ValidationError as e:
+            raise ValueError(f"Skenario {index} tidak valid: {e}") from e
+    return scenarios
+
+
+# --- Worker ---
+
+def run_scenario(index, request_data):
+    """Menjalankan satu skenario di worker proses; error dikembalikan sebagai record gagal."""
+    start, cpu_start = time.perf_counter(), time.process_time()
+    snapshot = api.dataset_store.current()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()): # Peringatan per run tidak mengotori log batch
+            response = api.run_simulation(request_data)
+        error = None
+    except Exception as e:
+        response, error = None, f"{type(e).__name__}: {e}"
+    return scenario_record(
+        index, request_data, response, error, time.perf_counter() - start,
+        snapshot.fingerprint if snapshot is not None else None, time.process_time() - cpu_start,
+    )
+
+
+def scenario_record(index, request_data, response, error, elapsed_seconds, dataset_fp, cpu_seconds=None):
+    """Satu baris hasil (datar: ga_<parameter> dan best_<fitur> per kolom)."""
+    record = {
+        'index': index,
+        'status': 'completed' if error is None else 'failed',
+        'error': error,
+        'target_genus_specie': request_data.target_genus_specie,
+        'solver': request_data.solver,
+        'user_feature_inputs': json.dumps(request_data.user_feature_inputs, sort_keys=True, ensure_ascii=False),
+        'dataset_fingerprint': dataset_fp,
+        'elapsed_seconds': elapsed_seconds,
+        'cpu_seconds': cpu_seconds, # CPU time proses worker selama run (dipakai app.tuning)
+    }
+    ga_params = request_data.ga_params.model_dump()
+    if response is not None:
+        ga_params.update(response.recommended_params_applied) # Parameter efektif setelah rekomendasi tuning
+    record.update({f'ga_{name}': value for name, value in ga_params.items()})
+    best_features = response.final_best_features if response is not None else {}
+    record.update({
+        'final_best_fitness': response.final_best_fitness if response is not None else None,
+        'solver_used': response.solver_used if response is not None else None,
+        'stop_reason': response.stop_reason if response is not None else None,
+        'num_evaluations': response.num_evaluations if response is not None else None,
+    })
+    record.update({f'best_{feature}': best_features.get(feature) for feature in FEATURE_ORDER})
+    record['evolution_path'] = None
+    if response is not None:
+        record['evolution_path'] = response.model_dump(
+            mode='json', include={'path_mode', 'evolution_path', 'evolution_path_columns'}
+        )
+    return record
+
+
+# --- Output ---
+
+def _truncate_partial_line(path):
+    """Membuang baris terakhir yang terpotong (run sebelumnya dihentikan saat menulis)."""
+    with open(path, 'rb+') as f:
+        data = f.read()
+        if data and not data.endswith(b'\n'):
+            f.truncate(data.rfind(b'\n') + 1)
+
+
+class JSONLWriter:
+    """Menulis record sebagai JSON Lines; setiap baris di-flush begitu ditulis."""
+
+    def __init__(self, path, include_path=False, append=False):
+        self.include_path = include_path
+        if append and os.path.exists(path):
+            _truncate_partial_line(path)
+        self.file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, record):
+        if not self.include_path:
+            record = {key: value for key, value in record.items() if key != 'evolution_path'}
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def _arrow_scalar_type(annotation):
+    """Tipe Python skalar dari anotasi field GAParameters (Optional/Literal diurai)."""
+    if typing.get_origin(annotation) is typing.Literal:
+        return type(typing.get_args(annotation)[0])
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    return _arrow_scalar_type(args[0]) if args else annotation
+
+
+def parquet_schema(include_path=False):
+    """Skema Arrow tetap, agar setiap row group punya tipe kolom yang sama walau banyak nilai None."""
+    import pyarrow as pa
+    python_types = {int: pa.int64(), float: pa.float64(), str: pa.string(), bool: pa.bool_()}
+    fields = [
+        ('index', pa.int64()), ('status', pa.string()), ('error', pa.string()),
+        ('target_genus_specie', pa.string()), ('solver', pa.string()),
+        ('user_feature_inputs', pa.string()), ('dataset_fingerprint', pa.string()),
+        ('elapsed_seconds', pa.float64()), ('cpu_seconds', pa.float64()),
+    ]
+    fields += [
+        (f'ga_{name}', python_types[_arrow_scalar_type(field.annotation)])
+        for name, field in api.GAParameters.model_fields.items()
+    ]
+    fields += [
+        ('final_best_fitness', pa.float64()), ('solver_used', pa.string()),
+        ('stop_reason', pa.string()), ('num_evaluations', pa.int64()),
+    ]
+    fields += [
+        (f'best_{feature}', pa.float64() if FEATURE_DETAILS[feature]['type'] == 'numerical' else pa.string())
+        for feature in FEATURE_ORDER
+    ]
+    if include_path:
+        fields.append(('evolution_path', pa.string())) # JSON
+    return pa.schema(fields)
+
+
+class ParquetWriter:
+    """Menulis record ke Parquet, satu row group setiap row_group_size record (butuh pyarrow)."""
+
+    def __init__(self, path, include_path=False, row_group_size=PARQUET_ROW_GROUP_SIZE):
+        import pyarrow.parquet as pq
+        self.include_path = include_path
+        self.schema = parquet_schema(include_path)
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.row_group_size = row_group_size
+        self.pending = []
+
+    def write(self, record):
+        record = dict(record)
+        path = record.pop('evolution_path')
+        if self.include_path:
+            record['evolution_path'] = json.dumps(path, ensure_ascii=False) if path is not None else None
+        self.pending.append(record)
+        if len(self.pending) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        import pyarrow as pa
+        if self.pending:
+            self.writer.write_table(pa.Table.from_pylist(self.pending, schema=self.schema))
+            self.pending = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def output_format_for(path, requested=None):
+    if requested:
+        return requested
+    return OUTPUT_PARQUET if path.endswith('.parquet') else OUTPUT_JSONL
+
+
+def completed_indices(path):
+    """Index skenario yang sudah tercatat 'completed' di file JSONL (untuk --resume)."""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue # Baris terakhir terpotong saat run sebelumnya dihentikan
+            if record.get('status') == 'completed':
+                done.add(record['index'])
+    return done
+
+
+# --- Eksekusi ---
+
+def init_worker():
+    """Initializer worker proses: dataset dimuat sekali per worker (atau diwarisi lewat fork)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        api._init_job_worker()
+
+
+def run_batch(scenarios, writer, workers=None, skip=(), max_in_flight=None):
+    """
+    Menjalankan skenario di ProcessPoolExecutor dan menulis setiap hasil begitu selesai.
+    Jumlah skenario yang sedang diantrekan dibatasi max_in_flight (default 2 x workers),
+    jadi memori tidak bertambah dengan jumlah skenario.
+
+    Returns:
+        dict: Ringkasan (total, completed, failed, skipped, seconds).
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    skip = {index for index in skip if 0 <= index < len(scenarios)}
+    summary = {'total': len(scenarios), 'completed': 0, 'failed': 0, 'skipped': len(skip)}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        in_flight = set()
+        for index, request_data in enumerate(scenarios):
+            if index in skip:
+                continue
+            in_flight.add(executor.submit(run_scenario, index, request_data))
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                _write_finished(done, writer, summary, start)
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            _write_finished(done, writer, summary, start)
+    summary['seconds'] = time.perf_counter() - start
+    return summary
+
+
+def _write_finished(futures, writer, summary, start):
+    for future in futures:
+        record = future.result()
+        writer.write(record)
+        summary[record['status']] += 1
+        finished = summary['completed'] + summary['failed']
+        if finished % PROGRESS_EVERY == 0:
+            rate = finished / (time.perf_counter() - start)
+            remaining = summary['total'] - summary['skipped']
+            print(f"[{finished}/{remaining}] {rate:.2f} skenario/s, {summary['failed']} gagal", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Menjalankan skenario GA secara batch (offline, tanpa HTTP).")
+    parser.add_argument('scenarios', help="File skenario (.json grid/list atau .jsonl SimulationRequest)")
+    parser.add_argument('--output', required=True, help="File hasil (.jsonl atau .parquet)")
+    parser.add_argument('--format', choices=[OUTPUT_JSONL, OUTPUT_PARQUET],
+                        help="Format output (default: dari ekstensi --output)")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses (default: jumlah CPU)")
+    parser.add_argument('--include-path', action='store_true', help="Sertakan jejak evolusi di setiap record")
+    parser.add_argument('--resume', action='store_true',
+                        help="Lewati skenario yang sudah 'completed' di file output JSONL dan tambahkan hasil baru")
+    args = parser.parse_args(argv)
+
+    output_format = output_format_for(args.output, args.format)
+    if args.resume and output_format != OUTPUT_JSONL:
+        parser.error("--resume hanya didukung untuk output JSONL.")
+    try:
+        scenarios = load_scenarios(args.scenarios)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    # Dimuat di proses utama agar dataset yang hilang terdeteksi sebelum pool dibuat;
+    # dengan start method fork, worker mewarisi snapshot ini tanpa memuat ulang.
+    with contextlib.redirect_stdout(sys.stderr):
+        api.load_dataset_sync()
+    if api.dataset_store.current() is None:
+        parser.error(f"Dataset tidak bisa dimuat: {api.data_load_error}")
+
+    skip = completed_indices(args.output) if args.resume else set()
+    if output_format == OUTPUT_PARQUET:
+        try:
+            writer = ParquetWriter(args.output, args.include_path)
+        except ImportError:
+            parser.error("Output Parquet membutuhkan pyarrow (pip install pyarrow); gunakan .jsonl jika tidak tersedia.")
+    else:
+        writer = JSONLWriter(args.output, args.include_path, append=args.resume)
+
+    print(f"{len(scenarios)} skenario ({len(skip)} dilewati), start method {multiprocessing.get_start_method()}.",
+          file=sys.stderr)
+    try:
+        summary = run_batch(scenarios, writer, args.workers, skip)
+    finally:
+        writer.close()
+    print(f"Selesai: {summary['completed']} berhasil, {summary['failed']} gagal, "
+          f"{summary['skipped']} dilewati dalam {summary['seconds']:.1f} s. Hasil: {args.output}", file=sys.stderr)
+    if summary['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
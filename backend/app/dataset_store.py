@@ -0,0 +1,75 @@
+# backend/app/dataset_store.py
+
+import threading
+import time
+
+# Snapshot dataset bersama untuk semua request yang sedang berjalan.
+# Setiap versi dataset (DataFrame, fingerprint, profil spesies) dibungkus satu
+# DatasetSnapshot yang tidak diubah setelah dibuat. Request mengambil referensi ke
+# snapshot aktif sekali di awal lalu memakainya sampai selesai, sehingga GA tidak
+# perlu menyalin DataFrame per request. Versi baru dipasang dengan DatasetStore.publish
+# (penggantian referensi tunggal, atomik); request lama tetap memegang versi lamanya.
+
+
+class DatasetSnapshot:
+    """
+    Satu versi dataset yang hanya-baca.
+
+    Args:
+        version (int): Nomor versi di DatasetStore (naik setiap publish).
+        dataset_df (pd.DataFrame): Dataset; tidak boleh diubah setelah snapshot dibuat.
+        fingerprint (str): Fingerprint isi dataset + profil (kunci cache hasil).
+        profile_index (SpeciesProfileIndex): Profil semua spesies untuk versi ini.
+        profile_accumulator (ProfileAccumulator, optional): Agregat profil untuk upload
+                                                            incremental berikutnya.
+        data_fingerprint (str, optional): Fingerprint dataset_df saja (kunci cache classifier yang
+                                          dilatih dari DataFrame ini); default sama dengan fingerprint.
+                                          Berbeda setelah upload, yang hanya mengubah profil.
+    """
+
+    __slots__ = ('version', 'dataset_df', 'fingerprint', 'profile_index', 'profile_accumulator',
+                 'data_fingerprint', 'created_at')
+
+    def __init__(self, version, dataset_df, fingerprint, profile_index, profile_accumulator=None,
+                 data_fingerprint=None):
+        for name, value in (('version', version), ('dataset_df', dataset_df), ('fingerprint', fingerprint),
+                            ('profile_index', profile_index), ('profile_accumulator', profile_accumulator),
+                            ('data_fingerprint', data_fingerprint or fingerprint), ('created_at', time.time())):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DatasetSnapshot tidak bisa diubah; publish versi baru lewat DatasetStore.")
+
+    def dataframe(self):
+        """
+        View dangkal dataset (tanpa menyalin data kolom). Dengan copy-on-write pandas,
+        perubahan pada view tidak pernah sampai ke snapshot.
+        """
+        return self.dataset_df.copy(deep=False)
+
+
+class DatasetStore:
+    """
+    Menyimpan snapshot dataset aktif. current() tanpa lock (membaca satu referensi);
+    publish() dan blok `with store.update_lock` dipakai untuk pembaruan read-modify-write
+    (misal upload append) agar tidak ada pembaruan yang hilang.
+    """
+
+    def __init__(self):
+        self._current = None
+        self._next_version = 1
+        self.update_lock = threading.RLock()
+
+    def current(self):
+        """Snapshot aktif, atau None jika belum ada dataset yang dimuat."""
+        return self._current
+
+    def publish(self, dataset_df, fingerprint, profile_index, profile_accumulator=None, data_fingerprint=None):
+        """Memasang versi dataset baru sebagai snapshot aktif dan mengembalikannya."""
+        with self.update_lock:
+            snapshot = DatasetSnapshot(
+                self._next_version, dataset_df, fingerprint, profile_index, profile_accumulator, data_fingerprint
+            )
+            self._next_version += 1
+            self._current = snapshot
+            return snapshot
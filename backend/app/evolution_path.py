@@ -0,0 +1,203 @@
+# backend/app/evolution_path.py
+
+import numpy as np
+from .algorithm.chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS, decode_chromosome, decode_gene
+
+# Pemadatan jejak evolusi (log konvergensi GA) untuk respons API.
+# Log berisi satu kromosom terbaik per generasi; pada run panjang sebagian besar generasi
+# mengulang kromosom yang sama. Mode:
+# - 'full'     : satu langkah per generasi dengan semua fitur (format lama)
+# - 'changes'  : hanya generasi yang kromosom terbaiknya berubah, dan fitur pada langkah
+#                berikutnya hanya yang berubah dari langkah sebelumnya (delta). Generasi
+#                terakhir selalu ikut, jadi jejak lengkap bisa dibangun ulang dengan forward-fill.
+# - 'columnar' : satu array per kolom (generation, fitness, dan per fitur) alih-alih
+#                satu dict per generasi.
+# Semua mode dapat di-downsample ke max_points titik. StreamingPathCompactor menerapkan
+# aturan yang sama untuk stream SSE, generasi demi generasi.
+
+PATH_MODE_FULL = 'full'
+PATH_MODE_CHANGES = 'changes'
+PATH_MODE_COLUMNAR = 'columnar'
+PATH_MODES = (PATH_MODE_FULL, PATH_MODE_CHANGES, PATH_MODE_COLUMNAR)
+
+
+def changed_mask(chromosomes):
+    """
+    Mask generasi yang kromosomnya berbeda dari generasi sebelumnya.
+    Generasi pertama dan terakhir selalu True.
+    """
+    changed = np.ones(len(chromosomes), dtype=bool)
+    if len(chromosomes) > 1:
+        changed[1:] = np.any(chromosomes[1:] != chromosomes[:-1], axis=1)
+        changed[-1] = True
+    return changed
+
+
+def downsample_indices(indices, fitness, max_points):
+    """
+    Memilih paling banyak max_points indeks: indeks pertama, terakhir, dan dari setiap
+    bucket di antaranya indeks dengan fitness tertinggi (puncak kurva tidak hilang).
+
+    Args:
+        indices (np.ndarray): Indeks kandidat (urut naik).
+        fitness (np.ndarray): Fitness semua generasi.
+        max_points (int): Jumlah titik maksimum (>= 2).
+    """
+    if max_points is None or len(indices) <= max_points:
+        return indices
+    chosen = [indices[0]]
+    for bucket in np.array_split(indices[1:-1], max_points - 2) if max_points > 2 else ():
+        if len(bucket):
+            chosen.append(bucket[np.argmax(fitness[bucket])])
+    chosen.append(indices[-1])
+    return np.asarray(chosen)
+
+
+def _decode_column(feature_name, codes):
+    """Satu kolom gen terkode -> list nilai (nama kategori untuk fitur kategorikal)."""
+    details = FEATURE_DETAILS[feature_name]
+    if details['type'] == 'numerical':
+        return codes.astype(np.float64).tolist()
+    categories = np.array(details['categories'] + [None], dtype=object)
+    codes = codes.astype(np.int64)
+    codes[(codes < 0) | (codes >= len(categories) - 1)] = len(categories) - 1 # Kode tidak dikenal -> None
+    return categories[codes].tolist()
+
+
+def compact_evolution_log(evolution_log, mode=PATH_MODE_FULL, max_points=None):
+    """
+    Memadatkan log konvergensi GA.
+
+    Args:
+        evolution_log (list): Tuple (generasi, fitness, kromosom_terkode) per generasi.
+        mode (str): Salah satu PATH_MODES.
+        max_points (int, optional): Jumlah titik maksimum setelah downsampling.
+
+    Returns:
+        list | dict: Untuk 'full'/'changes', list dict {generation, fitness, features};
+                     untuk 'columnar', dict {generation: [...], fitness: [...], features: {fitur: [...]}}.
+    """
+    if mode not in PATH_MODES:
+        raise ValueError(f"Mode jejak evolusi tidak dikenal: '{mode}'. Pilihan: {', '.join(PATH_MODES)}")
+    if not evolution_log:
+        return {'generation': [], 'fitness': [], 'features': {f: [] for f in FEATURE_ORDER}} \
+            if mode == PATH_MODE_COLUMNAR else []
+
+    generations = np.fromiter((entry[0] for entry in evolution_log), dtype=np.int64, count=len(evolution_log))
+    fitness = np.fromiter((entry[1] for entry in evolution_log), dtype=np.float64, count=len(evolution_log))
+    chromosomes = np.stack([np.asarray(entry[2]) for entry in evolution_log])
+
+    if mode == PATH_MODE_CHANGES:
+        indices = np.flatnonzero(changed_mask(chromosomes))
+    else:
+        indices = np.arange(len(evolution_log))
+    indices = downsample_indices(indices, fitness, max_points)
+
+    if mode == PATH_MODE_COLUMNAR:
+        return {
+            'generation': generations[indices].tolist(),
+            'fitness': fitness[indices].tolist(),
+            'features': {
+                feature_name: _decode_column(feature_name, chromosomes[indices, i])
+                for i, feature_name in enumerate(FEATURE_ORDER)
+            },
+        }
+
+    steps = []
+    previous = None
+    for index in indices:
+        chromosome = chromosomes[index]
+        steps.append(_path_step(generations[index], fitness[index], chromosome,
+                                previous if mode == PATH_MODE_CHANGES else None))
+        previous = chromosome
+    return steps
+
+
+def _path_step(generation, fitness, chromosome, previous=None):
+    """Satu langkah jejak; jika previous diberikan, fitur hanya yang berubah darinya (delta)."""
+    if previous is not None:
+        features = {
+            FEATURE_ORDER[i]: decode_gene(FEATURE_ORDER[i], chromosome[i])
+            for i in np.flatnonzero(chromosome != previous)
+        }
+    else:
+        features = dict(zip(FEATURE_ORDER, decode_chromosome(chromosome)))
+    return {'generation': int(generation), 'fitness': float(fitness), 'features': features}
+
+
+class StreamingPathCompactor:
+    """
+    Padanan compact_evolution_log untuk stream: generasi diterima satu per satu lewat push()
+    dan langkah dikembalikan begitu boleh dikirim; finish() mengembalikan sisanya (generasi
+    terakhir selalu ikut). Tanpa max_points hasilnya sama dengan compact_evolution_log.
+    Dengan max_points, bucket downsampling dibagi menurut nomor generasi (1..num_generations)
+    karena jumlah kandidat belum diketahui; langkah terbaik sebuah bucket dikirim saat bucket
+    itu selesai. 'columnar' dikirim seperti 'full' karena setiap event hanya memuat satu generasi.
+
+    Args:
+        mode (str): Salah satu PATH_MODES.
+        max_points (int, optional): Jumlah langkah maksimum yang dikirim.
+        num_generations (int, optional): Jumlah generasi maksimum run (wajib jika max_points diisi).
+    """
+
+    def __init__(self, mode=PATH_MODE_FULL, max_points=None, num_generations=None):
+        if mode not in PATH_MODES:
+            raise ValueError(f"Mode jejak evolusi tidak dikenal: '{mode}'. Pilihan: {', '.join(PATH_MODES)}")
+        if max_points is not None and num_generations is None:
+            raise ValueError("num_generations wajib diisi jika max_points diisi.")
+        self.mode = mode
+        self.max_points = max_points
+        self.num_generations = num_generations
+        self._previous = None # Kromosom generasi sebelumnya (kandidat 'changes')
+        self._sent = None # Kromosom langkah terakhir yang dikirim (dasar delta)
+        self._last = None # Generasi terakhir yang diterima: (generasi, fitness, kromosom, extra)
+        self._last_sent = False
+        self._num_sent = 0
+        self._pending = None # (bucket, langkah terbaik bucket yang belum dikirim)
+
+    def _emit(self, entry):
+        generation, fitness, chromosome, extra = entry
+        step = _path_step(generation, fitness, chromosome, self._sent if self.mode == PATH_MODE_CHANGES else None)
+        step.update(extra)
+        self._sent = chromosome
+        self._num_sent += 1
+        self._last_sent = entry is self._last
+        return step
+
+    def _bucket(self, generation):
+        interior = self.max_points - 2
+        if interior <= 0:
+            return None # Hanya generasi pertama dan terakhir
+        return min((generation - 1) * interior // max(self.num_generations, 1), interior - 1)
+
+    def push(self, generation, fitness, chromosome, **extra):
+        """Menerima satu generasi; mengembalikan list langkah yang siap dikirim (bisa kosong)."""
+        chromosome = np.array(chromosome, copy=True)
+        is_candidate = (self.mode != PATH_MODE_CHANGES or self._previous is None
+                        or bool(np.any(chromosome != self._previous)))
+        self._previous = chromosome
+        self._last = entry = (generation, fitness, chromosome, extra)
+        self._last_sent = False
+        if not is_candidate:
+            return []
+        if self.max_points is None or self._num_sent == 0:
+            return [self._emit(entry)]
+
+        ready = []
+        bucket = self._bucket(generation)
+        if self._pending is not None and self._pending[0] != bucket:
+            ready.append(self._emit(self._pending[1]))
+            self._pending = None
+        if bucket is not None and (self._pending is None or fitness > self._pending[1][1]):
+            self._pending = (bucket, entry)
+        return ready
+
+    def finish(self):
+        """Langkah yang tersisa setelah generasi terakhir (bucket terbuka dan generasi terakhir)."""
+        ready = []
+        if self._pending is not None:
+            ready.append(self._emit(self._pending[1]))
+            self._pending = None
+        if self._last is not None and not self._last_sent:
+            ready.append(self._emit(self._last))
+        return ready
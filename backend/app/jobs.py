@@ -0,0 +1,148 @@
+# backend/app/jobs.py
+
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# Subsistem job untuk menjalankan simulasi GA (CPU-bound) di luar event loop FastAPI.
+# Job dijalankan di worker pool yang bisa dikonfigurasi: thread atau proses.
+
+JOB_STATUS_PENDING = 'pending'
+JOB_STATUS_RUNNING = 'running'
+JOB_STATUS_COMPLETED = 'completed'
+JOB_STATUS_FAILED = 'failed'
+JOB_STATUS_CANCELLED = 'cancelled'
+
+
+class Job:
+    """Satu job di JobManager beserta future dan event pembatalannya."""
+
+    def __init__(self, job_id, future, cancel_event=None):
+        self.job_id = job_id
+        self.future = future
+        self.cancel_event = cancel_event
+        self.cancelled = False
+        self.created_at = time.time()
+        self.finished_at = None
+
+    def _mark_finished(self):
+        if self.finished_at is None: # Job yang dibatalkan sudah dicatat selesai saat cancel
+            self.finished_at = time.time()
+
+    @property
+    def finished(self):
+        """True jika job selesai atau sudah dibatalkan (boleh dibuang dari daftar)."""
+        return self.cancelled or self.future.done()
+
+    @property
+    def status(self):
+        if self.cancelled or self.future.cancelled():
+            return JOB_STATUS_CANCELLED
+        if not self.future.done():
+            return JOB_STATUS_RUNNING if self.future.running() else JOB_STATUS_PENDING
+        return JOB_STATUS_FAILED if self.future.exception() is not None else JOB_STATUS_COMPLETED
+
+    @property
+    def result(self):
+        if self.status != JOB_STATUS_COMPLETED:
+            return None
+        return self.future.result()
+
+    @property
+    def error(self):
+        if self.status != JOB_STATUS_FAILED:
+            return None
+        return str(self.future.exception())
+
+
+class JobManager:
+    """
+    Menjalankan fungsi di ThreadPoolExecutor atau ProcessPoolExecutor dan
+    menyimpan statusnya berdasarkan job id.
+
+    Args:
+        executor_kind (str): 'thread' atau 'process'.
+        max_workers (int, optional): Ukuran pool (default bawaan executor).
+        initializer / initargs: Diteruskan ke executor (misal memuat dataset di worker proses).
+        max_finished_jobs (int): Jumlah job selesai yang tetap disimpan; yang tertua dibuang.
+
+    Pada mode 'thread', fungsi menerima argumen kata kunci cancel_event (threading.Event)
+    sehingga job yang sedang berjalan bisa berhenti lebih awal saat dibatalkan.
+    Pada mode 'process', job yang sedang berjalan tidak bisa dihentikan; hasilnya diabaikan.
+    """
+
+    def __init__(self, executor_kind='thread', max_workers=None, initializer=None, initargs=(),
+                 max_finished_jobs=1000):
+        if executor_kind == 'thread':
+            self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ga-job',
+                                               initializer=initializer, initargs=initargs)
+        elif executor_kind == 'process':
+            self.executor = ProcessPoolExecutor(max_workers=max_workers,
+                                                initializer=initializer, initargs=initargs)
+        else:
+            raise ValueError(f"executor_kind harus 'thread' atau 'process', bukan '{executor_kind}'")
+        self.executor_kind = executor_kind
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _submit(self, fn, *args):
+        cancel_event = None
+        if self.executor_kind == 'thread':
+            cancel_event = threading.Event()
+            future = self.executor.submit(fn, *args, cancel_event=cancel_event)
+        else:
+            future = self.executor.submit(fn, *args)
+        return future, cancel_event
+
+    def submit(self, fn, *args):
+        """Menjadwalkan fn(*args) sebagai job baru, mengembalikan job id."""
+        future, cancel_event = self._submit(fn, *args)
+        job = Job(uuid.uuid4().hex, future, cancel_event)
+        future.add_done_callback(lambda _: job._mark_finished())
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._evict_finished()
+        return job.job_id
+
+    async def run(self, fn, *args):
+        """Menjalankan fn(*args) di pool dan menunggu hasilnya tanpa memblokir event loop."""
+        future, _ = self._submit(fn, *args)
+        return await asyncio.wrap_future(future)
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Membatalkan job. Job tetap disimpan dengan status cancelled (GET berikutnya masih
+        menemukannya) sampai dibuang seperti job selesai lainnya. Mengembalikan Job tersebut,
+        atau None jika job id tidak dikenal. Job yang sudah selesai tidak diubah.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if not job.future.done():
+            job.future.cancel() # Berhasil jika job belum mulai
+            if job.cancel_event is not None:
+                job.cancel_event.set() # Job thread yang sedang berjalan berhenti di generasi berikutnya
+            job.cancelled = True
+            job._mark_finished()
+        return job
+
+    def _evict_finished(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def shutdown(self):
+        for job in list(self._jobs.values()):
+            if job.cancel_event is not None:
+                job.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
@@ -0,0 +1,35 @@
+# backend/app/preprocessing_data/columns.py
+
+import unicodedata
+from ..algorithm.chromosome_setup import FEATURE_DETAILS
+
+# Nama kolom fitur dinormalisasi SEKALI saat data dimuat: dataset bawaan di api.load_dataset_sync
+# dan setiap chunk CSV upload di ingest_csv_stream. Setelah itu profil, fitness dan classifier
+# cukup memakai kunci FEATURE_DETAILS (misal 'Canine Size' -> 'Canine_Size',
+# 'Foramen_Mágnum_Position' -> 'Foramen_Magnum_Position').
+
+
+def feature_key_for_column(column):
+    """
+    Kunci FEATURE_DETAILS untuk nama kolom CSV, atau None jika bukan fitur yang dikenal.
+    Menangani nama dengan spasi/aksen (misal 'Canine Size', 'Foramen_Mágnum_Position').
+    """
+    candidates = (column, column.strip().replace(' ', '_'))
+    for candidate in candidates + tuple(
+            unicodedata.normalize('NFKD', c).encode('ascii', 'ignore').decode() for c in candidates):
+        if candidate in FEATURE_DETAILS:
+            return candidate
+    return None
+
+
+def normalize_feature_columns(df, label_col):
+    """
+    DataFrame dengan kolom fitur yang dikenali diganti ke nama FEATURE_DETAILS. Kolom yang
+    nama tujuannya sudah ada di df dibiarkan, agar tidak ada dua kolom dengan nama yang sama.
+    """
+    renames = {}
+    for column in df.columns:
+        feature_key = feature_key_for_column(column) if column != label_col else None
+        if feature_key not in (None, column) and feature_key not in df.columns:
+            renames[column] = feature_key
+    return df.rename(columns=renames) if renames else df
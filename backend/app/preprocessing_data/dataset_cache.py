@@ -0,0 +1,203 @@
+# backend/app/preprocessing_data/dataset_cache.py
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Cache biner kolumnar untuk Evolution_DataSets.csv.
+# Saat pertama kali dimuat, CSV di-parse sekali lalu setiap kolom disimpan sebagai file .npy:
+# - kolom numerik: array apa adanya
+# - kolom teks: kode integer (dictionary encoding) + daftar kategori di manifest.json
+# Direktori cache dinamai dengan hash SHA-256 isi CSV, sehingga perubahan CSV otomatis
+# menghasilkan cache baru. Saat dimuat, kolom numerik dan kode kolom teks di-memory-map dan
+# dipakai langsung tanpa disalin: kolom teks menjadi pd.Categorical di atas kode tersebut.
+# Nilainya sama dengan pd.read_csv; hanya dtype kolom teks yang berbeda (category, bukan str).
+# Baik cache baru dibangun maupun sudah ada, DataFrame selalu dimuat dari cache, jadi dtype dan
+# dataset_fingerprint-nya sama di setiap startup.
+# Startup tidak meng-hash ulang CSV selama ukuran dan mtime-nya sama dengan yang tercatat di
+# SOURCE_STAT_FILENAME; hash SHA-256 hanya dihitung jika file CSV tersentuh.
+
+CACHE_FORMAT_VERSION = 1
+MANIFEST_FILENAME = 'manifest.json'
+SOURCE_STAT_FILENAME = '.source.json' # {'size', 'mtime_ns', 'sha256'} CSV terakhir yang di-cache
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Hash SHA-256 isi file (dibaca per chunk)."""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def default_cache_root(csv_path):
+    """Lokasi cache default: <folder CSV>/.cache/<nama file CSV tanpa ekstensi>/"""
+    csv_dir, csv_name = os.path.split(os.path.abspath(csv_path))
+    return os.path.join(csv_dir, '.cache', os.path.splitext(csv_name)[0])
+
+
+def _codes_dtype(num_categories):
+    # Sama dengan dtype kode yang dipilih pd.Categorical, supaya from_codes tidak menyalin
+    for dtype in (np.int8, np.int16, np.int32):
+        if num_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _write_columns(df, target_dir, source_sha256):
+    """Menulis setiap kolom df sebagai .npy + manifest.json ke target_dir."""
+    columns = []
+    for position, column in enumerate(df.columns):
+        series = df[column]
+        filename = f'col_{position:03d}.npy'
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            np.save(os.path.join(target_dir, filename), series.to_numpy())
+            columns.append({'name': column, 'kind': 'numeric', 'file': filename})
+        else:
+            codes, categories = pd.factorize(series, sort=True) # NaN -> -1
+            codes = codes.astype(_codes_dtype(len(categories)))
+            np.save(os.path.join(target_dir, filename), codes)
+            columns.append({
+                'name': column, 'kind': 'categorical', 'file': filename,
+                'categories': [str(category) for category in categories],
+            })
+
+    manifest = {
+        'format_version': CACHE_FORMAT_VERSION,
+        'source_sha256': source_sha256,
+        'num_rows': len(df),
+        'columns': columns,
+    }
+    with open(os.path.join(target_dir, MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return manifest
+
+
+def build_dataset_cache(csv_path, cache_root=None, source_sha256=None):
+    """
+    Mem-parse CSV sekali dan menulis cache kolumnarnya.
+
+    Args:
+        csv_path (str): Path ke file CSV.
+        cache_root (str, optional): Folder induk cache (default: default_cache_root).
+        source_sha256 (str, optional): Hash CSV jika sudah dihitung.
+
+    Returns:
+        str: Path direktori cache untuk versi CSV ini.
+    """
+    cache_root = cache_root or default_cache_root(csv_path)
+    source_sha256 = source_sha256 or file_sha256(csv_path)
+    final_dir = os.path.join(cache_root, source_sha256)
+    if os.path.exists(os.path.join(final_dir, MANIFEST_FILENAME)):
+        return final_dir
+
+    os.makedirs(cache_root, exist_ok=True)
+    df = pd.read_csv(csv_path)
+
+    # Tulis ke direktori sementara lalu rename secara atomik, supaya worker lain
+    # yang memuat bersamaan tidak pernah melihat cache setengah jadi.
+    tmp_dir = tempfile.mkdtemp(prefix='.build-', dir=cache_root)
+    try:
+        _write_columns(df, tmp_dir, source_sha256)
+        try:
+            os.rename(tmp_dir, final_dir)
+        except OSError:
+            # Proses lain sudah selesai membangun versi yang sama lebih dulu
+            if not os.path.exists(os.path.join(final_dir, MANIFEST_FILENAME)):
+                raise
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    _remove_stale_versions(cache_root, keep=source_sha256)
+    return final_dir
+
+
+def _remove_stale_versions(cache_root, keep):
+    """Menghapus cache untuk versi CSV lama (best effort)."""
+    for entry in os.listdir(cache_root):
+        if entry != keep and not entry.startswith('.'):
+            shutil.rmtree(os.path.join(cache_root, entry), ignore_errors=True)
+
+
+def load_cached_columns(cache_dir):
+    """
+    Memuat DataFrame dari direktori cache. Kolom numerik dan kode kolom teks di-memory-map
+    (read-only) dan dipakai langsung tanpa disalin; kolom teks menjadi pd.Categorical
+    (kode -1 = NaN) dengan kategori terurut.
+    """
+    with open(os.path.join(cache_dir, MANIFEST_FILENAME), encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != CACHE_FORMAT_VERSION:
+        raise ValueError(f"Format cache tidak didukung: {manifest.get('format_version')}")
+
+    columns = {}
+    for column in manifest['columns']:
+        values = np.load(os.path.join(cache_dir, column['file']), mmap_mode='r')
+        if column['kind'] == 'categorical':
+            columns[column['name']] = pd.Categorical.from_codes(values, column['categories'])
+        else:
+            columns[column['name']] = values
+    return pd.DataFrame(columns, copy=False)
+
+
+def _source_stat(csv_path):
+    stat = os.stat(csv_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _cached_source_sha256(csv_path, cache_root):
+    """Hash CSV yang tercatat di cache jika ukuran dan mtime CSV tidak berubah, selain itu None."""
+    try:
+        with open(os.path.join(cache_root, SOURCE_STAT_FILENAME), encoding='utf-8') as f:
+            recorded = json.load(f)
+    except (OSError, ValueError):
+        return None
+    current = _source_stat(csv_path)
+    if any(recorded.get(key) != value for key, value in current.items()):
+        return None
+    return recorded.get('sha256')
+
+
+def _record_source_stat(cache_root, source_stat, source_sha256):
+    """Mencatat ukuran, mtime dan hash CSV (ditulis atomik lewat file sementara)."""
+    fd, tmp_path = tempfile.mkstemp(prefix='.source-', dir=cache_root)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(dict(source_stat, sha256=source_sha256), f)
+    os.replace(tmp_path, os.path.join(cache_root, SOURCE_STAT_FILENAME))
+
+
+def load_dataset_cached(csv_path, cache_root=None):
+    """
+    Memuat dataset CSV lewat cache kolumnar. Cache dibangun (ulang) otomatis jika
+    belum ada atau jika isi CSV berubah.
+    """
+    cache_root = cache_root or default_cache_root(csv_path)
+    source_sha256 = _cached_source_sha256(csv_path, cache_root)
+    if source_sha256 is not None:
+        cache_dir = os.path.join(cache_root, source_sha256)
+        if os.path.exists(os.path.join(cache_dir, MANIFEST_FILENAME)):
+            return load_cached_columns(cache_dir)
+
+    # Stat diambil sebelum hash: jika CSV berubah saat di-hash, startup berikutnya meng-hash ulang
+    source_stat = _source_stat(csv_path)
+    source_sha256 = file_sha256(csv_path)
+    cache_dir = build_dataset_cache(csv_path, cache_root, source_sha256=source_sha256)
+    _record_source_stat(cache_root, source_stat, source_sha256)
+    return load_cached_columns(cache_dir)
+
+
+if __name__ == '__main__':
+    # Build step manual, misal: python -m app.preprocessing_data.dataset_cache ../data/Evolution_DataSets.csv
+    if len(sys.argv) < 2:
+        print("Penggunaan: python -m app.preprocessing_data.dataset_cache <path_csv> [cache_root]")
+        sys.exit(1)
+    built_dir = build_dataset_cache(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f"Cache dataset tersedia di: {built_dir}")
@@ -1,12 +1,16 @@
 # backend/app/preprocessing/encoders.py
 
+import threading
+from collections import OrderedDict
 import pandas as pd
+from scipy import sparse as sp
+from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 import numpy as np
 
-def preprocess_data(df, numerical_cols, categorical_cols, label_col):
+def preprocess_data(df, numerical_cols, categorical_cols, label_col, sparse=False):
     """
     Melakukan pra-pemrosesan pada DataFrame.
     
@@ -15,9 +19,11 @@ def preprocess_data(df, numerical_cols, categorical_cols, label_col):
         numerical_cols (list): Daftar nama kolom numerik.
         categorical_cols (list): Daftar nama kolom kategorikal.
         label_col (str): Nama kolom label/target.
+        sparse (bool): True agar one-hot tidak dipadatkan; jika ada kolom kategorikal,
+                       ColumnTransformer mengembalikan scipy.sparse CSR.
         
     Returns:
-        X_processed (np.ndarray): Matriks fitur yang sudah diproses.
+        X_processed (np.ndarray | scipy.sparse.csr_matrix): Matriks fitur yang sudah diproses.
         y (np.ndarray): Array label.
         preprocessor (ColumnTransformer): Objek preprocessor yang sudah di-fit.
                                           Ini bisa disimpan untuk memproses data baru
@@ -33,17 +39,19 @@ def preprocess_data(df, numerical_cols, categorical_cols, label_col):
 
     # Membuat pipeline untuk fitur kategorikal
     # handle_unknown='ignore' akan mengabaikan kategori baru saat transform (jika ada di data tes)
-    # sparse_output=False agar hasilnya berupa dense array, bisa diubah jika perlu
-    categorical_transformer = OneHotEncoder(handle_unknown='ignore', sparse_output=False)
+    # sparse_output=False agar hasilnya berupa dense array; sparse=True mempertahankan matriks sparse
+    categorical_transformer = OneHotEncoder(handle_unknown='ignore', sparse_output=sparse)
 
     # Menggabungkan transformer menggunakan ColumnTransformer
     # remainder='passthrough' akan membiarkan kolom lain yang tidak disebut (jika ada)
+    # sparse_threshold=1.0 memaksa hasil gabungan tetap sparse jika ada bagian yang sparse
     preprocessor = ColumnTransformer(
         transformers=[
             ('num', numerical_transformer, numerical_cols),
             ('cat', categorical_transformer, categorical_cols)
         ],
-        remainder='passthrough' 
+        remainder='passthrough',
+        sparse_threshold=1.0 if sparse else 0.3
     )
 
     # Fit dan transform data
@@ -73,6 +81,141 @@ def preprocess_data(df, numerical_cols, categorical_cols, label_col):
 
     return X_processed, y, preprocessor, feature_names_out
 
+
+class SubsetTransformer(TransformerMixin, BaseEstimator):
+    """
+    Transformer (langkah Pipeline) untuk satu subset kolom SubsetEncoder: memakai encoder
+    per kolom yang sudah di-fit, sehingga data baru di-encode persis seperti matriks subset.
+
+    Args:
+        transformers (list): Pasangan (kolom, transformer_yang_sudah_di-fit).
+    """
+
+    def __init__(self, transformers):
+        self.transformers = transformers
+
+    def fit(self, X, y=None):
+        return self # Transformer per kolom sudah di-fit oleh SubsetEncoder
+
+    def transform(self, X):
+        blocks = [sp.csr_matrix(transformer.transform(X[[column]])) for column, transformer in self.transformers]
+        return sp.hstack(blocks, format='csr')
+
+
+class SubsetEncoder:
+    """
+    Encoding sekali untuk seleksi fitur: setiap kolom fitur di-encode satu kali (StandardScaler
+    untuk numerik, OneHotEncoder untuk kategorikal, seperti preprocess_data), dan hasilnya
+    disimpan sebagai satu matriks CSC. Matriks untuk subset kolom mana pun diambil dari
+    matriks itu (tanpa fit/encode ulang) dan disimpan di cache LRU.
+
+    Setiap kolom menempati blok kolom berurutan di matriks (1 kolom untuk numerik, satu kolom
+    per kategori untuk kategorikal), dengan urutan numerical_cols lalu categorical_cols. Karena
+    encoder per kolom saling bebas, matriks subset sama dengan preprocess_data pada subset itu.
+
+    Args:
+        numerical_cols (list): Kolom numerik.
+        categorical_cols (list): Kolom kategorikal.
+        cache_size (int): Jumlah subset yang hasilnya diingat.
+    """
+
+    def __init__(self, numerical_cols, categorical_cols, cache_size=32):
+        self.numerical_cols = list(numerical_cols)
+        self.categorical_cols = list(categorical_cols)
+        self.columns = self.numerical_cols + self.categorical_cols
+        self.cache_size = cache_size
+        self.matrix = None
+        self.y = None
+        self.transformers = {} # kolom -> transformer yang sudah di-fit
+        self.column_slices = {} # kolom -> slice kolom di matriks
+        self.feature_names_out = None
+        self._subset_cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fit(self, df, label_col):
+        """Meng-encode setiap kolom fitur sekali. Mengembalikan self."""
+        blocks, feature_names, start = [], [], 0
+        for column in self.columns:
+            if column in self.numerical_cols:
+                transformer = StandardScaler()
+            else:
+                transformer = OneHotEncoder(handle_unknown='ignore', sparse_output=True)
+            block = sp.csr_matrix(transformer.fit_transform(df[[column]]))
+            self.transformers[column] = transformer
+            self.column_slices[column] = slice(start, start + block.shape[1])
+            start += block.shape[1]
+            blocks.append(block)
+            feature_names.extend(transformer.get_feature_names_out([column]))
+        self.matrix = sp.hstack(blocks, format='csc') # Potong kolom murah pada CSC
+        self.feature_names_out = np.asarray(feature_names, dtype=object)
+        self.y = df[label_col].to_numpy()
+        with self._lock:
+            self._subset_cache.clear()
+        return self
+
+    def _subset_columns(self, subset):
+        """Kolom dari daftar nama kolom atau mask biner (urutan self.columns), urut seperti matriks."""
+        subset = list(subset)
+        if subset and all(isinstance(v, (bool, np.bool_)) for v in subset):
+            if len(subset) != len(self.columns):
+                raise ValueError(f"Mask biner harus berisi {len(self.columns)} elemen, bukan {len(subset)}.")
+            return [col for col, selected in zip(self.columns, subset) if selected]
+        unknown = [col for col in subset if col not in self.column_slices]
+        if unknown:
+            raise ValueError(f"Kolom tidak dikenal oleh SubsetEncoder: {unknown}")
+        return [col for col in self.columns if col in set(subset)]
+
+    def transform_subset(self, subset):
+        """
+        Matriks fitur untuk satu subset kolom.
+
+        Args:
+            subset (list): Nama kolom, atau mask biner sepanjang self.columns.
+
+        Returns:
+            tuple: (X_subset (CSC), feature_names_out_subset).
+        """
+        if self.matrix is None:
+            raise RuntimeError("SubsetEncoder belum di-fit.")
+        key = tuple(self._subset_columns(subset))
+        with self._lock:
+            if key in self._subset_cache:
+                self._subset_cache.move_to_end(key)
+                return self._subset_cache[key]
+
+        slices = [self.column_slices[col] for col in key]
+        indices = np.concatenate([np.arange(s.start, s.stop) for s in slices]) if slices else np.zeros(0, dtype=int)
+        result = (self.matrix[:, indices], self.feature_names_out[indices])
+        with self._lock:
+            self._subset_cache[key] = result
+            while len(self._subset_cache) > self.cache_size:
+                self._subset_cache.popitem(last=False)
+        return result
+
+    def subset_transformer(self, subset):
+        """SubsetTransformer untuk meng-encode data baru dengan kolom subset ini."""
+        return SubsetTransformer([(col, self.transformers[col]) for col in self._subset_columns(subset)])
+
+
+# SubsetEncoder per dataset (fingerprint), dipakai bersama oleh semua fit classifier.
+_SUBSET_ENCODER_CACHE = OrderedDict()
+_SUBSET_ENCODER_CACHE_MAXSIZE = 2
+_SUBSET_ENCODER_LOCK = threading.Lock()
+
+def get_subset_encoder(df, numerical_cols, categorical_cols, label_col, fingerprint):
+    """SubsetEncoder yang sudah di-fit untuk dataset dengan fingerprint ini (dari cache atau fit baru)."""
+    key = (fingerprint, tuple(numerical_cols), tuple(categorical_cols), label_col)
+    with _SUBSET_ENCODER_LOCK:
+        if key in _SUBSET_ENCODER_CACHE:
+            _SUBSET_ENCODER_CACHE.move_to_end(key)
+            return _SUBSET_ENCODER_CACHE[key]
+        encoder = SubsetEncoder(numerical_cols, categorical_cols).fit(df, label_col)
+        _SUBSET_ENCODER_CACHE[key] = encoder
+        while len(_SUBSET_ENCODER_CACHE) > _SUBSET_ENCODER_CACHE_MAXSIZE:
+            _SUBSET_ENCODER_CACHE.popitem(last=False)
+        return encoder
+
+
 if __name__ == '__main__':
     # Contoh penggunaan (asumsi file CSV ada di path yang benar)
     # Anda perlu menyesuaikan path ke file CSV Anda
@@ -0,0 +1,179 @@
+# backend/app/preprocessing_data/upload.py
+
+import asyncio
+import hashlib
+import pandas as pd
+from ..algorithm.chromosome_setup import FEATURE_DETAILS
+from .columns import feature_key_for_column
+
+# Ingest CSV upload secara streaming: file dibaca per chunk (pandas chunksize), setiap chunk
+# divalidasi terhadap FEATURE_DETAILS lalu langsung dimasukkan ke ProfileAccumulator.
+# Tidak ada chunk yang disimpan setelah diproses, sehingga memori tetap terbatas
+# berapa pun ukuran file. Pada endpoint upload, sumbernya adalah body request itu sendiri
+# (AsyncStreamReader), jadi CSV di-parse selama body masih diterima.
+#
+# Aturan validasi per baris:
+# - label kosong, atau nilai fitur numerik yang bukan angka -> baris ditolak
+# - kategori di luar FEATURE_DETAILS / angka di luar rentang -> peringatan (baris tetap dipakai,
+#   sama seperti dataset bawaan), atau ditolak jika strict=True
+
+UPLOAD_CHUNK_ROWS = 50_000
+ITER_BLOCK_BYTES = 64 * 1024 # Ukuran blok saat _HashingReader diiterasi per baris
+MAX_REPORTED_ERRORS = 20 # Contoh pesan error per upload yang dikembalikan ke klien
+
+
+class CSVValidationError(ValueError):
+    """CSV upload tidak bisa diproses (header tidak valid atau format rusak)."""
+
+
+class AsyncStreamReader:
+    """
+    Objek file biner sinkron di atas iterator byte async (misal Request.stream() Starlette).
+    read() dipanggil dari thread lain (ingest_csv_stream di asyncio.to_thread) dan mengambil
+    potongan body berikutnya dari event loop sesuai kebutuhan, jadi body tidak ditampung dulu.
+
+    Args:
+        chunks: Async iterator yang menghasilkan bytes.
+        loop (asyncio.AbstractEventLoop): Event loop tempat iterator berjalan.
+    """
+
+    def __init__(self, chunks, loop):
+        self.chunks = chunks.__aiter__()
+        self.loop = loop
+        self.buffer = bytearray()
+        self.eof = False
+
+    def _next_chunk(self):
+        try:
+            return asyncio.run_coroutine_threadsafe(self.chunks.__anext__(), self.loop).result()
+        except StopAsyncIteration:
+            self.eof = True
+            return b''
+
+    def read(self, size=-1):
+        while not self.eof and (size is None or size < 0 or len(self.buffer) < size):
+            self.buffer += self._next_chunk()
+        if size is None or size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+class _HashingReader:
+    """Membungkus file biner dan menghitung SHA-256 dari byte yang dibaca pandas."""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.hasher = hashlib.sha256()
+        self.num_bytes = 0
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        self.hasher.update(data)
+        self.num_bytes += len(data)
+        return data
+
+    def __iter__(self):
+        # pandas hanya menganggap objek dengan read dan __iter__ sebagai file; baris juga
+        # diambil lewat read agar semua byte ikut di-hash
+        pending = b''
+        for block in iter(lambda: self.read(ITER_BLOCK_BYTES), b''):
+            *lines, pending = (pending + block).split(b'\n')
+            for line in lines:
+                yield line + b'\n'
+        if pending:
+            yield pending
+
+
+def validate_chunk(chunk, feature_columns, label_col, strict=False):
+    """
+    Memvalidasi satu chunk (semua kolom dibaca sebagai teks).
+
+    Args:
+        chunk (pd.DataFrame): Baris CSV mentah.
+        feature_columns (dict): {kolom_csv: kunci FEATURE_DETAILS}.
+        label_col (str): Kolom label spesies.
+        strict (bool): Tolak juga baris dengan kategori/rentang di luar FEATURE_DETAILS.
+
+    Returns:
+        tuple: (chunk_valid, pesan_error, jumlah_peringatan). Kolom numerik di chunk_valid
+               sudah berupa float.
+    """
+    invalid = chunk[label_col].isna().to_numpy().copy()
+    messages = []
+    num_warnings = 0
+    if invalid.any():
+        messages.append(f"baris {chunk.index[invalid][0] + 2}: label '{label_col}' kosong ({int(invalid.sum())} baris)")
+
+    for column, feature_key in feature_columns.items():
+        details = FEATURE_DETAILS[feature_key]
+        raw = chunk[column]
+        if details['type'] == 'numerical':
+            values = pd.to_numeric(raw, errors='coerce')
+            not_number = (raw.notna() & values.isna()).to_numpy()
+            if not_number.any():
+                first = chunk.index[not_number][0]
+                messages.append(f"baris {first + 2}: '{column}' bukan angka ({raw[first]!r}, {int(not_number.sum())} baris)")
+                invalid |= not_number
+            min_val, max_val = details['range']
+            outside = (values.notna() & ((values < min_val) | (values > max_val))).to_numpy()
+            chunk[column] = values
+        else:
+            outside = (raw.notna() & ~raw.isin(details['categories'])).to_numpy()
+
+        if outside.any():
+            num_warnings += int(outside.sum())
+            if strict:
+                first = chunk.index[outside][0]
+                messages.append(f"baris {first + 2}: '{column}' di luar FEATURE_DETAILS ({raw[first]!r}, {int(outside.sum())} baris)")
+                invalid |= outside
+
+    return chunk[~invalid], messages, num_warnings
+
+
+def ingest_csv_stream(fileobj, accumulator, strict=False, chunk_rows=UPLOAD_CHUNK_ROWS):
+    """
+    Membaca CSV dari objek file biner per chunk, memvalidasi, dan memperbarui accumulator.
+
+    Args:
+        fileobj: Objek file biner dengan read() (misal AsyncStreamReader di atas body request).
+        accumulator (ProfileAccumulator): Agregat profil yang diperbarui di tempat.
+        strict (bool): Lihat validate_chunk.
+        chunk_rows (int): Jumlah baris per chunk.
+
+    Returns:
+        dict: Ringkasan (rows_total, rows_valid, rows_invalid, warnings, errors, sha256, bytes).
+    """
+    label_col = accumulator.label_col
+    reader = _HashingReader(fileobj)
+    report = {'rows_total': 0, 'rows_valid': 0, 'rows_invalid': 0, 'warnings': 0, 'errors': []}
+    feature_columns = None
+    try:
+        # Semua kolom dibaca sebagai teks agar tipe tidak berubah antar chunk; numerik dikonversi saat validasi
+        for chunk in pd.read_csv(reader, chunksize=chunk_rows, dtype=str, keep_default_na=True):
+            if feature_columns is None:
+                if label_col not in chunk.columns:
+                    raise CSVValidationError(f"Kolom label '{label_col}' tidak ada di header CSV.")
+                feature_columns = {
+                    column: feature_key_for_column(column) for column in chunk.columns
+                    if column != label_col and feature_key_for_column(column) is not None
+                }
+                if not feature_columns:
+                    raise CSVValidationError("Header CSV tidak memuat satu pun fitur dari FEATURE_DETAILS.")
+
+            valid_chunk, messages, num_warnings = validate_chunk(chunk, feature_columns, label_col, strict)
+            # Nama kolom dinormalisasi ke kunci FEATURE_DETAILS, sama seperti dataset bawaan saat startup
+            accumulator.update(valid_chunk.rename(columns=feature_columns))
+
+            report['rows_total'] += len(chunk)
+            report['rows_valid'] += len(valid_chunk)
+            report['rows_invalid'] += len(chunk) - len(valid_chunk)
+            report['warnings'] += num_warnings
+            report['errors'].extend(messages[:MAX_REPORTED_ERRORS - len(report['errors'])])
+    except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as e:
+        raise CSVValidationError(f"CSV tidak dapat di-parse: {e}") from e
+
+    report['sha256'] = reader.hasher.hexdigest()
+    report['bytes'] = reader.num_bytes
+    return report
@@ -0,0 +1,72 @@
+# backend/app/recommendations.py
+
+import json
+import os
+import tempfile
+import time
+
+# Rekomendasi GAParameters per spesies target, hasil tuning (python -m app.tuning).
+# Disimpan sebagai JSON:
+#   {"format_version": 1, "updated_at": ..., "dataset_fingerprint": "...",
+#    "species": {"<target_genus_specie>": {"ga_params": {...}, "mean_fitness": ..., ...}}}
+# Jika request meminta use_recommended_params=True, API mengisi field ga_params yang tidak
+# dikirim klien dengan nilai rekomendasi untuk target request; field yang dikirim klien tidak
+# pernah ditimpa. Tanpa opt-in, default GAParameters yang berlaku.
+
+RECOMMENDATIONS_FORMAT_VERSION = 1
+RECOMMENDED_PARAM_NAMES = ('population_size', 'num_generations', 'crossover_prob', 'mutation_prob')
+
+
+class ParameterRecommendations:
+    """
+    Rekomendasi parameter GA per spesies.
+
+    Args:
+        species (dict): {target_genus_specie: entri rekomendasi (dict dengan kunci 'ga_params')}.
+        dataset_fingerprint (str, optional): Fingerprint dataset saat tuning.
+    """
+
+    def __init__(self, species=None, dataset_fingerprint=None):
+        self.species = dict(species or {})
+        self.dataset_fingerprint = dataset_fingerprint
+
+    def __len__(self):
+        return len(self.species)
+
+    @classmethod
+    def load(cls, path):
+        """Memuat file rekomendasi; objek kosong jika file tidak ada. ValueError jika formatnya salah."""
+        if not path or not os.path.exists(path):
+            return cls()
+        with open(path, encoding='utf-8') as f:
+            payload = json.load(f)
+        if payload.get('format_version') != RECOMMENDATIONS_FORMAT_VERSION:
+            raise ValueError(f"Versi format rekomendasi tidak dikenal di {path}: {payload.get('format_version')!r}")
+        return cls(payload.get('species', {}), payload.get('dataset_fingerprint'))
+
+    def save(self, path):
+        """Menyimpan secara atomik (tulis ke file sementara lalu rename)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        payload = {
+            'format_version': RECOMMENDATIONS_FORMAT_VERSION,
+            'updated_at': time.time(),
+            'dataset_fingerprint': self.dataset_fingerprint,
+            'species': dict(sorted(self.species.items())),
+        }
+        fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', suffix='.json', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def params_for(self, target_genus_specie):
+        """Parameter rekomendasi (hanya RECOMMENDED_PARAM_NAMES) untuk target, atau {}."""
+        entry = self.species.get(target_genus_specie)
+        if not entry:
+            return {}
+        return {name: value for name, value in entry.get('ga_params', {}).items() if name in RECOMMENDED_PARAM_NAMES}
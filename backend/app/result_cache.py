@@ -0,0 +1,78 @@
+# backend/app/result_cache.py
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+# Cache hasil simulasi untuk request yang memakai seed.
+# Run dengan seed bersifat deterministik, jadi request identik (input pengguna, ga_params,
+# target, dan isi dataset yang sama) selalu menghasilkan respons yang sama dan bisa
+# dilayani langsung dari cache tanpa menjalankan GA lagi.
+
+
+def request_cache_key(request_payload, dataset_fp):
+    """
+    Kunci cache kanonis: SHA-256 dari JSON request (kunci diurutkan, tanpa spasi)
+    ditambah fingerprint dataset, sehingga perubahan dataset otomatis membuat kunci baru.
+
+    Args:
+        request_payload (dict): Request dalam bentuk JSON-able (misal model_dump(mode='json')).
+        dataset_fp (str): dataset_fingerprint dataset yang dipakai.
+    """
+    canonical = json.dumps(
+        {'request': request_payload, 'dataset_fingerprint': dataset_fp},
+        sort_keys=True, separators=(',', ':'), ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Cache LRU dengan TTL (thread-safe).
+
+    Args:
+        maxsize (int): Jumlah entri maksimum; entri yang paling lama tidak dipakai dibuang.
+        ttl_seconds (float): Umur maksimum entri; None berarti tidak pernah kedaluwarsa.
+    """
+
+    def __init__(self, maxsize=256, ttl_seconds=3600.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict() # key -> (waktu_simpan, nilai)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _expired(self, stored_at):
+        return self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds
+
+    def get(self, key):
+        """Nilai untuk key, atau None jika tidak ada / sudah kedaluwarsa."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[0]):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
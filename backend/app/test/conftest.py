@@ -0,0 +1,29 @@
+# backend/app/test/conftest.py
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from app import api
+from app.api import DATASET_PATH, LABEL_COL_IN_DATASET
+from app.preprocessing_data.columns import normalize_feature_columns
+
+# Jalankan dari folder backend: python -m pytest app/test
+
+
+@pytest.fixture(scope='session')
+def dataset_df():
+    """Dataset bawaan, dibaca langsung dari CSV (tanpa cache kolumnar), nama kolom dinormalisasi seperti di api.py."""
+    df = pd.read_csv(DATASET_PATH)
+    return normalize_feature_columns(df.dropna(subset=[LABEL_COL_IN_DATASET]), LABEL_COL_IN_DATASET)
+
+
+@pytest.fixture(scope='session')
+def species(dataset_df):
+    return sorted(dataset_df[LABEL_COL_IN_DATASET].unique())
+
+
+@pytest.fixture(scope='module')
+def client():
+    """TestClient dengan lifespan aplikasi (dataset dimuat, worker pool dibuat dan dihentikan)."""
+    with TestClient(api.app) as test_client:
+        yield test_client
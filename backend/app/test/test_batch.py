@@ -0,0 +1,58 @@
+# backend/app/test/test_batch.py
+
+import json
+from app import api
+
+# /simulate_evolution/batch: hasil per item sama dengan /simulate_evolution, urut sesuai request
+# (atau NDJSON dalam urutan selesai jika stream=true), dan item yang gagal tidak menggagalkan
+# item lain.
+
+TARGET = 'Australopithecus Afarensis'
+
+
+def _request(**ga_params):
+    return {'user_feature_inputs': {}, 'target_genus_specie': TARGET, 'ga_params': ga_params}
+
+
+BATCH = [
+    _request(seed=3),
+    _request(seed=5, num_generations=8),
+    _request(seed=1, population_size=5, elitism=10), # Tidak valid: elitism >= population_size
+]
+
+
+def _single(client, request):
+    api.result_cache.clear()
+    return client.post('/simulate_evolution', json=request).json()
+
+
+def test_batch_results_follow_request_order(client):
+    api.result_cache.clear()
+    response = client.post('/simulate_evolution/batch', json={'requests': BATCH})
+    assert response.status_code == 200
+    results = response.json()['results']
+
+    assert [item['index'] for item in results] == [0, 1, 2]
+    assert [item['status'] for item in results] == ['completed', 'completed', 'failed']
+    assert results[0]['result'] == _single(client, BATCH[0])
+    assert results[1]['result'] == _single(client, BATCH[1])
+    assert results[2]['status_code'] == 400
+    assert results[2]['result'] is None
+
+
+def test_batch_stream_sends_one_ndjson_line_per_item(client):
+    api.result_cache.clear()
+    response = client.post('/simulate_evolution/batch', json={'requests': BATCH, 'stream': True})
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    by_index = {item['index']: item for item in lines}
+    assert sorted(by_index) == [0, 1, 2]
+    assert by_index[0]['result'] == _single(client, BATCH[0])
+    assert by_index[1]['result'] == _single(client, BATCH[1])
+    assert by_index[2]['status'] == 'failed'
+
+
+def test_batch_rejects_empty_request_list(client):
+    assert client.post('/simulate_evolution/batch', json={'requests': []}).status_code == 422
@@ -0,0 +1,101 @@
+# backend/app/test/test_batch_runner.py
+
+import json
+import pytest
+from app import api, batch_runner
+from app.algorithm.chromosome_setup import FEATURE_ORDER
+
+# Runner batch offline: grid skenario diperluas dan divalidasi, record hasil sama dengan
+# api.run_simulation untuk seed yang sama, dan --resume hanya menjalankan skenario yang
+# belum 'completed' (baris terakhir yang terpotong dibuang).
+
+TARGETS = ['Australopithecus Afarensis', 'Homo Sapiens']
+USER_INPUTS = dict(zip(FEATURE_ORDER, ['Kenya', 'forest', 'small', 'climbing', 'dry fruits']))
+GRID = {
+    'targets': TARGETS,
+    'user_inputs': [USER_INPUTS],
+    'ga_params': [{'population_size': 20, 'num_generations': 5}],
+    'seeds': [0, 1],
+    'path_mode': 'changes',
+}
+
+
+@pytest.fixture(scope='module')
+def loaded_dataset():
+    if api.dataset_store.current() is None:
+        api.load_dataset_sync()
+    return api.dataset_store.current()
+
+
+def _write_grid(tmp_path, grid=GRID):
+    path = tmp_path / 'scenarios.json'
+    path.write_text(json.dumps(grid))
+    return str(path)
+
+
+def _read_records(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_expand_grid_and_load_scenarios(tmp_path):
+    scenarios = batch_runner.load_scenarios(_write_grid(tmp_path))
+    assert len(scenarios) == 4
+    assert [(s.target_genus_specie, s.ga_params.seed) for s in scenarios] == \
+        [(target, seed) for target in TARGETS for seed in (0, 1)]
+    assert all(s.path_mode == 'changes' and s.ga_params.population_size == 20 for s in scenarios)
+
+    jsonl_path = tmp_path / 'scenarios.jsonl'
+    jsonl_path.write_text('\n'.join(json.dumps(s.model_dump(mode='json')) for s in scenarios) + '\n\n')
+    assert batch_runner.load_scenarios(str(jsonl_path)) == scenarios
+
+    with pytest.raises(ValueError, match='targets'):
+        batch_runner.expand_grid({'seeds': [0]})
+    with pytest.raises(ValueError, match='Skenario 1'):
+        batch_runner.load_scenarios(_write_grid(tmp_path, dict(GRID, ga_params=[{}, {'population_size': 0}], seeds=[0])))
+
+
+def test_run_scenario_matches_run_simulation(tmp_path, loaded_dataset):
+    scenario = batch_runner.load_scenarios(_write_grid(tmp_path))[0]
+    record = batch_runner.run_scenario(0, scenario)
+    expected = api.run_simulation(scenario)
+
+    assert record['status'] == 'completed' and record['error'] is None
+    assert record['final_best_fitness'] == expected.final_best_fitness
+    assert {f: record[f'best_{f}'] for f in FEATURE_ORDER} == expected.final_best_features
+    assert record['ga_seed'] == 0 and record['ga_population_size'] == 20
+    assert record['dataset_fingerprint'] == loaded_dataset.fingerprint
+    assert record['evolution_path']['path_mode'] == 'changes'
+
+    invalid = scenario.model_copy(update={'ga_params': scenario.ga_params.model_copy(update={'elitism': 50})})
+    failed = batch_runner.run_scenario(1, invalid)
+    assert failed['status'] == 'failed' and failed['error']
+    assert failed['final_best_fitness'] is None
+
+
+def test_main_writes_jsonl_and_resumes(tmp_path, loaded_dataset):
+    scenarios_path = _write_grid(tmp_path)
+    output = str(tmp_path / 'results.jsonl')
+    batch_runner.main([scenarios_path, '--output', output, '--workers', '2'])
+    records = _read_records(output)
+    assert sorted(record['index'] for record in records) == [0, 1, 2, 3]
+    assert all(record['status'] == 'completed' and 'evolution_path' not in record for record in records)
+    by_index = {record['index']: record for record in records}
+
+    # Run terputus: dua record selesai dan satu baris terpotong
+    with open(output, 'w', encoding='utf-8') as f:
+        for index in (0, 2):
+            f.write(json.dumps(by_index[index]) + '\n')
+        f.write(json.dumps(by_index[1])[:40])
+    assert batch_runner.completed_indices(output) == {0, 2}
+
+    batch_runner.main([scenarios_path, '--output', output, '--workers', '2', '--resume'])
+    resumed = _read_records(output)
+    assert sorted(record['index'] for record in resumed) == [0, 1, 2, 3]
+    for record in resumed:
+        assert record['final_best_fitness'] == by_index[record['index']]['final_best_fitness']
+
+
+def test_main_rejects_resume_for_parquet(tmp_path):
+    with pytest.raises(SystemExit):
+        batch_runner.main([_write_grid(tmp_path), '--output', str(tmp_path / 'results.parquet'), '--resume'])
@@ -0,0 +1,76 @@
+# backend/app/test/test_classifier.py
+
+import numpy as np
+import pytest
+from app.algorithm import classifier as classifier_module
+from app.algorithm.chromosome_setup import FEATURE_ORDER, initialize_population
+from app.algorithm.classifier import SpeciesClassifier, get_species_classifier
+from app.algorithm.exact_solver import exact_method_for
+from app.algorithm.fitness import FitnessContext, calculate_population_fitness, get_target_profile
+from app.algorithm.profiles import dataset_fingerprint
+from app.api import (
+    LABEL_COL_IN_DATASET as LABEL_COL, ORIGINAL_NUMERICAL_COLS as NUMERICAL_COLS,
+    ORIGINAL_CATEGORICAL_COLS as CATEGORICAL_COLS,
+)
+
+# Komponen fitness classifier: peluang kelas target dari satu predict_proba per populasi,
+# dicampur dengan skor kemiripan sesuai bobot, dan model yang disimpan ke disk dimuat ulang
+# tanpa fit baru.
+
+TARGET = 'Australopithecus Afarensis'
+
+
+@pytest.fixture(scope='module')
+def species_classifier(dataset_df):
+    return SpeciesClassifier.fit(dataset_df, LABEL_COL, dataset_fingerprint(dataset_df))
+
+
+@pytest.fixture(scope='module')
+def population():
+    return initialize_population(200, rng=np.random.default_rng(5))
+
+
+def test_classifier_uses_every_feature_in_dataset(species_classifier):
+    assert species_classifier.feature_columns == FEATURE_ORDER
+
+
+def test_target_proba_matches_pipeline(species_classifier, species, population):
+    proba = species_classifier.predict_target_proba(population, TARGET)
+    assert proba.shape == (len(population),)
+    assert np.all((proba >= 0) & (proba <= 1))
+
+    all_proba = np.column_stack([species_classifier.predict_target_proba(population, s) for s in species])
+    np.testing.assert_allclose(all_proba.sum(axis=1), 1.0)
+    np.testing.assert_array_equal(species_classifier.predict_target_proba(population, 'Spesies Tidak Ada'), 0.0)
+    assert len(species_classifier.predict_target_proba(population[:0], TARGET)) == 0
+
+
+def test_classifier_weight_mixes_fitness(dataset_df, species_classifier, population):
+    profile = get_target_profile(TARGET, dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    similarity = calculate_population_fitness(population, FitnessContext(profile))
+    context = FitnessContext(profile, fitness_weights={'classifier': 0.4},
+                             classifier=species_classifier, target_genus_specie=TARGET)
+    np.testing.assert_allclose(
+        calculate_population_fitness(population, context),
+        0.6 * similarity + 0.4 * species_classifier.predict_target_proba(population, TARGET),
+    )
+    # Classifier memperhitungkan interaksi antar fitur: bukan separable, solver eksak harus enumerasi
+    assert exact_method_for(context) == 'enumeration'
+    with pytest.raises(ValueError):
+        FitnessContext(profile, fitness_weights={'classifier': 0.4})
+
+
+def test_persisted_classifier_is_reused(dataset_df, population, tmp_path, monkeypatch):
+    fingerprint = 'fp-test-' + dataset_fingerprint(dataset_df)
+    fitted = get_species_classifier(dataset_df, LABEL_COL, fingerprint, str(tmp_path))
+    assert get_species_classifier(dataset_df, LABEL_COL, fingerprint, str(tmp_path)) is fitted
+    assert list(tmp_path.glob('species_classifier_*.joblib'))
+
+    # Cache memori dikosongkan: model harus dimuat dari file, bukan di-fit ulang
+    monkeypatch.setattr(classifier_module, '_CLASSIFIER_CACHE', type(classifier_module._CLASSIFIER_CACHE)())
+    monkeypatch.setattr(SpeciesClassifier, 'fit', classmethod(lambda cls, *args: pytest.fail('fit ulang')))
+    loaded = get_species_classifier(dataset_df, LABEL_COL, fingerprint, str(tmp_path))
+    assert loaded is not fitted
+    np.testing.assert_array_equal(
+        loaded.predict_target_proba(population, TARGET), fitted.predict_target_proba(population, TARGET)
+    )
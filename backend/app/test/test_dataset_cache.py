@@ -0,0 +1,69 @@
+# backend/app/test/test_dataset_cache.py
+
+import numpy as np
+import pandas as pd
+from app.algorithm.profiles import dataset_fingerprint
+from app.preprocessing_data import dataset_cache
+from app.preprocessing_data.dataset_cache import load_dataset_cached
+
+# Cache kolumnar dataset: nilai sama dengan pd.read_csv (kolom teks menjadi category di atas kode
+# yang di-memory-map), hasil cache baru dan cache lama identik, dan CSV hanya di-hash ulang
+# jika file-nya berubah.
+
+
+def _write_csv(dataset_df, path, num_rows=300):
+    dataset_df.head(num_rows).to_csv(path, index=False)
+    return str(path)
+
+
+def _is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def test_cached_frame_matches_read_csv(dataset_df, tmp_path):
+    csv_path = _write_csv(dataset_df, tmp_path / 'data.csv')
+    expected = pd.read_csv(csv_path)
+    cached = load_dataset_cached(csv_path, cache_root=str(tmp_path / 'cache'))
+
+    assert list(cached.columns) == list(expected.columns)
+    for column in expected.columns:
+        if pd.api.types.is_numeric_dtype(expected[column].dtype):
+            assert cached[column].dtype == expected[column].dtype, column
+            assert _is_memory_mapped(cached[column].to_numpy())
+        else:
+            assert isinstance(cached[column].dtype, pd.CategoricalDtype), column
+            assert _is_memory_mapped(cached[column].array.codes)
+        pd.testing.assert_series_equal(
+            cached[column].astype(object), expected[column].astype(object), check_names=False
+        )
+
+
+def test_warm_load_matches_cold_load_without_rehashing(dataset_df, tmp_path, monkeypatch):
+    csv_path = _write_csv(dataset_df, tmp_path / 'data.csv')
+    cache_root = str(tmp_path / 'cache')
+    cold = load_dataset_cached(csv_path, cache_root=cache_root)
+
+    hashed = []
+    original_sha256 = dataset_cache.file_sha256
+    monkeypatch.setattr(dataset_cache, 'file_sha256', lambda path: hashed.append(path) or original_sha256(path))
+    warm = load_dataset_cached(csv_path, cache_root=cache_root)
+    assert hashed == []
+    pd.testing.assert_frame_equal(warm, cold)
+    assert dataset_fingerprint(warm) == dataset_fingerprint(cold)
+
+
+def test_changed_csv_rebuilds_cache(dataset_df, tmp_path):
+    csv_path = _write_csv(dataset_df, tmp_path / 'data.csv')
+    cache_root = str(tmp_path / 'cache')
+    load_dataset_cached(csv_path, cache_root=cache_root)
+
+    _write_csv(dataset_df, tmp_path / 'data.csv', num_rows=120)
+    reloaded = load_dataset_cached(csv_path, cache_root=cache_root)
+    assert len(reloaded) == 120
+    pd.testing.assert_series_equal(
+        reloaded.iloc[:, 0].astype(object), pd.read_csv(csv_path).iloc[:, 0].astype(object)
+    )
@@ -0,0 +1,75 @@
+# backend/app/test/test_encoders.py
+
+import numpy as np
+import pytest
+from scipy import sparse as sp
+from app.algorithm.classifier import SpeciesClassifier
+from app.api import LABEL_COL_IN_DATASET as LABEL_COL
+from app.preprocessing_data import encoders
+from app.preprocessing_data.encoders import SubsetEncoder, preprocess_data
+
+# preprocess_data (dense dan sparse) dan SubsetEncoder: setiap subset kolom dari matriks yang
+# di-encode sekali sama dengan preprocess_data pada subset itu, data baru di-encode dengan
+# SubsetTransformer secara identik, dan fit classifier memakai encoder yang sama per dataset.
+
+NUMERICAL = ['Time', 'Cranial_Capacity', 'Height']
+CATEGORICAL = ['Location', 'Habitat', 'Jaw_Shape', 'Diet']
+
+
+@pytest.fixture(scope='module')
+def sample_df(dataset_df):
+    return dataset_df[NUMERICAL + CATEGORICAL + [LABEL_COL]].sample(n=800, random_state=0)
+
+
+@pytest.fixture(scope='module')
+def subset_encoder(sample_df):
+    return SubsetEncoder(NUMERICAL, CATEGORICAL).fit(sample_df, LABEL_COL)
+
+
+def test_sparse_preprocess_matches_dense(sample_df):
+    X_dense, y, _, names = preprocess_data(sample_df, NUMERICAL, CATEGORICAL, LABEL_COL)
+    X_sparse, y_sparse, _, sparse_names = preprocess_data(sample_df, NUMERICAL, CATEGORICAL, LABEL_COL, sparse=True)
+    assert sp.isspmatrix_csr(X_sparse) or isinstance(X_sparse, sp.csr_array)
+    np.testing.assert_allclose(X_sparse.toarray(), X_dense)
+    np.testing.assert_array_equal(y_sparse, y)
+    assert list(sparse_names) == list(names)
+
+
+@pytest.mark.parametrize('subset', [
+    ['Height', 'Habitat', 'Diet'], # Blok tidak bersebelahan
+    ['Time', 'Cranial_Capacity'],
+    ['Diet', 'Location'], # Urutan mengikuti matriks, bukan urutan permintaan
+    [True, False, True, False, True, True, False], # Mask biner (urutan NUMERICAL + CATEGORICAL)
+])
+def test_subset_matches_preprocess_data(sample_df, subset_encoder, subset):
+    columns = subset_encoder._subset_columns(subset)
+    numerical = [c for c in columns if c in NUMERICAL]
+    categorical = [c for c in columns if c in CATEGORICAL]
+    expected, _, _, _ = preprocess_data(sample_df[columns + [LABEL_COL]], numerical, categorical, LABEL_COL)
+
+    X_subset, names = subset_encoder.transform_subset(subset)
+    np.testing.assert_allclose(X_subset.toarray(), expected)
+    assert len(names) == expected.shape[1]
+    assert subset_encoder.transform_subset(subset)[0] is X_subset # Dari cache LRU
+    # Data baru di-encode dengan transformer per kolom yang sama
+    np.testing.assert_allclose(subset_encoder.subset_transformer(subset).transform(sample_df).toarray(), expected)
+
+
+def test_subset_encoder_rejects_unknown_columns(subset_encoder):
+    with pytest.raises(ValueError):
+        subset_encoder.transform_subset(['Kolom_Tidak_Ada'])
+    with pytest.raises(ValueError):
+        subset_encoder.transform_subset([True, False])
+
+
+def test_classifier_fits_share_one_subset_encoder(dataset_df, monkeypatch):
+    fits = []
+    original_fit = SubsetEncoder.fit
+    monkeypatch.setattr(SubsetEncoder, 'fit', lambda self, *args: fits.append(1) or original_fit(self, *args))
+    monkeypatch.setattr(encoders, '_SUBSET_ENCODER_CACHE', type(encoders._SUBSET_ENCODER_CACHE)())
+
+    first = SpeciesClassifier.fit(dataset_df, LABEL_COL, 'fp-encoder-test')
+    second = SpeciesClassifier.fit(dataset_df, LABEL_COL, 'fp-encoder-test')
+    assert len(fits) == 1
+    rows = dataset_df.head(50)
+    np.testing.assert_array_equal(first.pipeline.predict_proba(rows), second.pipeline.predict_proba(rows))
@@ -0,0 +1,127 @@
+# backend/app/test/test_evolution_path.py
+
+import numpy as np
+import pytest
+from app import api
+from app.algorithm.chromosome_setup import FEATURE_ORDER, initialize_population
+from app.evolution_path import (
+    PATH_MODE_FULL, PATH_MODE_CHANGES, PATH_MODE_COLUMNAR, StreamingPathCompactor, compact_evolution_log,
+)
+
+# Mode jejak evolusi: 'changes' dan 'columnar' memuat informasi yang sama dengan 'full'
+# (bisa dibangun ulang), downsampling mempertahankan generasi pertama, terakhir dan fitness
+# tertinggi, dan StreamingPathCompactor mengikuti aturan yang sama dengan compact_evolution_log.
+
+TARGET = 'Australopithecus Afarensis'
+
+
+def _evolution_log(num_generations=60, seed=5):
+    """Log sintetis: kromosom terbaik hanya berganti sesekali, fitness naik-turun."""
+    rng = np.random.default_rng(seed)
+    chromosomes = initialize_population(num_generations, rng=rng)
+    log, current = [], chromosomes[0]
+    for generation in range(1, num_generations + 1):
+        if rng.random() < 0.25:
+            current = chromosomes[generation - 1]
+        log.append((generation, float(rng.random()), current.copy()))
+    return log
+
+
+def _forward_fill(steps):
+    features, filled = {}, []
+    for step in steps:
+        features = {**features, **step['features']}
+        filled.append({**step, 'features': features})
+    return filled
+
+
+def _rows(columns):
+    return [
+        {'generation': generation, 'fitness': fitness,
+         'features': {f: columns['features'][f][i] for f in FEATURE_ORDER}}
+        for i, (generation, fitness) in enumerate(zip(columns['generation'], columns['fitness']))
+    ]
+
+
+def test_changes_and_columnar_rebuild_full_path():
+    log = _evolution_log()
+    full = compact_evolution_log(log, PATH_MODE_FULL)
+    assert [step['generation'] for step in full] == list(range(1, 61))
+    assert all(list(step['features']) == FEATURE_ORDER for step in full)
+
+    changes = compact_evolution_log(log, PATH_MODE_CHANGES)
+    assert len(changes) < len(full)
+    assert changes[-1]['generation'] == 60
+    full_by_generation = {step['generation']: step for step in full}
+    for step in _forward_fill(changes):
+        assert step == full_by_generation[step['generation']]
+    # Setiap generasi yang tidak dikirim sama dengan langkah terakhir sebelumnya
+    sent = [step['generation'] for step in changes]
+    for step in full:
+        previous = max(g for g in sent if g <= step['generation'])
+        assert step['features'] == full_by_generation[previous]['features']
+
+    assert _rows(compact_evolution_log(log, PATH_MODE_COLUMNAR)) == full
+
+
+@pytest.mark.parametrize('mode', [PATH_MODE_FULL, PATH_MODE_CHANGES])
+def test_downsampling_keeps_first_last_and_best(mode):
+    log = _evolution_log()
+    best_generation = max(log, key=lambda entry: entry[1])[0]
+    steps = compact_evolution_log(log, mode, max_points=8)
+    generations = [step['generation'] for step in steps]
+    assert len(steps) <= 8
+    assert generations == sorted(generations)
+    assert generations[0] == 1 and generations[-1] == 60
+    if mode == PATH_MODE_FULL:
+        assert best_generation in generations
+    assert len(compact_evolution_log(log, mode, max_points=2)) == 2
+
+
+def test_empty_log_and_unknown_mode():
+    assert compact_evolution_log([], PATH_MODE_FULL) == []
+    assert compact_evolution_log([], PATH_MODE_COLUMNAR)['generation'] == []
+    with pytest.raises(ValueError):
+        compact_evolution_log(_evolution_log(), 'delta')
+    with pytest.raises(ValueError):
+        StreamingPathCompactor(PATH_MODE_FULL, max_points=5)
+
+
+def _stream(log, mode, max_points=None):
+    compactor = StreamingPathCompactor(mode, max_points, num_generations=len(log))
+    steps = []
+    for generation, fitness, chromosome in log:
+        steps.extend(compactor.push(generation, fitness, chromosome))
+    return steps + compactor.finish()
+
+
+@pytest.mark.parametrize('mode', [PATH_MODE_FULL, PATH_MODE_CHANGES])
+def test_streaming_compactor_matches_compact_evolution_log(mode):
+    log = _evolution_log()
+    assert _stream(log, mode) == compact_evolution_log(log, mode)
+    assert _stream(log, PATH_MODE_COLUMNAR) == compact_evolution_log(log, PATH_MODE_FULL)
+
+    downsampled = _stream(log, mode, max_points=8)
+    assert len(downsampled) <= 8
+    assert downsampled[0]['generation'] == 1 and downsampled[-1]['generation'] == 60
+
+
+def test_simulation_path_modes(client):
+    base = {'user_feature_inputs': dict(zip(FEATURE_ORDER, ['Kenya', 'forest', 'small', 'climbing', 'dry fruits'])),
+            'target_genus_specie': TARGET, 'ga_params': {'seed': 3, 'num_generations': 30}}
+    api.result_cache.clear()
+    full = client.post('/simulate_evolution', json=base).json()
+    assert full['path_mode'] == PATH_MODE_FULL and full['evolution_path_columns'] is None
+
+    columnar = client.post('/simulate_evolution', json={**base, 'path_mode': 'columnar'}).json()
+    assert columnar['evolution_path'] == []
+    assert _rows(columnar['evolution_path_columns']) == \
+        [{key: step[key] for key in ('generation', 'fitness', 'features')} for step in full['evolution_path']]
+
+    changes = client.post('/simulate_evolution', json={**base, 'path_mode': 'changes', 'path_max_points': 4}).json()
+    assert len(changes['evolution_path']) <= 4
+    assert changes['evolution_path'][-1]['generation'] == 30
+    assert changes['final_best_fitness'] == full['final_best_fitness']
+
+    assert client.post('/simulate_evolution', json={**base, 'path_max_points': 1}).status_code == 422
+    assert client.post('/simulate_evolution', json={**base, 'path_mode': 'delta'}).status_code == 422
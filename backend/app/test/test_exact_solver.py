@@ -0,0 +1,56 @@
+# backend/app/test/test_exact_solver.py
+
+import pytest
+from app.algorithm.exact_solver import (
+    METHOD_SEPARABLE, METHOD_ENUMERATION, exact_method_for, solve_exact,
+)
+from app.algorithm.fitness import FitnessContext, get_target_profile
+from app.api import (
+    LABEL_COL_IN_DATASET as LABEL_COL, ORIGINAL_NUMERICAL_COLS as NUMERICAL_COLS,
+    ORIGINAL_CATEGORICAL_COLS as CATEGORICAL_COLS,
+)
+
+# Solver eksak: metode separable (per fitur) dan enumerasi penuh menemukan optimum yang sama,
+# dan lewat API hasilnya tidak pernah kalah dari GA untuk input pengguna yang sama.
+
+TARGET = 'Australopithecus Afarensis'
+USER_INPUTS = {'Habitat': 'forest', 'Diet': 'dry fruits'}
+# Semua fitur diisi: fitur yang kosong diisi acak per request, sehingga fitness GA dan
+# solver eksak baru sebanding jika input pengguna lengkap
+FULL_USER_INPUTS = {'Current_Country': 'Kenya', 'Habitat': 'forest', 'Canine_Size': 'big',
+                    'Arms': 'climbing', 'Diet': 'dry fruits'}
+
+
+@pytest.mark.parametrize('user_input_dict', [None, USER_INPUTS])
+def test_separable_solution_matches_enumeration(dataset_df, species, user_input_dict):
+    for target in species:
+        profile = get_target_profile(target, dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+        context = FitnessContext(profile, user_input_dict)
+        assert exact_method_for(context) == METHOD_SEPARABLE
+        _, separable_fitness, _ = solve_exact(context, METHOD_SEPARABLE)
+        _, enumeration_fitness, _ = solve_exact(context, METHOD_ENUMERATION)
+        assert separable_fitness == pytest.approx(enumeration_fitness), f"target {target!r}"
+
+
+def _simulate(client, solver, **ga_params):
+    payload = {'user_feature_inputs': FULL_USER_INPUTS, 'target_genus_specie': TARGET, 'solver': solver,
+               'ga_params': ga_params}
+    response = client.post('/simulate_evolution', json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_exact_solver_is_at_least_as_good_as_ga(client):
+    exact = _simulate(client, 'exact')
+    assert exact['solver_used'] == 'exact'
+    assert exact['stop_reason'] == 'exact_solution'
+    assert [step['generation'] for step in exact['evolution_path']] == [0]
+    for seed in (1, 2, 3):
+        ga = _simulate(client, 'ga', seed=seed)
+        assert ga['solver_used'] == 'ga'
+        assert exact['final_best_fitness'] >= ga['final_best_fitness'] - 1e-12
+
+
+def test_auto_solver_keeps_client_ga_params(client):
+    assert _simulate(client, 'auto')['solver_used'] == 'exact'
+    assert _simulate(client, 'auto', seed=3, num_generations=5)['solver_used'] == 'ga'
@@ -0,0 +1,56 @@
+# backend/app/test/test_fitness.py
+
+import json
+import os
+import numpy as np
+import pytest
+from app.algorithm.chromosome_setup import FEATURE_ORDER, initialize_population, decode_chromosome
+from app.algorithm.fitness import (
+    FitnessContext, calculate_population_fitness, calculate_feature_similarity, get_target_profile,
+)
+from app.api import (
+    LABEL_COL_IN_DATASET as LABEL_COL, ORIGINAL_NUMERICAL_COLS as NUMERICAL_COLS,
+    ORIGINAL_CATEGORICAL_COLS as CATEGORICAL_COLS,
+)
+
+# Paritas calculate_population_fitness (tervektorisasi, dipakai GA) dengan
+# calculate_feature_similarity (versi per-kromosom) pada individu yang sama.
+
+PAYLOAD_PATH = os.path.join(os.path.dirname(__file__), 'request_payload.json')
+
+
+def _user_inputs():
+    """Input pengguna dari request_payload.json, hanya fitur FEATURE_ORDER."""
+    with open(PAYLOAD_PATH, encoding='utf-8') as f:
+        payload = json.load(f)
+    return {f: v for f, v in payload['user_feature_inputs'].items() if f in FEATURE_ORDER}
+
+
+def _reference_fitness(population, target_profile, user_input_dict):
+    return np.array([
+        calculate_feature_similarity(dict(zip(FEATURE_ORDER, decode_chromosome(chromosome))),
+                                     target_profile, user_input_dict)
+        for chromosome in population
+    ])
+
+
+@pytest.mark.parametrize('user_input_dict', [None, {}, 'payload', {'Habitat': 'forest', 'Diet': 'unknown diet'}])
+def test_population_fitness_matches_feature_similarity(dataset_df, species, user_input_dict):
+    if user_input_dict == 'payload':
+        user_input_dict = _user_inputs()
+    population = initialize_population(300, rng=np.random.default_rng(7))
+    for target in species:
+        target_profile = get_target_profile(target, dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+        context = FitnessContext(target_profile, user_input_dict)
+        np.testing.assert_array_equal(
+            calculate_population_fitness(population, context),
+            _reference_fitness(population, target_profile, user_input_dict),
+            err_msg=f"target {target!r}",
+        )
+
+
+def test_population_fitness_without_target_profile_is_zero():
+    population = initialize_population(20, rng=np.random.default_rng(0))
+    context = FitnessContext(None, _user_inputs())
+    np.testing.assert_array_equal(calculate_population_fitness(population, context), np.zeros(20))
+    assert calculate_feature_similarity({}, None, _user_inputs()) == 0.0
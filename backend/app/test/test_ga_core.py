@@ -0,0 +1,95 @@
+# backend/app/test/test_ga_core.py
+
+import logging
+import threading
+import numpy as np
+import pytest
+from app.algorithm import ga_core
+from app.algorithm.ga_core import GeneticAlgorithmFeatureSelection
+from app.api import (
+    LABEL_COL_IN_DATASET as LABEL_COL, ORIGINAL_NUMERICAL_COLS as NUMERICAL_COLS,
+    ORIGINAL_CATEGORICAL_COLS as CATEGORICAL_COLS,
+)
+
+# Elitisme dan kriteria berhenti GA: pembatalan (juga sebelum generasi pertama), target fitness,
+# stagnasi (patience) dan batas jumlah evaluasi.
+
+TARGET = 'Australopithecus Afarensis'
+
+
+def _ga(dataset_df, **kwargs):
+    params = dict(population_size=30, num_generations=25, seed=4, mutation_prob=0.2)
+    params.update(kwargs)
+    return GeneticAlgorithmFeatureSelection(
+        dataset_df, LABEL_COL, NUMERICAL_COLS, CATEGORICAL_COLS, TARGET, {}, **params
+    )
+
+
+class RecordingMetrics:
+    def __init__(self):
+        self.generations = 0
+        self.stop_reasons = []
+
+    def record_generation(self, phase_seconds, num_evaluations):
+        self.generations += 1
+
+    def record_run(self, stop_reason):
+        self.stop_reasons.append(stop_reason)
+
+
+def test_cancel_before_first_generation(dataset_df, caplog):
+    cancel_event = threading.Event()
+    cancel_event.set()
+    metrics = RecordingMetrics()
+    ga = _ga(dataset_df, cancel_event=cancel_event, metrics=metrics)
+    with caplog.at_level(logging.INFO, logger=ga_core.__name__):
+        best_chromosome, best_fitness, _, convergence_log = ga.run()
+
+    assert ga.stop_reason == ga_core.STOP_CANCELLED
+    assert best_chromosome is None
+    assert best_fitness == -float('inf')
+    assert convergence_log == []
+    assert ga.num_evaluations == 0
+    assert (metrics.generations, metrics.stop_reasons) == (0, [ga_core.STOP_CANCELLED])
+    assert 'alasan berhenti: cancelled' in caplog.text
+
+
+def test_elitism_keeps_best_fitness_in_every_generation(dataset_df):
+    ga = _ga(dataset_df, elitism=2)
+    previous = -float('inf')
+    for update in ga.iter_generations():
+        # Elit masuk populasi berikutnya, jadi terbaik per generasi tidak pernah turun
+        assert update['generation_best_fitness'] >= previous
+        previous = update['generation_best_fitness']
+    assert ga.stop_reason == ga_core.STOP_MAX_GENERATIONS
+
+
+def test_elitism_must_be_smaller_than_population(dataset_df):
+    with pytest.raises(ValueError):
+        _ga(dataset_df, population_size=5, elitism=5)
+
+
+def test_target_fitness_stops_early(dataset_df):
+    ga = _ga(dataset_df, target_fitness=0.0)
+    _, best_fitness, _, convergence_log = ga.run()
+    assert ga.stop_reason == ga_core.STOP_TARGET_FITNESS
+    assert len(convergence_log) == 1
+    assert best_fitness >= 0.0
+
+
+def test_patience_stops_after_stagnation(dataset_df):
+    ga = _ga(dataset_df, patience=2, num_generations=500)
+    _, _, _, convergence_log = ga.run()
+    assert ga.stop_reason == ga_core.STOP_STAGNATION
+    fitness = np.array([f for _, f, _ in convergence_log])
+    best_so_far = np.maximum.accumulate(fitness)
+    assert best_so_far[-1] == best_so_far[-3] # Dua generasi terakhir tanpa perbaikan
+
+
+def test_max_evaluations_is_never_exceeded(dataset_df):
+    ga = _ga(dataset_df, max_evaluations=100)
+    ga.run()
+    assert ga.stop_reason == ga_core.STOP_MAX_EVALUATIONS
+    assert ga.num_evaluations == 90
+    with pytest.raises(ValueError):
+        _ga(dataset_df, max_evaluations=10).run()
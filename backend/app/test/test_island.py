@@ -0,0 +1,99 @@
+# backend/app/test/test_island.py
+
+import multiprocessing
+import numpy as np
+from app.algorithm.island import IslandModelGA, TOPOLOGY_RING, TOPOLOGY_FULLY_CONNECTED
+from app.algorithm.parallel import WORKER_START_METHOD
+from app.api import (
+    LABEL_COL_IN_DATASET as LABEL_COL, ORIGINAL_NUMERICAL_COLS as NUMERICAL_COLS,
+    ORIGINAL_CATEGORICAL_COLS as CATEGORICAL_COLS,
+)
+
+# Model pulau: proses pulau (forkserver/spawn, bukan fork) bertukar emigran setiap
+# migration_interval generasi, hasil ber-seed dapat direproduksi, dan semua proses pulau
+# berhenti saat run selesai maupun saat generator ditutup di tengah jalan.
+
+TARGET = 'Australopithecus Afarensis'
+
+
+class RecordingIslandModelGA(IslandModelGA):
+    """IslandModelGA yang mencatat imigran yang diteruskan ke pulau-pulau."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.migrations = []
+
+    def _route_migrants(self, updates):
+        immigrants = super()._route_migrants(updates)
+        self.migrations.append((updates, immigrants))
+        return immigrants
+
+
+def _island_ga(dataset_df, topology=TOPOLOGY_RING, **kwargs):
+    params = dict(population_size=20, num_generations=6, seed=21, elitism=1,
+                  num_islands=3, migration_interval=2, migration_size=2, topology=topology)
+    params.update(kwargs)
+    return RecordingIslandModelGA(
+        dataset_df, LABEL_COL, NUMERICAL_COLS, CATEGORICAL_COLS, TARGET, {}, **params
+    )
+
+
+def _island_processes():
+    return [p for p in multiprocessing.active_children() if p.name.startswith(('ForkServerProcess', 'SpawnProcess'))]
+
+
+def test_worker_processes_are_not_forked():
+    assert WORKER_START_METHOD in ('forkserver', 'spawn')
+
+
+def test_islands_migrate_and_terminate(dataset_df):
+    ga = _island_ga(dataset_df)
+    best_chromosome, best_fitness, _, convergence_log = ga.run()
+
+    assert ga.stop_reason == 'max_generations'
+    assert [gen for gen, _, _ in convergence_log] == list(range(1, 7))
+    assert best_fitness == max(fitness for _, fitness, _ in convergence_log)
+    assert ga.num_evaluations == 6 * 3 * 20
+    # Migrasi di generasi 2 dan 4 (generasi 6 adalah generasi terakhir)
+    assert len(ga.migrations) == 2
+    for updates, immigrants in ga.migrations:
+        for island in range(3):
+            source = updates[(island - 1) % 3]
+            np.testing.assert_array_equal(immigrants[island], source['emigrants'])
+            assert immigrants[island].shape == (2, best_chromosome.shape[0])
+            assert source['emigrant_fitness'][0] == max(source['emigrant_fitness'])
+    assert _island_processes() == []
+
+
+def test_fully_connected_islands_receive_best_emigrants(dataset_df):
+    ga = _island_ga(dataset_df, topology=TOPOLOGY_FULLY_CONNECTED, num_generations=3, migration_interval=1)
+    ga.run()
+    assert len(ga.migrations) == 2
+    for updates, immigrants in ga.migrations:
+        for island in range(3):
+            others = [u for j, u in enumerate(updates) if j != island]
+            candidates = np.concatenate([u['emigrants'] for u in others]).tolist()
+            candidate_fitness = np.concatenate([u['emigrant_fitness'] for u in others])
+            assert len(immigrants[island]) == 2
+            assert all(row in candidates for row in immigrants[island].tolist())
+            # Emigran terbaik (boleh ada beberapa dengan fitness sama) selalu ikut menjadi imigran
+            received_fitness = [f for row, f in zip(candidates, candidate_fitness) if row in immigrants[island].tolist()]
+            assert max(received_fitness) == candidate_fitness.max()
+    assert _island_processes() == []
+
+
+def test_seeded_island_run_is_reproducible(dataset_df):
+    first = _island_ga(dataset_df).run()
+    second = _island_ga(dataset_df).run()
+    assert first[0].tolist() == second[0].tolist()
+    assert [(gen, fitness) for gen, fitness, _ in first[3]] == [(gen, fitness) for gen, fitness, _ in second[3]]
+
+
+def test_closing_generator_stops_islands(dataset_df):
+    ga = _island_ga(dataset_df, num_generations=1000)
+    generations = ga.iter_generations(keep_log=False)
+    for update in generations:
+        if update['generation'] == 2:
+            break
+    generations.close()
+    assert _island_processes() == []
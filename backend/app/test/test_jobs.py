@@ -0,0 +1,59 @@
+# backend/app/test/test_jobs.py
+
+import time
+from concurrent.futures import wait
+from app import api
+
+# API job asinkron: POST /jobs menjadwalkan simulasi di worker pool, GET /jobs/{id} memberi
+# status dan hasil, DELETE /jobs/{id} membatalkan job dan job tetap bisa di-GET sesudahnya.
+
+TARGET = 'Australopithecus Afarensis'
+
+
+def _payload(**ga_params):
+    return {'user_feature_inputs': {}, 'target_genus_specie': TARGET, 'ga_params': ga_params}
+
+
+def _wait_for_status(client, job_id, statuses, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        body = client.get(f'/jobs/{job_id}').json()
+        if body['status'] in statuses or time.monotonic() > deadline:
+            return body
+        time.sleep(0.05)
+
+
+def test_submitted_job_completes_with_simulation_result(client):
+    submitted = client.post('/jobs', json=_payload(seed=3))
+    assert submitted.status_code == 202
+    job_id = submitted.json()['job_id']
+    assert submitted.json()['status'] in ('pending', 'running', 'completed')
+
+    body = _wait_for_status(client, job_id, ('completed', 'failed'))
+    assert body['status'] == 'completed', body['error']
+    assert body['finished_at'] >= body['created_at']
+    api.result_cache.clear()
+    expected = client.post('/simulate_evolution', json=_payload(seed=3)).json()
+    assert body['result'] == expected
+
+
+def test_deleted_job_is_cancelled_and_stops(client):
+    job_id = client.post('/jobs', json=_payload(seed=1, population_size=20, num_generations=1_000_000)).json()['job_id']
+    _wait_for_status(client, job_id, ('running',))
+
+    deleted = client.delete(f'/jobs/{job_id}')
+    assert deleted.status_code == 200
+    assert deleted.json()['status'] == 'cancelled'
+    assert deleted.json()['finished_at'] is not None
+
+    # Job tetap ada setelah dibatalkan, dan GA-nya berhenti di generasi berikutnya
+    body = client.get(f'/jobs/{job_id}').json()
+    assert body['status'] == 'cancelled'
+    assert body['result'] is None
+    done, _ = wait([api.job_manager.get(job_id).future], timeout=30)
+    assert done
+
+
+def test_unknown_job_is_404(client):
+    assert client.get('/jobs/tidak-ada').status_code == 404
+    assert client.delete('/jobs/tidak-ada').status_code == 404
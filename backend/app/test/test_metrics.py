@@ -0,0 +1,78 @@
+# backend/app/test/test_metrics.py
+
+import pytest
+from app import api
+from app.metrics import Registry, Counter, Gauge, Histogram
+
+# Metrik Prometheus: format teks counter/gauge/histogram, dan /metrics yang mencatat generasi,
+# evaluasi dan run GA serta latensi request per route.
+
+TARGET = 'Australopithecus Afarensis'
+
+
+def _samples(text):
+    """Halaman /metrics -> {nama_sampel_dengan_label: nilai}."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_metrics_render_prometheus_text():
+    registry = Registry()
+    counter = Counter('jobs', 'Jumlah job.', ['status'], registry=registry)
+    gauge = Gauge('antrian', 'Panjang antrian.', registry=registry)
+    histogram = Histogram('durasi', 'Durasi.', buckets=(0.1, 1.0), registry=registry)
+    counter.inc(status='ok')
+    counter.inc(2, status='ok')
+    gauge.set(3)
+    gauge.dec()
+    for value in (0.05, 0.1, 0.5, 7.0):
+        histogram.observe(value)
+
+    text = registry.render()
+    assert '# TYPE jobs counter' in text and '# TYPE durasi histogram' in text
+    assert _samples(text) == {
+        'jobs_total{status="ok"}': 3.0,
+        'antrian': 2.0,
+        'durasi_bucket{le="0.1"}': 2.0,
+        'durasi_bucket{le="1.0"}': 3.0,
+        'durasi_bucket{le="+Inf"}': 4.0,
+        'durasi_sum': 7.65,
+        'durasi_count': 4.0,
+    }
+
+
+def test_metrics_reject_invalid_use():
+    registry = Registry()
+    counter = Counter('jobs', 'Jumlah job.', ['status'], registry=registry)
+    with pytest.raises(ValueError):
+        counter.inc(-1, status='ok')
+    with pytest.raises(ValueError):
+        counter.inc(route='/x')
+    with pytest.raises(ValueError):
+        Counter('jobs', 'Duplikat.', registry=registry)
+
+
+def test_metrics_endpoint_counts_ga_work(client):
+    before = _samples(client.get('/metrics').text)
+    api.result_cache.clear()
+    payload = {'user_feature_inputs': {}, 'target_genus_specie': TARGET,
+               'ga_params': {'seed': 3, 'population_size': 20, 'num_generations': 5}}
+    assert client.post('/simulate_evolution', json=payload).status_code == 200
+
+    response = client.get('/metrics')
+    assert response.headers['content-type'].startswith('text/plain; version=0.0.4')
+    after = _samples(response.text)
+
+    def delta(name):
+        return after.get(name, 0.0) - before.get(name, 0.0)
+
+    assert delta('ga_generations_total') == 5
+    assert delta('ga_fitness_evaluations_total') == 100
+    assert delta('ga_runs_total{stop_reason="max_generations"}') == 1
+    assert delta('ga_phase_duration_seconds_count{phase="evaluate"}') == 5
+    assert delta('http_request_duration_seconds_count{method="POST",route="/simulate_evolution",status="200"}') == 1
+    assert after['http_requests_in_progress'] == 1 # Request /metrics ini sendiri
@@ -0,0 +1,40 @@
+# backend/app/test/test_parallel.py
+
+import numpy as np
+from app.algorithm.chromosome_setup import initialize_population
+from app.algorithm.fitness import FitnessContext, calculate_population_fitness, get_target_profile
+from app.algorithm.ga_core import GeneticAlgorithmFeatureSelection
+from app.algorithm.parallel import ParallelFitnessEvaluator
+from app.api import (
+    LABEL_COL_IN_DATASET as LABEL_COL, ORIGINAL_NUMERICAL_COLS as NUMERICAL_COLS,
+    ORIGINAL_CATEGORICAL_COLS as CATEGORICAL_COLS,
+)
+
+# Evaluasi fitness paralel (ParallelFitnessEvaluator, n_jobs > 1) harus memberi hasil yang
+# sama dengan evaluasi serial, baik per populasi maupun untuk satu run GA ber-seed.
+
+TARGET = 'Australopithecus Afarensis'
+USER_INPUTS = {'Habitat': 'forest', 'Diet': 'dry fruits'}
+
+
+def test_parallel_evaluator_matches_serial(dataset_df):
+    profile = get_target_profile(TARGET, dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    context = FitnessContext(profile, USER_INPUTS)
+    population = initialize_population(101, rng=np.random.default_rng(1))
+    with ParallelFitnessEvaluator(context, n_jobs=2, chunks_per_job=3) as evaluator:
+        parallel_scores = evaluator.evaluate(population)
+        assert len(evaluator.evaluate(population[:0])) == 0
+    np.testing.assert_array_equal(parallel_scores, calculate_population_fitness(population, context))
+
+
+def _run_ga(dataset_df, n_jobs):
+    ga = GeneticAlgorithmFeatureSelection(
+        dataset_df, LABEL_COL, NUMERICAL_COLS, CATEGORICAL_COLS, TARGET, USER_INPUTS,
+        population_size=40, num_generations=8, seed=13, n_jobs=n_jobs,
+    )
+    best_chromosome, best_fitness, _, convergence_log = ga.run()
+    return best_chromosome.tolist(), best_fitness, [(gen, fitness) for gen, fitness, _ in convergence_log]
+
+
+def test_parallel_ga_matches_serial_ga(dataset_df):
+    assert _run_ga(dataset_df, n_jobs=2) == _run_ga(dataset_df, n_jobs=1)
@@ -0,0 +1,55 @@
+# backend/app/test/test_profiles.py
+
+import pandas as pd
+from app.algorithm import profiles
+from app.algorithm.fitness import get_target_profile, get_cached_target_profile
+from app.algorithm.profiles import SpeciesProfileIndex
+from app.api import (
+    LABEL_COL_IN_DATASET as LABEL_COL, ORIGINAL_NUMERICAL_COLS as NUMERICAL_COLS,
+    ORIGINAL_CATEGORICAL_COLS as CATEGORICAL_COLS,
+)
+
+# Paritas SpeciesProfileIndex.from_dataframe (satu groupby untuk semua spesies) dengan
+# get_target_profile (per spesies); paritas ProfileAccumulator ada di test_upload.py.
+# get_profile_index (fallback tanpa profile_index) meng-hash setiap DataFrame sekali saja.
+
+
+def test_profile_index_matches_get_target_profile(dataset_df, species):
+    index = SpeciesProfileIndex.from_dataframe(dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    assert sorted(index.species()) == species
+    for target in species:
+        assert index.get(target) == get_target_profile(
+            target, dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL
+        ), f"target {target!r}"
+
+
+def test_profile_index_unknown_species(dataset_df):
+    index = SpeciesProfileIndex.from_dataframe(dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    assert index.get('Spesies Tidak Ada') is None
+    assert get_target_profile('Spesies Tidak Ada', dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL) is None
+
+
+def test_profile_index_skips_missing_columns(dataset_df, species):
+    reduced_df = pd.DataFrame(dataset_df.drop(columns=['Diet']))
+    index = SpeciesProfileIndex.from_dataframe(reduced_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    for target in species:
+        assert 'Diet' not in index.get(target)
+        assert index.get(target) == get_target_profile(
+            target, reduced_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL
+        )
+
+
+def test_get_profile_index_hashes_each_dataframe_once(dataset_df, species, monkeypatch):
+    calls = []
+    original_fingerprint = profiles.dataset_fingerprint
+    monkeypatch.setattr(profiles, 'dataset_fingerprint', lambda df: calls.append(1) or original_fingerprint(df))
+    df = dataset_df.copy()
+    for target in species[:3]:
+        assert get_cached_target_profile(target, df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL) == \
+            get_target_profile(target, df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    assert len(calls) == 1
+
+    # DataFrame lain (isi berbeda) tidak memakai index DataFrame sebelumnya
+    other_df = df[df[LABEL_COL] != species[0]]
+    assert get_cached_target_profile(species[0], other_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL) is None
+    assert len(calls) == 2
@@ -0,0 +1,77 @@
+# backend/app/test/test_seeded_runs.py
+
+import json
+import os
+import pytest
+from app import api
+from app import result_cache
+from app.result_cache import ResultCache, request_cache_key
+
+# Reprodusibilitas /simulate_evolution: request dengan seed yang sama harus menghasilkan
+# respons yang sama persis. Result cache dikosongkan di antara request agar GA benar-benar
+# dijalankan ulang (bukan hasil cache). ResultCache sendiri diuji untuk LRU dan TTL.
+
+PAYLOAD_PATH = os.path.join(os.path.dirname(__file__), 'request_payload.json')
+TARGET = 'Australopithecus Afarensis'
+
+
+def _simulate(client, payload):
+    api.result_cache.clear()
+    response = client.post('/simulate_evolution', json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.parametrize('ga_params', [
+    {'seed': 3},
+    {'seed': 11, 'population_size': 30, 'num_generations': 15, 'elitism': 2},
+    {'seed': 5, 'num_generations': 10, 'mutation_prob': 0.2, 'patience': 3},
+])
+def test_seeded_simulation_is_reproducible(client, ga_params):
+    payload = {'user_feature_inputs': {}, 'target_genus_specie': TARGET, 'ga_params': ga_params}
+    first = _simulate(client, payload)
+    second = _simulate(client, payload)
+    assert first == second
+
+
+def test_seeded_simulation_with_payload_inputs_is_reproducible(client):
+    with open(PAYLOAD_PATH, encoding='utf-8') as f:
+        payload = json.load(f)
+    payload['ga_params'] = dict(payload.get('ga_params', {}), seed=42)
+    assert _simulate(client, payload) == _simulate(client, payload)
+
+
+def test_seeded_simulation_matches_cached_response(client):
+    payload = {'user_feature_inputs': {}, 'target_genus_specie': TARGET, 'ga_params': {'seed': 3}}
+    fresh = _simulate(client, payload)
+    cached = client.post('/simulate_evolution', json=payload) # Tidak dikosongkan: dari result cache
+    assert cached.status_code == 200
+    assert cached.json() == fresh
+
+
+def test_request_cache_key_is_canonical():
+    key = request_cache_key({'a': 1, 'b': [1, 2]}, 'fp')
+    assert key == request_cache_key({'b': [1, 2], 'a': 1}, 'fp')
+    assert key != request_cache_key({'a': 1, 'b': [1, 2]}, 'fp-lain')
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ResultCache(maxsize=2, ttl_seconds=None)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1 # 'b' sekarang yang paling lama tidak dipakai
+    cache.put('c', 3)
+    assert (cache.get('a'), cache.get('b'), cache.get('c')) == (1, None, 3)
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_result_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(result_cache.time, 'monotonic', lambda: now[0])
+    cache = ResultCache(maxsize=4, ttl_seconds=10.0)
+    cache.put('a', 1)
+    now[0] += 10.0
+    assert cache.get('a') == 1
+    now[0] += 0.5
+    assert cache.get('a') is None
+    assert len(cache) == 0
@@ -0,0 +1,64 @@
+# backend/app/test/test_stream.py
+
+import asyncio
+import json
+from app import api
+
+# /simulate_evolution/stream (SSE): satu event 'generation' per generasi lalu event 'result',
+# konsisten dengan respons /simulate_evolution untuk seed yang sama. Persiapan GA dijalankan
+# di luar event loop.
+
+TARGET = 'Australopithecus Afarensis'
+
+
+def _payload(**ga_params):
+    return {'user_feature_inputs': {}, 'target_genus_specie': TARGET, 'ga_params': ga_params}
+
+
+def _read_events(response):
+    events = []
+    for block in response.text.strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in block.splitlines())
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+def test_stream_matches_simulation_response(client):
+    payload = _payload(seed=3, num_generations=12)
+    response = client.post('/simulate_evolution/stream', json=payload)
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/event-stream')
+    events = _read_events(response)
+
+    assert [event for event, _ in events] == ['generation'] * 12 + ['result']
+    steps = [data for event, data in events if event == 'generation']
+    assert [step['generation'] for step in steps] == list(range(1, 13))
+    assert all(step['elapsed_seconds'] is not None for step in steps)
+
+    api.result_cache.clear()
+    expected = client.post('/simulate_evolution', json=payload).json()
+    result = events[-1][1]
+    assert result['final_best_fitness'] == expected['final_best_fitness']
+    assert result['final_best_features'] == expected['final_best_features']
+    assert result['evolution_path'] == []
+    assert [{key: step[key] for key in ('generation', 'fitness', 'features')} for step in steps] == \
+        [{key: step[key] for key in ('generation', 'fitness', 'features')} for step in expected['evolution_path']]
+
+
+def test_stream_prepares_simulation_off_the_event_loop(client, monkeypatch):
+    on_event_loop = []
+    original_prepare = api._prepare_simulation
+
+    def recording_prepare(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(True)
+        except RuntimeError:
+            on_event_loop.append(False)
+        return original_prepare(*args, **kwargs)
+
+    monkeypatch.setattr(api, '_prepare_simulation', recording_prepare)
+    response = client.post('/simulate_evolution/stream', json=_payload(seed=3, num_generations=2))
+    assert response.status_code == 200
+    assert on_event_loop == [False]
+
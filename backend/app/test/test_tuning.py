@@ -0,0 +1,121 @@
+# backend/app/test/test_tuning.py
+
+import json
+from concurrent.futures import Future
+import numpy as np
+import pytest
+from app import api, tuning
+from app.recommendations import ParameterRecommendations, RECOMMENDED_PARAM_NAMES
+
+# Tuning successive halving: sampling konfigurasi di SEARCH_SPACE, urutan fitness per CPU-second
+# dengan toleransi fitness, rung berhenti pada satu pemenang dan memakai ulang hasil seed
+# sebelumnya, dan rekomendasi hanya dipakai API jika request meminta (use_recommended_params).
+
+TARGET = 'Australopithecus Afarensis'
+
+
+class ImmediateExecutor:
+    """Executor sinkron: submit menjalankan fungsi langsung di proses test."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def _summary(config_index, mean_fitness, mean_cpu_seconds):
+    return {'config_index': config_index, 'mean_fitness': mean_fitness, 'mean_cpu_seconds': mean_cpu_seconds,
+            'fitness_per_cpu_second': mean_fitness / mean_cpu_seconds}
+
+
+def test_sample_configs_within_search_space():
+    configs = tuning.sample_configs(12, np.random.default_rng(4))
+    assert len(configs) == 12
+    assert configs[0] == tuning.default_config()
+    for config in configs[1:]:
+        assert set(config) == set(RECOMMENDED_PARAM_NAMES)
+        assert config['population_size'] in tuning.SEARCH_SPACE['population_size']
+        assert config['num_generations'] in tuning.SEARCH_SPACE['num_generations']
+        assert 0.5 <= config['crossover_prob'] <= 1.0
+        assert 0.005 <= config['mutation_prob'] <= 0.3
+    assert tuning.sample_configs(12, np.random.default_rng(4)) == configs
+
+
+def test_rank_summaries_prefers_cheapest_within_tolerance():
+    summaries = [
+        _summary(0, 0.90, 1.0), # Terbaik, mahal
+        _summary(1, 0.895, 0.2), # Dalam toleransi, paling murah
+        _summary(2, 0.50, 0.01), # Sangat murah tapi fitness jauh di bawah
+        _summary(3, 0.70, 0.5),
+    ]
+    ranked = tuning.rank_summaries(summaries, fitness_tolerance=0.01)
+    assert [s['config_index'] for s in ranked] == [1, 0, 3, 2]
+    assert [s['config_index'] for s in tuning.rank_summaries(summaries, fitness_tolerance=0.0)] == [0, 1, 3, 2]
+
+
+def test_summarize_runs_counts_failures_as_zero():
+    records = [
+        {'status': 'completed', 'final_best_fitness': 0.8, 'cpu_seconds': 0.1},
+        {'status': 'failed', 'final_best_fitness': None, 'cpu_seconds': 0.3},
+    ]
+    summary = tuning.summarize_runs(0, {'population_size': 20}, records)
+    assert summary['mean_fitness'] == pytest.approx(0.4)
+    assert summary['mean_cpu_seconds'] == pytest.approx(0.2)
+    assert (summary['num_runs'], summary['num_failed']) == (2, 1)
+
+
+def test_successive_halving_stops_at_one_survivor(monkeypatch):
+    configs = [{'population_size': 10 * (i + 1), 'num_generations': 5, 'crossover_prob': 0.8, 'mutation_prob': 0.05}
+               for i in range(9)]
+    calls = []
+
+    def fake_run_scenario(index, request_data):
+        calls.append((index, request_data.ga_params.seed))
+        assert request_data.use_recommended_params is False
+        # Fitness naik dengan population_size, CPU time juga; konfigurasi 6 sudah dalam toleransi
+        fitness = min(0.7 + 0.03 * index, 0.9)
+        return {'status': 'completed', 'final_best_fitness': fitness, 'cpu_seconds': 0.1 * (index + 1)}
+
+    monkeypatch.setattr(tuning, 'run_scenario', fake_run_scenario)
+    ranked = tuning.successive_halving(ImmediateExecutor(), TARGET, configs, eta=3, min_seeds=1,
+                                       fitness_tolerance=0.01, seed_base=100)
+    assert [summary['config_index'] for summary in ranked] == [7]
+    assert ranked[0]['num_runs'] == 3
+    # Rung 0: 9 konfigurasi x seed 100; rung 1: 3 konfigurasi, hanya seed 101 dan 102 yang baru
+    assert len(calls) == 9 + 3 * 2
+    assert sorted(seed for index, seed in calls if index == 7) == [100, 101, 102]
+
+
+def test_tuning_main_writes_recommendations(tmp_path, monkeypatch):
+    monkeypatch.setattr(tuning, 'SEARCH_SPACE', dict(tuning.SEARCH_SPACE, population_size=(10, 20), num_generations=(3, 5)))
+    monkeypatch.setattr(tuning, 'default_config', lambda: dict(
+        population_size=20, num_generations=5, crossover_prob=0.8, mutation_prob=0.05))
+    output = tmp_path / 'recommended.json'
+    ParameterRecommendations({'Homo Sapiens': {'ga_params': {'population_size': 99}}}).save(str(output))
+
+    tuning.main(['--targets', TARGET, '--num-configs', '3', '--eta', '3', '--min-seeds', '1',
+                 '--workers', '2', '--output', str(output)])
+    recommendations = ParameterRecommendations.load(str(output))
+    assert set(recommendations.species) == {TARGET, 'Homo Sapiens'} # Entri spesies lain dipertahankan
+    entry = recommendations.species[TARGET]
+    assert set(entry['ga_params']) == set(RECOMMENDED_PARAM_NAMES)
+    assert entry['num_runs'] >= 1 and entry['tuning']['method'] == 'successive_halving'
+    assert recommendations.dataset_fingerprint == api.dataset_store.current().fingerprint
+
+    with pytest.raises(SystemExit):
+        tuning.main(['--targets', 'Spesies Tidak Ada', '--output', str(output)])
+
+
+def test_recommended_params_are_opt_in(client, monkeypatch):
+    recommended = {'population_size': 24, 'num_generations': 6, 'crossover_prob': 0.7, 'mutation_prob': 0.1}
+    monkeypatch.setattr(api, 'recommended_params', ParameterRecommendations({TARGET: {'ga_params': recommended}}))
+    payload = {'user_feature_inputs': {}, 'target_genus_specie': TARGET, 'ga_params': {'seed': 3, 'population_size': 30}}
+
+    api.result_cache.clear()
+    response = client.post('/simulate_evolution', json=payload).json()
+    assert response['recommended_params_applied'] == {}
+
+    response = client.post('/simulate_evolution', json={**payload, 'use_recommended_params': True}).json()
+    # population_size dikirim klien sehingga tidak ditimpa
+    assert response['recommended_params_applied'] == {k: v for k, v in recommended.items() if k != 'population_size'}
+    assert response['num_evaluations'] == 30 * 6
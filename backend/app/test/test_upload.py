@@ -0,0 +1,101 @@
+# backend/app/test/test_upload.py
+
+import io
+import pytest
+from app import api
+from app.algorithm.profiles import SpeciesProfileIndex, ProfileAccumulator
+from app.api import (
+    DATASET_PATH, LABEL_COL_IN_DATASET as LABEL_COL, ORIGINAL_NUMERICAL_COLS as NUMERICAL_COLS,
+    ORIGINAL_CATEGORICAL_COLS as CATEGORICAL_COLS,
+)
+from app.preprocessing_data.upload import CSVValidationError, ingest_csv_stream
+
+# Ingest CSV upload: ProfileAccumulator per chunk sama dengan SpeciesProfileIndex, nama kolom
+# CSV ('Canine Size') dinormalisasi seperti dataset bawaan, dan upload tanpa perubahan isi
+# (replace/append dengan CSV bawaan) tidak mengubah profil yang dibangun saat startup.
+
+
+def _read_dataset_bytes():
+    with open(DATASET_PATH, 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture
+def restore_snapshot(client):
+    """Memasang kembali snapshot dataset sebelum test setelah test selesai."""
+    snapshot = api.dataset_store.current()
+    yield snapshot
+    api.dataset_store.publish(
+        snapshot.dataset_df, snapshot.fingerprint, snapshot.profile_index,
+        snapshot.profile_accumulator, snapshot.data_fingerprint,
+    )
+
+
+def test_profile_accumulator_chunks_match_profile_index(dataset_df):
+    # Baris diacak agar setiap chunk memuat campuran spesies
+    shuffled = dataset_df.sample(frac=1.0, random_state=0)
+    accumulator = ProfileAccumulator(NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    for start in range(0, len(shuffled), 1000):
+        accumulator.update(shuffled.iloc[start:start + 1000])
+    expected = SpeciesProfileIndex.from_dataframe(dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    assert accumulator.num_rows == len(dataset_df)
+    assert accumulator.to_index('fp').profiles == expected.profiles
+    assert accumulator.copy().to_index('fp').profiles == expected.profiles
+
+
+def test_ingest_csv_stream_normalizes_column_names(dataset_df):
+    accumulator = ProfileAccumulator(NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    report = ingest_csv_stream(io.BytesIO(_read_dataset_bytes()), accumulator, chunk_rows=2500)
+    expected = SpeciesProfileIndex.from_dataframe(dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    assert report['rows_valid'] == len(dataset_df)
+    assert all('Canine_Size' in profile for profile in expected.profiles.values())
+    assert accumulator.to_index('fp').profiles == expected.profiles
+
+
+def test_ingest_csv_stream_validation():
+    csv = (
+        "Genus_&_Specie,Canine Size,Diet\n"
+        "Homo Sapiens,small,dry fruits\n"
+        ",small,dry fruits\n"
+        "Homo Sapiens,small,batu\n"
+    )
+    accumulator = ProfileAccumulator(NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    report = ingest_csv_stream(io.BytesIO(csv.encode()), accumulator)
+    assert (report['rows_total'], report['rows_valid'], report['rows_invalid'], report['warnings']) == (3, 2, 1, 1)
+
+    accumulator = ProfileAccumulator(NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    report = ingest_csv_stream(io.BytesIO(csv.encode()), accumulator, strict=True)
+    assert (report['rows_valid'], report['rows_invalid']) == (1, 2)
+    assert len(report['errors']) == 2
+
+    with pytest.raises(CSVValidationError):
+        ingest_csv_stream(io.BytesIO(b"Diet\ndry fruits\n"), accumulator)
+
+
+@pytest.mark.parametrize('mode', ['replace', 'append'])
+def test_noop_upload_keeps_startup_profiles(client, restore_snapshot, mode):
+    startup_profiles = restore_snapshot.profile_index.profiles
+    assert all('Canine_Size' in profile for profile in startup_profiles.values())
+
+    response = client.post(f'/datasets/upload?mode={mode}', content=_read_dataset_bytes(),
+                           headers={'Content-Type': 'text/csv'})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body['rows_invalid'] == 0
+    assert body['num_species'] == len(startup_profiles)
+    assert body['dataset_fingerprint'] != restore_snapshot.fingerprint
+
+    current = api.dataset_store.current()
+    assert current.profile_index.profiles == startup_profiles
+    assert current.dataset_df is restore_snapshot.dataset_df
+    assert current.data_fingerprint == restore_snapshot.data_fingerprint
+
+
+def test_upload_rejects_invalid_csv(client, restore_snapshot):
+    response = client.post('/datasets/upload?mode=replace', content=b"Diet\ndry fruits\n",
+                           headers={'Content-Type': 'text/csv'})
+    assert response.status_code == 422
+    response = client.post('/datasets/upload?mode=replace', content=b"Genus_&_Specie,Diet\n,dry fruits\n",
+                           headers={'Content-Type': 'text/csv'})
+    assert response.status_code == 422
+    assert api.dataset_store.current() is restore_snapshot
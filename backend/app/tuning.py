@@ -0,0 +1,217 @@
+# backend/app/tuning.py
+
+import argparse
+import contextlib
+import math
+import os
+import statistics
+import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from . import api
+from .batch_runner import init_worker, run_scenario
+from .recommendations import ParameterRecommendations, RECOMMENDED_PARAM_NAMES
+
+# Tuning GAParameters (population_size, num_generations, crossover_prob, mutation_prob) per
+# spesies target dengan successive halving. num_configs konfigurasi acak (ditambah default API
+# sebagai pembanding) dijalankan dengan min_seeds seed; setiap rung hanya 1/eta konfigurasi
+# terbaik yang lanjut, dan jumlah seed-nya dikali eta (hasil seed sebelumnya dipakai ulang).
+# Semua run dijalankan paralel di process pool lewat run_scenario (jalur yang sama dengan API).
+#
+# Objektif: fitness per CPU-second (rata-rata fitness akhir / rata-rata CPU time run).
+# Karena rasio ini sendirian selalu memenangkan konfigurasi terkecil, hanya konfigurasi
+# dengan rata-rata fitness dalam fitness_tolerance dari yang terbaik di rung tersebut yang
+# diurutkan dengan objektif ini; sisanya diurutkan berdasarkan fitness di belakangnya.
+# Jadi hasilnya adalah konfigurasi termurah yang tetap mencapai fitness (hampir) terbaik.
+#
+# Contoh (dari folder backend):
+#   python -m app.tuning --targets "Australopithecus Afarensis" --workers 8
+#   python -m app.tuning --all-species --num-configs 27 --eta 3
+# Hasil digabung ke file rekomendasi (default api.RECOMMENDED_PARAMS_PATH) yang dipakai API.
+
+SEARCH_SPACE = {
+    'population_size': (20, 50, 100, 200, 400), # Pilihan diskret
+    'num_generations': (10, 20, 50, 100, 200), # Pilihan diskret
+    'crossover_prob': (0.5, 1.0), # Uniform
+    'mutation_prob': (0.005, 0.3), # Log-uniform
+}
+DEFAULT_NUM_CONFIGS = 27
+DEFAULT_ETA = 3
+DEFAULT_MIN_SEEDS = 2
+DEFAULT_FITNESS_TOLERANCE = 0.01
+
+
+def default_config():
+    """Konfigurasi default GAParameters, selalu ikut sebagai pembanding."""
+    defaults = api.GAParameters()
+    return {name: getattr(defaults, name) for name in RECOMMENDED_PARAM_NAMES}
+
+
+def sample_configs(num_configs, rng):
+    """num_configs konfigurasi: default API lalu sampel acak dari SEARCH_SPACE."""
+    low_cx, high_cx = SEARCH_SPACE['crossover_prob']
+    low_mut, high_mut = SEARCH_SPACE['mutation_prob']
+    configs = [default_config()]
+    while len(configs) < num_configs:
+        configs.append({
+            'population_size': int(rng.choice(SEARCH_SPACE['population_size'])),
+            'num_generations': int(rng.choice(SEARCH_SPACE['num_generations'])),
+            'crossover_prob': round(float(rng.uniform(low_cx, high_cx)), 3),
+            'mutation_prob': round(float(math.exp(rng.uniform(math.log(low_mut), math.log(high_mut)))), 4),
+        })
+    return configs
+
+
+def summarize_runs(config_index, config, records):
+    """Ringkasan satu konfigurasi dari record run_scenario (run gagal dihitung fitness 0)."""
+    fitness = [r['final_best_fitness'] if r['status'] == 'completed' else 0.0 for r in records]
+    cpu_seconds = [r['cpu_seconds'] for r in records]
+    mean_fitness = statistics.fmean(fitness)
+    mean_cpu_seconds = statistics.fmean(cpu_seconds)
+    return {
+        'config_index': config_index,
+        'ga_params': config,
+        'mean_fitness': mean_fitness,
+        'mean_cpu_seconds': mean_cpu_seconds,
+        'fitness_per_cpu_second': mean_fitness / max(mean_cpu_seconds, 1e-9),
+        'num_runs': len(records),
+        'num_failed': sum(r['status'] != 'completed' for r in records),
+    }
+
+
+def rank_summaries(summaries, fitness_tolerance=DEFAULT_FITNESS_TOLERANCE):
+    """
+    Urutan konfigurasi terbaik: yang fitness-nya dalam fitness_tolerance dari yang terbaik
+    diurutkan berdasarkan fitness per CPU-second, sisanya berdasarkan fitness.
+    """
+    best_fitness = max(s['mean_fitness'] for s in summaries)
+
+    def key(summary):
+        if summary['mean_fitness'] >= best_fitness - fitness_tolerance:
+            return (0, -summary['fitness_per_cpu_second'])
+        return (1, -summary['mean_fitness'])
+    return sorted(summaries, key=key)
+
+
+def successive_halving(executor, target, configs, eta=DEFAULT_ETA, min_seeds=DEFAULT_MIN_SEEDS,
+                       fitness_tolerance=DEFAULT_FITNESS_TOLERANCE, seed_base=0, log=None):
+    """
+    Menjalankan successive halving untuk satu target.
+
+    Args:
+        executor (ProcessPoolExecutor): Pool dengan init_worker sebagai initializer.
+        target (str): target_genus_specie.
+        configs (list): Konfigurasi kandidat (dict RECOMMENDED_PARAM_NAMES).
+        eta (int): Faktor reduksi (1/eta konfigurasi lanjut, seed dikali eta).
+        min_seeds (int): Jumlah seed di rung pertama.
+        fitness_tolerance (float): Lihat rank_summaries.
+        seed_base (int): Seed run ke-k adalah seed_base + k (sama untuk semua konfigurasi).
+        log (callable, optional): Fungsi untuk mencetak progres per rung.
+
+    Returns:
+        list: Ringkasan konfigurasi yang tersisa di rung terakhir, terurut dari yang terbaik
+              (satu elemen jika rung terakhir memangkasnya menjadi satu konfigurasi).
+    """
+    records = {index: [] for index in range(len(configs))}
+    survivors = list(records)
+    num_seeds = min_seeds
+    rung = 0
+    while True:
+        futures = []
+        for index in survivors:
+            for seed_offset in range(len(records[index]), num_seeds):
+                request_data = api.SimulationRequest(
+                    user_feature_inputs={},
+                    target_genus_specie=target,
+                    ga_params=api.GAParameters(**configs[index], seed=seed_base + seed_offset),
+                    path_mode='changes', path_max_points=2, # Jejak tidak dipakai, cukup kirim minimal
+                    use_recommended_params=False,
+                )
+                futures.append((index, executor.submit(run_scenario, index, request_data)))
+        for index, future in futures:
+            records[index].append(future.result())
+
+        ranked = rank_summaries(
+            [summarize_runs(index, configs[index], records[index]) for index in survivors], fitness_tolerance
+        )
+        if log is not None:
+            best = ranked[0]
+            log(f"  rung {rung}: {len(survivors)} konfigurasi x {num_seeds} seed, terbaik {best['ga_params']} "
+                f"(fitness {best['mean_fitness']:.4f}, {best['fitness_per_cpu_second']:.1f} fitness/CPU-s)")
+        if len(survivors) == 1:
+            return ranked
+        survivors = [summary['config_index'] for summary in ranked[:max(1, len(survivors) // eta)]]
+        if len(survivors) == 1: # Pemenang sudah jelas; rung berikutnya hanya menambah seed
+            return ranked[:1]
+        num_seeds *= eta
+        rung += 1
+
+
+def recommendation_entry(best, args):
+    """Entri file rekomendasi untuk satu spesies."""
+    return {
+        'ga_params': best['ga_params'],
+        'mean_fitness': best['mean_fitness'],
+        'mean_cpu_seconds': best['mean_cpu_seconds'],
+        'fitness_per_cpu_second': best['fitness_per_cpu_second'],
+        'num_runs': best['num_runs'],
+        'tuning': {
+            'method': 'successive_halving',
+            'num_configs': args.num_configs, 'eta': args.eta, 'min_seeds': args.min_seeds,
+            'fitness_tolerance': args.fitness_tolerance, 'seed': args.seed,
+        },
+        'tuned_at': time.time(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tuning GAParameters per spesies dengan successive halving.")
+    target_group = parser.add_mutually_exclusive_group(required=True)
+    target_group.add_argument('--targets', nargs='+', help="target_genus_specie yang di-tuning")
+    target_group.add_argument('--all-species', action='store_true', help="Tuning semua spesies di dataset")
+    parser.add_argument('--num-configs', type=int, default=DEFAULT_NUM_CONFIGS)
+    parser.add_argument('--eta', type=int, default=DEFAULT_ETA)
+    parser.add_argument('--min-seeds', type=int, default=DEFAULT_MIN_SEEDS)
+    parser.add_argument('--fitness-tolerance', type=float, default=DEFAULT_FITNESS_TOLERANCE)
+    parser.add_argument('--seed', type=int, default=0, help="Seed sampling konfigurasi dan run GA")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses (default: jumlah CPU)")
+    parser.add_argument('--output', default=api.RECOMMENDED_PARAMS_PATH,
+                        help="File rekomendasi; entri spesies lain di file ini dipertahankan")
+    args = parser.parse_args(argv)
+    if args.eta < 2 or args.num_configs < 1 or args.min_seeds < 1:
+        parser.error("eta harus >= 2, num-configs dan min-seeds harus >= 1.")
+
+    with contextlib.redirect_stdout(sys.stderr):
+        api.load_dataset_sync()
+    snapshot = api.dataset_store.current()
+    if snapshot is None:
+        parser.error(f"Dataset tidak bisa dimuat: {api.data_load_error}")
+    targets = sorted(snapshot.profile_index.profiles) if args.all_species else args.targets
+    unknown = [target for target in targets if target not in snapshot.profile_index.profiles]
+    if unknown:
+        parser.error(f"Spesies tidak ada di dataset: {', '.join(unknown)}")
+
+    try:
+        recommendations = ParameterRecommendations.load(args.output)
+    except ValueError as e:
+        parser.error(str(e))
+    recommendations.dataset_fingerprint = snapshot.fingerprint
+    configs = sample_configs(args.num_configs, np.random.default_rng(args.seed))
+
+    log = lambda message: print(message, file=sys.stderr)
+    with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count(), initializer=init_worker) as executor:
+        for target in targets:
+            start = time.perf_counter()
+            log(f"Tuning {target} ({len(configs)} konfigurasi)...")
+            ranked = successive_halving(
+                executor, target, configs, args.eta, args.min_seeds, args.fitness_tolerance, args.seed, log
+            )
+            recommendations.species[target] = recommendation_entry(ranked[0], args)
+            recommendations.save(args.output) # Disimpan per spesies agar run panjang bisa dihentikan
+            log(f"  rekomendasi: {ranked[0]['ga_params']} ({time.perf_counter() - start:.1f} s)")
+    log(f"Rekomendasi {len(targets)} spesies ditulis ke {args.output}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+# backend/benchmarks/bench_ga.py
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+from app.algorithm.chromosome_setup import FEATURE_ORDER, FEATURE_DETAILS, initialize_population, decode_chromosome
+from app.algorithm.fitness import (
+    FitnessContext, get_target_profile, calculate_combined_fitness, calculate_population_fitness
+)
+from app.algorithm.operators import (
+    tournament_selection, uniform_crossover, combined_mutation,
+    tournament_selection_batch, uniform_crossover_batch, combined_mutation_batch
+)
+from app.algorithm.profiles import SpeciesProfileIndex
+from app.algorithm.ga_core import GeneticAlgorithmFeatureSelection
+from .synthetic_data import SyntheticEvolutionData, LABEL_COL
+
+# Benchmark jalur panas GA: fitness, operator genetik, profil target, dan satu run GA penuh,
+# pada beberapa ukuran populasi / jumlah generasi / ukuran dataset sintetis.
+# Hasil ditulis sebagai JSON agar bisa dibandingkan antar commit (opsi --compare).
+#
+# Contoh (dari folder backend):
+#   python -m benchmarks.bench_ga --output bench_main.json
+#   python -m benchmarks.bench_ga --quick --compare bench_main.json
+
+NUMERICAL_COLS = [f for f in FEATURE_ORDER if FEATURE_DETAILS[f]['type'] == 'numerical']
+CATEGORICAL_COLS = [f for f in FEATURE_ORDER if FEATURE_DETAILS[f]['type'] == 'categorical']
+MUTATION_PROB = 0.05
+CROSSOVER_PROB = 0.8
+
+
+def _time_call(fn, repeat, warmup=1):
+    """Waktu eksekusi fn (detik) untuk setiap pengulangan, setelah warmup."""
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _result(name, params, timings):
+    return {
+        'name': name,
+        'params': params,
+        'repeat': len(timings),
+        'min_s': min(timings),
+        'median_s': statistics.median(timings),
+        'mean_s': statistics.fmean(timings),
+        'stdev_s': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def bench_population_ops(dataset_df, target, population_sizes, repeat, seed):
+    """Fitness dan operator genetik: versi per individu vs versi batch untuk setiap ukuran populasi."""
+    results = []
+    profile_index = SpeciesProfileIndex.from_dataframe(dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL)
+    context = FitnessContext.build(
+        target, dataset_df, {}, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL, profile_index=profile_index
+    )
+    for population_size in population_sizes:
+        rng = np.random.default_rng(seed)
+        population = initialize_population(population_size, rng)
+        decoded_population = [decode_chromosome(chromosome) for chromosome in population]
+        fitness_scores = calculate_population_fitness(population, context)
+        params = {'population_size': population_size}
+
+        cases = {
+            'calculate_combined_fitness': lambda: [calculate_combined_fitness(c, context) for c in decoded_population],
+            'calculate_population_fitness': lambda: calculate_population_fitness(population, context),
+            'tournament_selection': lambda: tournament_selection(population, fitness_scores, rng=rng),
+            'tournament_selection_batch': lambda: tournament_selection_batch(population, fitness_scores, rng),
+            'uniform_crossover': lambda: [
+                uniform_crossover(population[i], population[i + 1], CROSSOVER_PROB, rng)
+                for i in range(0, population_size - 1, 2)
+            ],
+            'uniform_crossover_batch': lambda: uniform_crossover_batch(population, CROSSOVER_PROB, rng),
+            'combined_mutation': lambda: [combined_mutation(c, MUTATION_PROB, rng=rng) for c in population],
+            'combined_mutation_batch': lambda: combined_mutation_batch(population, MUTATION_PROB, rng),
+        }
+        for name, fn in cases.items():
+            results.append(_result(name, params, _time_call(fn, repeat)))
+    return results
+
+
+def bench_profiles(dataset_df, target, repeat):
+    """Profil target satu spesies vs index profil semua spesies pada satu ukuran dataset."""
+    params = {'rows': len(dataset_df)}
+    return [
+        _result('get_target_profile', params, _time_call(
+            lambda: get_target_profile(target, dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL), repeat
+        )),
+        _result('SpeciesProfileIndex.from_dataframe', params, _time_call(
+            lambda: SpeciesProfileIndex.from_dataframe(dataset_df, NUMERICAL_COLS, CATEGORICAL_COLS, LABEL_COL), repeat
+        )),
+    ]
+
+
+def bench_ga_run(dataset_df, target, population_size, num_generations, repeat, seed):
+    """Satu GeneticAlgorithmFeatureSelection.run penuh (output cetak GA diredam)."""
+    def run():
+        ga = GeneticAlgorithmFeatureSelection(
+            original_df=dataset_df, label_col=LABEL_COL,
+            numerical_cols_original=NUMERICAL_COLS, categorical_cols_original=CATEGORICAL_COLS,
+            target_genus_specie_for_ga=target, initial_user_params_for_ga={},
+            population_size=population_size, num_generations=num_generations,
+            crossover_prob=CROSSOVER_PROB, mutation_prob=MUTATION_PROB, seed=seed,
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            ga.run()
+    params = {'rows': len(dataset_df), 'population_size': population_size, 'num_generations': num_generations}
+    return _result('GeneticAlgorithmFeatureSelection.run', params, _time_call(run, repeat, warmup=0))
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment():
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_commit': _git_commit(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def _result_key(result):
+    return result['name'], json.dumps(result['params'], sort_keys=True)
+
+
+def compare_results(current, baseline_path):
+    """Mencetak rasio median (sekarang / baseline) untuk benchmark yang ada di kedua hasil."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {_result_key(r): r for r in json.load(f)['results']}
+    print(f"\nPerbandingan dengan {baseline_path} (rasio > 1 berarti lebih lambat):", file=sys.stderr)
+    for result in current['results']:
+        base = baseline.get(_result_key(result))
+        if base is None:
+            continue
+        ratio = result['median_s'] / base['median_s'] if base['median_s'] else float('inf')
+        print(f"  {result['name']:<40} {json.dumps(result['params'], sort_keys=True):<60} {ratio:6.2f}x", file=sys.stderr)
+
+
+def run_benchmarks(args):
+    results = []
+    for rows in args.rows:
+        print(f"Membangkitkan dataset sintetis {rows} baris...", file=sys.stderr)
+        dataset_df = SyntheticEvolutionData(num_species=args.species, seed=args.seed).generate(rows)
+        target = dataset_df[LABEL_COL].cat.categories[0]
+
+        results.extend(bench_profiles(dataset_df, target, args.repeat))
+        if rows == args.rows[0]:
+            # Fitness dan operator tidak bergantung pada ukuran dataset, cukup diukur sekali
+            results.extend(bench_population_ops(dataset_df, target, args.population_sizes, args.repeat, args.seed))
+        for population_size in args.population_sizes:
+            for num_generations in args.generations:
+                results.append(bench_ga_run(
+                    dataset_df, target, population_size, num_generations, args.ga_repeat, args.seed
+                ))
+        del dataset_df
+    return {'environment': _environment(), 'args': vars(args), 'results': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark jalur panas algoritma genetik.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help="Ukuran dataset sintetis (10 ribu sampai 10 juta baris)")
+    parser.add_argument('--population-sizes', type=int, nargs='+', default=[50, 200, 1000])
+    parser.add_argument('--generations', type=int, nargs='+', default=[20, 100])
+    parser.add_argument('--species', type=int, default=24)
+    parser.add_argument('--repeat', type=int, default=5, help="Pengulangan untuk benchmark mikro")
+    parser.add_argument('--ga-repeat', type=int, default=3, help="Pengulangan untuk run GA penuh")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--quick', action='store_true', help="Konfigurasi kecil untuk pengecekan cepat")
+    parser.add_argument('--output', help="Path file JSON hasil (default: stdout)")
+    parser.add_argument('--compare', help="File JSON hasil sebelumnya untuk dibandingkan")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.rows, args.population_sizes, args.generations = [10_000], [50], [20]
+        args.repeat, args.ga_repeat = 3, 1
+
+    with contextlib.redirect_stdout(sys.stderr): # Peringatan dari kode GA tidak mengotori JSON di stdout
+        report = run_benchmarks(args)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"Hasil benchmark ditulis ke {args.output}", file=sys.stderr)
+    else:
+        print(output)
+    if args.compare:
+        compare_results(report, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+# backend/benchmarks/bench_import.py
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from .bench_ga import _environment
+
+# Mengukur waktu impor (cold start) modul backend. Setiap pengulangan menjalankan proses
+# Python baru dengan `-X importtime`, jadi tidak ada modul yang sudah ter-cache di memori.
+# Hasil: waktu total impor (dan opsional pemuatan dataset seperti event startup), biaya
+# per modul (self dan kumulatif), serta total per paket top-level (fastapi, pandas, ...).
+#
+# Contoh (dari folder backend):
+#   python -m benchmarks.bench_import
+#   python -m benchmarks.bench_import --startup --max-seconds 1.0 --output import_main.json
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+# Kode yang dijalankan di proses baru; mencetak waktu wall-clock sebagai JSON di stdout
+_PROBE = """
+import json, time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+result = {{'import_s': imported - start}}
+if {startup}:
+    import contextlib, io
+    from app import api
+    with contextlib.redirect_stdout(io.StringIO()):
+        api.load_dataset_sync()
+    result['startup_s'] = time.perf_counter() - imported
+print(json.dumps(result))
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Baris `-X importtime` -> list dict (module, self_us, cumulative_us, depth).
+    depth 0 berarti modul diimpor langsung oleh kode yang diukur (bukan oleh modul lain).
+    """
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append({
+                'module': module,
+                'self_us': int(self_us),
+                'cumulative_us': int(cumulative_us),
+                'depth': (len(indent) - 1) // 2,
+            })
+    return entries
+
+
+def measure_once(module, startup=False):
+    """Satu proses baru: waktu wall-clock dan entri importtime."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _PROBE.format(module=module, startup=startup)],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+        env=dict(os.environ, PYTHONPATH=BACKEND_DIR, PYTHONDONTWRITEBYTECODE='1'),
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Impor {module} gagal:\n{completed.stderr[-2000:]}")
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    return timings, parse_importtime(completed.stderr)
+
+
+def summarize(runs, top):
+    """Median per modul dan per paket top-level dari beberapa pengulangan."""
+    per_module = defaultdict(lambda: {'self_us': [], 'cumulative_us': []})
+    per_package = defaultdict(list)
+    for _, entries in runs:
+        package_totals = defaultdict(int)
+        for entry in entries:
+            per_module[entry['module']]['self_us'].append(entry['self_us'])
+            per_module[entry['module']]['cumulative_us'].append(entry['cumulative_us'])
+            package_totals[entry['module'].split('.')[0]] += entry['self_us']
+        for package, total_us in package_totals.items():
+            per_package[package].append(total_us)
+
+    modules = sorted((
+        {
+            'module': module,
+            'self_ms': statistics.median(values['self_us']) / 1000,
+            'cumulative_ms': statistics.median(values['cumulative_us']) / 1000,
+        }
+        for module, values in per_module.items()
+    ), key=lambda m: m['cumulative_ms'], reverse=True)
+    packages = sorted((
+        {'package': package, 'self_ms': statistics.median(totals) / 1000}
+        for package, totals in per_package.items()
+    ), key=lambda p: p['self_ms'], reverse=True)
+    return modules[:top], packages[:top]
+
+
+def run_benchmark(args):
+    runs = [measure_once(args.module, args.startup) for _ in range(args.repeat)]
+    modules, packages = summarize(runs, args.top)
+    report = {
+        'environment': _environment(),
+        'args': vars(args),
+        'import_s': statistics.median(timings['import_s'] for timings, _ in runs),
+        'modules': modules,
+        'packages': packages,
+    }
+    if args.startup:
+        report['startup_s'] = statistics.median(timings['startup_s'] for timings, _ in runs)
+    return report
+
+
+def print_summary(report, file=sys.stderr):
+    print(f"Impor {report['args']['module']}: {report['import_s']:.3f} s (median {report['args']['repeat']} proses)", file=file)
+    if 'startup_s' in report:
+        print(f"Pemuatan dataset (startup): {report['startup_s']:.3f} s", file=file)
+    print("\nPaket top-level (total self time):", file=file)
+    for package in report['packages']:
+        print(f"  {package['package']:<40} {package['self_ms']:9.1f} ms", file=file)
+    print("\nModul (kumulatif / self):", file=file)
+    for module in report['modules']:
+        print(f"  {module['module']:<60} {module['cumulative_ms']:9.1f} ms {module['self_ms']:9.1f} ms", file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mengukur waktu impor modul backend per modul.")
+    parser.add_argument('--module', default='app.api', help="Modul yang diimpor (default: app.api)")
+    parser.add_argument('--repeat', type=int, default=5, help="Jumlah proses baru yang diukur")
+    parser.add_argument('--top', type=int, default=25, help="Jumlah modul/paket terlambat yang dilaporkan")
+    parser.add_argument('--startup', action='store_true', help="Ukur juga pemuatan dataset seperti event startup")
+    parser.add_argument('--max-seconds', type=float,
+                        help="Keluar dengan kode 1 jika impor (+ startup) melebihi batas ini")
+    parser.add_argument('--output', help="Path file JSON hasil")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args)
+    print_summary(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nHasil ditulis ke {args.output}", file=sys.stderr)
+
+    total_s = report['import_s'] + report.get('startup_s', 0.0)
+    if args.max_seconds is not None and total_s > args.max_seconds:
+        print(f"\nCold start {total_s:.3f} s melebihi batas {args.max_seconds:.3f} s.", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# backend/benchmarks/synthetic_data.py
+
+import argparse
+import os
+import numpy as np
+import pandas as pd
+from app.algorithm.chromosome_setup import FEATURE_DETAILS
+
+# Generator dataset sintetis berbentuk Evolution_DataSets.csv (kolom dan urutan sama),
+# dengan nilai diambil dari FEATURE_DETAILS. Setiap spesies punya kategori dominan per
+# kolom dan rata-rata numerik sendiri, sehingga profil spesies (median/modus) tetap bermakna.
+# Data dibangkitkan per chunk sehingga 10 juta baris pun bisa ditulis tanpa memuat semuanya.
+
+LABEL_COL = 'Genus_&_Specie'
+
+# Urutan kolom sama dengan header Evolution_DataSets.csv
+CSV_COLUMNS = [
+    'Genus_&_Specie', 'Time', 'Location', 'Zone', 'Current_Country', 'Habitat', 'Cranial_Capacity',
+    'Height', 'Incisor_Size', 'Jaw_Shape', 'Torus_Supraorbital', 'Prognathism', 'Foramen_Mágnum_Position',
+    'Canine Size', 'Canines_Shape', 'Tooth_Enamel', 'Tecno', 'Tecno_type', 'biped', 'Arms', 'Foots', 'Diet',
+    'Sexual_Dimorphism', 'Hip', 'Vertical_Front', 'Anatomy', 'Migrated', 'Skeleton',
+]
+
+# Nama kolom di CSV yang berbeda dari kunci FEATURE_DETAILS
+CSV_COLUMN_ALIASES = {
+    'Canine Size': 'Canine_Size',
+    'Foramen_Mágnum_Position': 'Foramen_Magnum_Position',
+}
+
+DOMINANT_CATEGORY_PROB = 0.6 # Peluang sebuah baris memakai kategori dominan spesiesnya
+NUMERICAL_NOISE_RATIO = 0.05 # Simpangan baku numerik relatif terhadap lebar rentang
+
+
+class SyntheticEvolutionData:
+    """
+    Parameter acak per spesies (kategori dominan, rata-rata numerik) yang dibangkitkan
+    sekali dari seed; baris-baris dataset kemudian diambil per chunk dari parameter ini.
+
+    Args:
+        num_species (int): Jumlah Genus_&_Specie berbeda.
+        seed (int): Seed numpy.random.Generator.
+    """
+
+    def __init__(self, num_species=24, seed=0):
+        self.rng = np.random.default_rng(seed)
+        self.species = [f"hominino Synthetic species_{i:03d}" for i in range(num_species)]
+        self.species_params = {}
+        for column in CSV_COLUMNS[1:]:
+            details = FEATURE_DETAILS[CSV_COLUMN_ALIASES.get(column, column)]
+            if details['type'] == 'numerical':
+                low, high = details['range']
+                self.species_params[column] = self.rng.uniform(low, high, size=num_species)
+            else:
+                self.species_params[column] = self.rng.integers(len(details['categories']), size=num_species)
+
+    def generate(self, num_rows):
+        """Satu DataFrame berisi num_rows baris (kolom teks sebagai pd.Categorical)."""
+        species_codes = self.rng.integers(len(self.species), size=num_rows)
+        columns = {LABEL_COL: pd.Categorical.from_codes(species_codes, self.species)}
+        for column in CSV_COLUMNS[1:]:
+            details = FEATURE_DETAILS[CSV_COLUMN_ALIASES.get(column, column)]
+            params = self.species_params[column][species_codes]
+            if details['type'] == 'numerical':
+                low, high = details['range']
+                noise = self.rng.normal(0.0, NUMERICAL_NOISE_RATIO * (high - low), size=num_rows)
+                columns[column] = np.clip(params + noise, low, high)
+            else:
+                categories = details['categories']
+                random_codes = self.rng.integers(len(categories), size=num_rows)
+                use_dominant = self.rng.random(num_rows) < DOMINANT_CATEGORY_PROB
+                codes = np.where(use_dominant, params, random_codes)
+                columns[column] = pd.Categorical.from_codes(codes, categories)
+        return pd.DataFrame(columns)
+
+    def iter_chunks(self, num_rows, chunk_rows=1_000_000):
+        for start in range(0, num_rows, chunk_rows):
+            yield self.generate(min(chunk_rows, num_rows - start))
+
+
+def generate_evolution_dataset(num_rows, num_species=24, seed=0):
+    """Dataset sintetis berbentuk Evolution_DataSets.csv sebagai satu DataFrame."""
+    return SyntheticEvolutionData(num_species, seed).generate(num_rows)
+
+
+def write_evolution_csv(path, num_rows, num_species=24, seed=0, chunk_rows=1_000_000):
+    """Menulis dataset sintetis ke CSV per chunk (memori konstan untuk jumlah baris berapa pun)."""
+    generator = SyntheticEvolutionData(num_species, seed)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    for i, chunk in enumerate(generator.iter_chunks(num_rows, chunk_rows)):
+        chunk.to_csv(path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+    return path
+
+
+if __name__ == '__main__':
+    # Contoh (dari folder backend): python -m benchmarks.synthetic_data /tmp/evolution_1m.csv --rows 1000000
+    parser = argparse.ArgumentParser(description="Membangkitkan Evolution_DataSets.csv sintetis.")
+    parser.add_argument('output', help="Path file CSV keluaran")
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--species', type=int, default=24)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+    write_evolution_csv(args.output, args.rows, args.species, args.seed, args.chunk_rows)
+    print(f"{args.rows} baris sintetis ditulis ke {args.output}")